@@ -26,22 +26,33 @@ import sys              # 시스템 종료 등 사용
 import getpass          # 비밀번호 입력
 import curses           # 터미널 UI 구현
 import subprocess       # 외부 프로세스 실행
-import unicodedata      # 유니코드 문자 폭 계산
+import unicodedata      # 동아시아 문자 폭(east_asian_width) 조회
+from bisect import bisect_right  # 문자 폭 범위표 조회
+try:
+    from wcwidth import wcwidth, wcswidth  # 터미널 문자 폭 계산 (설치되어 있으면 사용)
+except ImportError:
+    wcwidth = wcswidth = None
 import requests         # HTTP 요청 전송
-import xml.etree.ElementTree as ET  # XML 파싱
 import urllib3          # HTTPS 경고 제어
 import re               # 정규 표현식 사용
-import pickle           # 세션 저장/불러오기
+import json             # 세션 저장/불러오기
 import signal           # 시그널 핸들링
-import textwrap         # 텍스트 자동 줄바꿈
 import time             # 시간 관련 함수
 import threading        # ← 추가된 threading 모듈
+import queue            # VM 작업 대기열
+from functools import lru_cache  # 반복 계산 결과 캐싱
+import heapq            # 정렬된 목록 병합
+import operator         # 속성 일괄 조회(attrgetter)
+from collections import deque, Counter, defaultdict  # 최대 길이가 정해진 큐, 개수/그룹 인덱스
+from itertools import islice   # 반복자 부분 추출
+from concurrent.futures import ThreadPoolExecutor, wait, TimeoutError as FutureTimeoutError  # 병렬 API 조회
 from datetime import datetime, timezone  # 날짜/시간 처리
 from ovirtsdk4.types import Host, VmStatus, Ip, IpVersion  # oVirt SDK 타입
 from ovirtsdk4 import Connection, Error  # oVirt SDK 연결 및 오류 처리
 from requests.auth import HTTPBasicAuth  # HTTP 기본 인증
+from requests.adapters import HTTPAdapter  # HTTP 연결 풀 설정
+from urllib3.util.retry import Retry  # HTTP 재시도 정책
 import socket           # 네트워크 연결 확인
-import math             # 수학 관련 함수, 상수 등을 사용
 import ovirtsdk4.types as types  # oVirt SDK 타입 사용
 import locale
 import shlex
@@ -53,20 +64,64 @@ locale.setlocale(locale.LC_ALL, '')
 # HTTPS 경고 메시지 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# REST API 직접 호출용 공용 세션 (연결 풀/Keep-Alive로 매 요청마다 TLS 핸드셰이크 반복 방지)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.verify = False
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                                           max_retries=Retry(total=2, backoff_factor=0.2)))
+
+# oVirt SDK 요청 하나의 최대 대기 시간(초). 엔진이 응답하지 않을 때 무한정 멈추지 않도록 함
+API_TIMEOUT = 30
+
+# IPv4 주소 형식 검사용 정규식 (모듈 로드 시 한 번만 컴파일)
+_IPV4_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+
 # ----- 유틸리티 함수들 -----
 
 def truncate_with_ellipsis(value, max_width):
     """문자열의 길이가 max_width보다 길면 생략 부호(...)를 추가하여 잘라 반환"""
-    value = str(value) if value else "-"
+    if not value:
+        return "-"
+    if type(value) is not str:  # 대부분 이미 문자열이므로 필요할 때만 변환
+        value = str(value)
     if len(value) > max_width:
         return value[:max_width - 2] + ".."
     return value
 
+def _make_truncator(max_width):
+    """
+    열 폭별로 특화된 truncate_with_ellipsis와 동일한 동작의 함수를 반환.
+    표를 그릴 때 셀마다 폭 인자와 전역 함수 조회를 반복하지 않도록 열마다 한 번 생성하여 사용.
+    """
+    cut = max_width - 2
+    def truncate(value):
+        value = "-" if not value else value if type(value) is str else str(value)
+        return value if len(value) <= max_width else value[:cut] + ".."
+    return truncate
+
+NETWORK_SPEED_TTL = 10  # 링크 속도는 거의 바뀌지 않으므로 인터페이스별로 10초간 재사용
+
 def get_network_speed(interface):
     """
-    ethtool을 사용하여 네트워크 인터페이스의 실제 속도를 확인하는 함수.
+    네트워크 인터페이스의 실제 속도를 확인하는 함수 (인터페이스별 TTL 캐시 적용).
     실패 시 "N/A"를 반환.
     """
+    return cached(("network_speed", interface), NETWORK_SPEED_TTL,
+                  lambda: _read_network_speed(interface))
+
+def _read_network_speed(interface):
+    """
+    /sys/class/net/<iface>/speed 를 우선 읽고, 항목이 없을 때만 ethtool을 실행.
+    """
+    try:
+        with open(f"/sys/class/net/{interface}/speed") as f:
+            mbps = int(f.read().strip())
+        return f"{mbps}Mb/s" if mbps > 0 else "N/A"
+    except FileNotFoundError:
+        pass
+    except (ValueError, OSError):
+        # 링크 다운 등으로 속도를 읽을 수 없는 경우
+        return "N/A"
     try:
         result = subprocess.run(['ethtool', interface],
                                 stdout=subprocess.PIPE,
@@ -79,29 +134,78 @@ def get_network_speed(interface):
         print(f"Error getting speed for {interface}: {e}")
     return "N/A"
 
+def _build_wide_bounds(limit=0x40000):
+    """
+    unicodedata에서 2칸을 차지하는 동아시아 문자(F, W) 구간을 모아 [시작, 끝+1, 시작, 끝+1, ...] 형태로 반환.
+    미할당 코드 포인트(Cn)는 제외하며, F/W 문자는 모두 0x40000 미만에 있음.
+    """
+    bounds = []
+    inside = False
+    for cp in range(limit):
+        c = chr(cp)
+        wide = unicodedata.east_asian_width(c) in ("F", "W") and unicodedata.category(c) != "Cn"
+        if wide != inside:
+            bounds.append(cp)
+            inside = wide
+    if inside:
+        bounds.append(limit)
+    return bounds
+
+# 시작 시 한 번만 만들어 두고 bisect로 조회 (결과가 홀수이면 넓은 문자)
+_WIDE_BOUNDS = _build_wide_bounds()
+
+def _is_wide(cp):
+    """코드 포인트가 2칸 폭 구간에 속하는지 확인"""
+    return bisect_right(_WIDE_BOUNDS, cp) & 1 == 1
+
+@lru_cache(maxsize=8192)
+def _char_width(c):
+    """문자 하나의 출력 폭(1 또는 2)을 반환 (문자별 결과 캐싱)"""
+    if wcwidth is not None:
+        width = wcwidth(c)
+        if width >= 0:
+            return width
+    return 2 if _is_wide(ord(c)) else 1
+
+def _text_width(text):
+    """문자열 전체의 출력 폭을 반환 (wcwidth가 있으면 wcswidth 사용, 제어 문자가 있으면 기존 방식)"""
+    # ASCII 문자열은 모든 문자가 1칸이므로 C 수준의 isascii() 확인만으로 폭이 결정됨
+    if text.isascii():
+        return len(text)
+    if wcswidth is not None:
+        width = wcswidth(text)
+        if width >= 0:
+            return width
+    return sum(map(_char_width, text))
+
 def get_display_width(text, max_width):
     """
     문자열의 출력 폭을 계산하여, max_width를 초과하면 잘라서 반환.
     동아시아 문자(F, W)는 2칸으로 계산.
     """
-    display_width = sum(2 if unicodedata.east_asian_width(c) in ('F', 'W') else 1 for c in text)
-    if display_width > max_width:
-        truncated = ""
-        current_width = 0
-        for char in text:
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            if current_width + char_width > max_width - 2:
-                truncated += ".."
-                break
-            truncated += char
-            current_width += char_width
-        return truncated.ljust(max_width)
+    if text.isascii():
+        return text.ljust(max_width) if len(text) <= max_width else text[:max_width - 2] + ".."
+    # 폭 안에 들어가는 경우가 대부분이므로 전체 폭을 먼저 한 번에 확인
+    if wcswidth is not None:
+        display_width = wcswidth(text)
+        if 0 <= display_width <= max_width:
+            return text.ljust(max_width - (display_width - len(text)))
+    # 한 번의 순회로 전체 폭과 잘라낼 위치를 함께 계산 (폭을 넘는 순간 중단)
+    display_width = 0
+    cut_index = None
+    for index, char in enumerate(text):
+        char_width = _char_width(char)
+        if cut_index is None and display_width + char_width > max_width - 2:
+            cut_index = index
+        display_width += char_width
+        if display_width > max_width:
+            return (text[:cut_index] + "..").ljust(max_width)
     return text.ljust(max_width - (display_width - len(text)))
 
 def adjust_column_width(text, width):
     """테이블 열에 맞게 텍스트에 공백을 추가하여 맞춤 처리"""
     text = text if text else "-"
-    text_width = sum(2 if unicodedata.east_asian_width(c) in ('F', 'W') else 1 for c in text)
+    text_width = _text_width(text)
     padding = max(0, width - text_width)
     return text + " " * padding
 
@@ -109,6 +213,49 @@ def ensure_non_empty(value):
     """값이 비어 있으면 '-'를, 그렇지 않으면 원래 값을 반환"""
     return "-" if not value or str(value).strip() == "N/A" else value
 
+def format_cell(value, width):
+    """
+    표 셀 하나를 한 번에 만듦: 빈 값/N/A는 '-'로 대체하고,
+    출력 폭을 계산해 넘치면 '..'로 자르고, 남는 폭은 공백으로 채움.
+    """
+    if not value:
+        return "-".ljust(width)
+    text = value if type(value) is str else str(value)
+    if text.strip() == "N/A":
+        return "-".ljust(width)
+    if text.isascii():
+        return text.ljust(width) if len(text) <= width else text[:width - 2] + ".."
+    used = 0
+    cut_index = cut_used = None
+    for index, char in enumerate(text):
+        char_width = _char_width(char)
+        if cut_index is None and used + char_width > width - 2:
+            cut_index, cut_used = index, used
+        used += char_width
+        if used > width:
+            return text[:cut_index] + ".." + " " * (width - 2 - cut_used)
+    return text + " " * (width - used)
+
+@lru_cache(maxsize=64)
+def _borders(col_widths):
+    """
+    열 폭 튜플에 대한 표 테두리(상단선, 구분선, 하단선)를 생성하여 캐싱.
+    """
+    return ("┌" + "┬".join("─" * w for w in col_widths) + "┐",
+            "├" + "┼".join("─" * w for w in col_widths) + "┤",
+            "└" + "┴".join("─" * w for w in col_widths) + "┘")
+
+@lru_cache(maxsize=64)
+def _table_chrome(headers, col_widths):
+    """
+    draw_table에서 쓰는 표의 고정 부분(상단선, 헤더 행, 구분선, 빈 행, 하단선)을 생성하여 캐싱.
+    headers/col_widths는 캐시 키로 쓰기 위해 튜플로 전달.
+    """
+    header_line, divider_line, footer_line = _borders(col_widths)
+    header_text = "│" + "│".join(get_display_width(h, w) for h, w in zip(headers, col_widths)) + "│"
+    empty_row = "│" + "│".join(get_display_width("-", w) for w in col_widths) + "│"
+    return header_line, header_text, divider_line, empty_row, footer_line
+
 def draw_table(stdscr, start_y, headers, col_widths, data, row_func, current_row=-1):
     """
     curses 화면에 테이블을 그리는 함수.
@@ -118,27 +265,20 @@ def draw_table(stdscr, start_y, headers, col_widths, data, row_func, current_row
       - row_func: 각 데이터 항목을 리스트 형태로 반환하는 함수
       - current_row: 현재 선택된 행(강조 처리)
     """
-    header_line = "┌" + "┬".join("─" * w for w in col_widths) + "┐"
-    divider_line = "├" + "┼".join("─" * w for w in col_widths) + "┤"
-    footer_line = "└" + "┴".join("─" * w for w in col_widths) + "┘"
-    stdscr.addstr(start_y, 1, header_line)
-    stdscr.addstr(start_y + 1, 1, "│" + "│".join(get_display_width(h, w) for h, w in zip(headers, col_widths)) + "│")
-    stdscr.addstr(start_y + 2, 1, divider_line)
+    header_line, header_text, divider_line, empty_row, footer_line = _table_chrome(tuple(headers), tuple(col_widths))
+    # 표 전체를 줄 목록으로 먼저 조립한 뒤, 화면 폭을 넘지 않도록 addnstr로 출력
+    lines = [header_line, header_text, divider_line]
     if not data:
-        empty_row = "│" + "│".join(get_display_width("-", w) for w in col_widths) + "│"
-        stdscr.addstr(start_y + 3, 1, empty_row)
+        lines.append(empty_row)
     else:
-        for idx, item in enumerate(data):
-            row_y = start_y + 3 + idx
-            row_data = [ensure_non_empty(d) for d in row_func(item)]
-            row_text = "│" + "│".join(get_display_width(d, w) for d, w in zip(row_data, col_widths)) + "│"
-            if idx == current_row:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(row_y, 1, row_text)
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(row_y, 1, row_text)
-    stdscr.addstr(start_y + 3 + max(len(data), 1), 1, footer_line)
+        for item in data:
+            lines.append("│" + "│".join(map(format_cell, row_func(item), col_widths)) + "│")
+    lines.append(footer_line)
+    limit = max(1, stdscr.getmaxyx()[1] - 2)
+    highlight_idx = current_row + 3 if data and current_row >= 0 else -1
+    for i, line in enumerate(lines):
+        attr = curses.color_pair(1) if i == highlight_idx else curses.A_NORMAL
+        stdscr.addnstr(start_y + i, 1, line, limit, attr)
 
 def check_ip_reachable(ip, port=443, timeout=5):
     """
@@ -152,10 +292,123 @@ def check_ip_reachable(ip, port=443, timeout=5):
     except Exception:
         return False
 
+DNS_TTL = 300  # 호스트 이름 → IP 조회 결과 캐시 시간(초)
+
+def resolve_host_ip(address):
+    """
+    호스트 주소를 IP로 변환하여 반환 (실패하면 원래 주소).
+    결과는 DNS_TTL 동안 캐시하여 화면을 다시 그릴 때마다 DNS를 조회하지 않음.
+    """
+    def lookup():
+        try:
+            return socket.gethostbyname(address)
+        except Exception:
+            return address
+    return cached(("dns", address), DNS_TTL, lookup)
+
+# 서비스 목록 조회 결과 캐시: { key: (조회 시각, 값) }
+_svc_cache = {}
+
+def cached(key, ttl, fn):
+    """
+    key에 해당하는 캐시 값이 ttl(초) 이내이면 재사용하고, 아니면 fn()을 호출하여 갱신.
+    """
+    now = time.monotonic()
+    entry = _svc_cache.get(key)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+    value = fn()
+    _svc_cache[key] = (now, value)
+    return value
+
+def follow_link_cached(connection, link, ttl=30):
+    """
+    connection.follow_link 결과를 링크 href 기준으로 ttl(초) 동안 재사용.
+    href가 없는 링크는 캐시하지 않고 바로 조회.
+    """
+    href = getattr(link, "href", None)
+    if not href:
+        return connection.follow_link(link)
+    return cached(("follow_link", href), ttl, lambda: connection.follow_link(link))
+
+def _build_chrome(widths, headers, prefix=""):
+    """
+    열 폭과 헤더로 표의 고정 부분(상단선, 헤더 행, 구분선, 하단선)을 한 번에 만들어 반환.
+    """
+    top, sep, bottom = _borders(tuple(widths))
+    header = prefix + "│" + "│".join(f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(headers, widths)) + "│"
+    return prefix + top, header, prefix + sep, prefix + bottom
+
+def _build_row_fmt(widths, prefix=""):
+    """열 폭에 맞춘 행 포맷 문자열을 반환. (값은 미리 잘라서 format에 전달)"""
+    return prefix + "│" + "│".join(f"{{:<{w}}}" for w in widths) + "│"
+
+def draw_lines(stdscr, y, x, lines):
+    """미리 조립한 줄 목록을 y부터 차례로 출력하고 다음 줄의 y 위치를 반환"""
+    for i, line in enumerate(lines):
+        stdscr.addstr(y + i, x, line)
+    return y + len(lines)
+
+def watch_events(connection, state, stop_event, interval=5.0):
+    """
+    별도 스레드에서 마지막으로 확인한 이벤트 이후(from=<last_id>)의 이벤트만 주기적으로 조회.
+    이벤트에 포함된 호스트/VM id를 state에 모으고 state['changed']를 설정하여
+    화면 쪽에서 해당 항목의 캐시만 무효화하도록 함.
+    """
+    events_service = connection.system_service().events_service()
+    last_id = 0
+    try:
+        latest = events_service.list(max=1)
+        if latest:
+            last_id = int(latest[0].id)
+    except Exception:
+        pass
+    while not stop_event.wait(interval):
+        try:
+            new_events = events_service.list(from_=last_id)
+        except Exception:
+            continue
+        if not new_events:
+            continue
+        with state["lock"]:
+            for ev in new_events:
+                try:
+                    last_id = max(last_id, int(ev.id))
+                except (TypeError, ValueError):
+                    pass
+                if ev.host and ev.host.id:
+                    state["hosts"].add(ev.host.id)
+                if ev.vm and ev.vm.id:
+                    state["vms"].add(ev.vm.id)
+        state["changed"].set()
+
+def start_event_watcher(connection, interval=5.0):
+    """
+    watch_events를 데몬 스레드로 시작하고 (state, stop_event)를 반환.
+    """
+    state = {"lock": threading.Lock(), "hosts": set(), "vms": set(), "changed": threading.Event()}
+    stop_event = threading.Event()
+    watcher = threading.Thread(target=watch_events, args=(connection, state, stop_event, interval), daemon=True)
+    watcher.start()
+    return state, stop_event
+
+def drain_event_watcher(state):
+    """
+    감시 스레드가 모은 변경 호스트/VM id를 꺼내고 상태를 초기화. 변경이 없으면 None 반환.
+    """
+    if not state["changed"].is_set():
+        return None
+    with state["lock"]:
+        hosts, vms = state["hosts"], state["vms"]
+        state["hosts"], state["vms"] = set(), set()
+        state["changed"].clear()
+    return hosts, vms
+
 # =============================================================================
 # Section 2: Session and Connection Management Functions
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_fqdn_from_config():
     """
     /etc/ovirt-hosted-engine/hosted-engine.conf 파일에서
@@ -165,9 +418,9 @@ def get_fqdn_from_config():
     try:
         with open(config_path, "r") as file:
             for line in file:
-                match = re.match(r"^fqdn=(.+)$", line.strip())
-                if match:
-                    return match.group(1)
+                line = line.strip()
+                if line.startswith("fqdn=") and len(line) > 5:
+                    return line[5:]
     except FileNotFoundError:
         print(f"Error: {config_path} not found.")
         sys.exit(1)
@@ -176,30 +429,36 @@ def get_fqdn_from_config():
         sys.exit(1)
     return None
 
+@lru_cache(maxsize=1)
+def _hosts_map(hosts_path="/etc/hosts"):
+    """
+    /etc/hosts 파일을 한 번만 읽어 {호스트 이름: IP} 딕셔너리로 반환.
+    같은 이름이 여러 번 나오면 파일에서 처음 나온 항목을 사용.
+    """
+    hosts = {}
+    with open(hosts_path, "r") as file:
+        for line in file:
+            parts = line.split("#", 1)[0].split()
+            if len(parts) >= 2:
+                for name in parts[1:]:
+                    hosts.setdefault(name, parts[0])
+    return hosts
+
 def get_ip_from_hosts(fqdn):
     """
     /etc/hosts 파일에서 fqdn과 매칭되는 IP 주소를 찾아 반환.
     """
-    hosts_path = "/etc/hosts"
     try:
-        with open(hosts_path, "r") as file:
-            for line in file:
-                line = line.split("#")[0].strip()
-                if fqdn in line:
-                    parts = line.split()
-                    if len(parts) >= 2 and fqdn in parts[1:]:
-                        return parts[0]
-    except FileNotFoundError:
-        print("You must run deploy first")
-        sys.exit(1)
+        ip = _hosts_map().get(fqdn)
     except Exception:
-        print("You must run deploy first")
-        sys.exit(1)
+        ip = None
+    if ip:
+        return ip
     print("You must run deploy first")
     sys.exit(1)
 
 TERMINAL_SESSION_ID = os.environ.get("SSH_CONNECTION", "local_session").replace(" ", "_")
-SESSION_FILE = f"/tmp/ovirt_session_{TERMINAL_SESSION_ID}.pkl"
+SESSION_FILE = f"/tmp/ovirt_session_{TERMINAL_SESSION_ID}.json"
 session_data = None
 delete_session_on_exit = False
 
@@ -207,20 +466,27 @@ def load_session():
     global session_data
     if session_data:
         return session_data
-    if os.path.exists(SESSION_FILE) and os.path.getsize(SESSION_FILE) > 0:
-        try:
-            with open(SESSION_FILE, "rb") as file:
-                session_data = pickle.load(file)
-                return session_data
-        except Exception:
+    # 존재 여부와 크기를 stat 한 번으로 확인
+    try:
+        if os.stat(SESSION_FILE).st_size == 0:
             return None
-    return None
+    except OSError:
+        return None
+    try:
+        with open(SESSION_FILE, "r") as file:
+            session_data = json.load(file)
+            return session_data
+    except Exception:
+        return None
 
 def save_session(username, password, url):
     global session_data
     session_data = {"username": username, "password": password, "url": url}
-    with open(SESSION_FILE, "wb") as file:
-        pickle.dump(session_data, file)
+    # 비밀번호가 포함되므로 소유자만 읽고 쓸 수 있도록 0o600으로 생성
+    fd = os.open(SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)  # 이미 존재하던 파일의 권한도 맞춤
+    with os.fdopen(fd, "w") as file:
+        json.dump(session_data, file)
 
 def clear_session():
     global session_data
@@ -230,13 +496,13 @@ def clear_session():
             os.remove(SESSION_FILE)
 
 def signal_handler(sig, frame):
+    # 시그널로 종료(예: SSH 연결 끊김)될 때는 세션 파일을 남겨 재접속 시 재사용
     global delete_session_on_exit
     delete_session_on_exit = False
     sys.exit(0)
 
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGHUP, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+for _sig in (signal.SIGINT, signal.SIGHUP, signal.SIGTERM):
+    signal.signal(_sig, signal_handler)
 
 # =============================================================================
 # Section 3: Main Menu Function
@@ -262,7 +528,9 @@ def main_menu(stdscr, connection):
     curses.start_color()
     curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_CYAN)
     curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLACK)
-    stdscr.timeout(50)
+    # 메뉴는 주기적으로 갱신할 내용이 없으므로 키 입력(또는 KEY_RESIZE)이 올 때까지 블로킹 대기
+    stdscr.nodelay(False)
+    stdscr.timeout(-1)
 
     menu = [
         "Virtual Machines",
@@ -277,32 +545,40 @@ def main_menu(stdscr, connection):
         "Events"
     ]
     current_row = 0
+    # 메뉴 문자열은 고정이므로 선택/비선택 형태를 미리 만들어 둠
+    selected_labels = [f"> {row} " for row in menu]
+    normal_labels = [f"  {row} " for row in menu]
 
+    # 키 입력이나 화면 크기 변경이 있을 때만 다시 그림
+    dirty = True
+    prev_size = None
     while True:
-        stdscr.erase()
-        height, width = stdscr.getmaxyx()
-        if height < 20 or width < 50:
-            stdscr.addstr(0, 0, "Resize the terminal to at least 50x20.", curses.color_pair(2))
+        size = stdscr.getmaxyx()
+        height, width = size
+        too_small = height < 20 or width < 50
+        if dirty or size != prev_size:
+            stdscr.erase()
+            if too_small:
+                stdscr.addstr(0, 0, "Resize the terminal to at least 50x20.", curses.color_pair(2))
+            else:
+                stdscr.addstr(1, 1, "RutilVM Assistor", curses.A_BOLD)
+                for idx in range(len(menu)):
+                    if idx == current_row:
+                        stdscr.addstr(4 + idx, 1, selected_labels[idx], curses.color_pair(1))
+                    else:
+                        stdscr.addstr(4 + idx, 1, normal_labels[idx], curses.color_pair(2))
+                stdscr.addstr(height - 2, 1, "▲/▼=Navigate | ENTER=Select | Q=Quit", curses.color_pair(2))
             stdscr.noutrefresh()
             curses.doupdate()
-            continue
-
-        stdscr.addstr(1, 1, "RutilVM Assistor", curses.A_BOLD)
-        for idx, row in enumerate(menu):
-            y, x = 4 + idx, 1
-            if idx == current_row:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, x, f"> {row} ")
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.attron(curses.color_pair(2))
-                stdscr.addstr(y, x, f"  {row} ")
-                stdscr.attroff(curses.color_pair(2))
-        stdscr.addstr(height - 2, 1, "▲/▼=Navigate | ENTER=Select | Q=Quit", curses.color_pair(2))
-        stdscr.noutrefresh()
-        curses.doupdate()
+            prev_size = size
+            dirty = False
 
         key = stdscr.getch()
+        if key == -1:
+            continue
+        dirty = True
+        if too_small or key == curses.KEY_RESIZE:
+            continue
         if key == curses.KEY_UP:
             current_row = (current_row - 1) % len(menu)
         elif key == curses.KEY_DOWN:
@@ -333,11 +609,289 @@ def main_menu(stdscr, connection):
                 show_certificates(stdscr, connection)
             elif menu[current_row] == "Events":
                 show_events(stdscr, connection)
+            # 하위 화면에서 바뀐 입력 대기 설정(nodelay/timeout)을 메뉴 기준으로 복원
+            stdscr.nodelay(False)
+            stdscr.timeout(-1)
 
 # =============================================================================
 # Section 4: Virtual Machines Section
 # =============================================================================
 
+HOST_USAGE_NA = {'cpu': "N/A", 'memory': "N/A", 'data_center': "N/A", 'cluster': "N/A"}
+CLUSTER_DC_TTL = 300  # 클러스터/데이터 센터 이름은 거의 바뀌지 않으므로 5분간 재사용
+
+# VM 목록 / 호스트 사용량 표의 고정 부분 (열 폭이 바뀌지 않으므로 한 번만 생성)
+VM_LIST_HEADERS = ["VM Name", "Status", "Host Name", "Uptime"]
+VM_LIST_WIDTHS = [31, 31, 37, 18]
+VM_LIST_TOP, VM_LIST_HEADER, VM_LIST_SEP, VM_LIST_BOTTOM = _build_chrome(VM_LIST_WIDTHS, VM_LIST_HEADERS)
+VM_LIST_ROW_FMT = _build_row_fmt(VM_LIST_WIDTHS)
+VM_LIST_TRUNCS = [_make_truncator(w) for w in VM_LIST_WIDTHS]
+
+HOST_USAGE_HEADERS = ["Host Name", "CPU Usage", "Memory Usage", "Data Center", "Cluster"]
+HOST_USAGE_WIDTHS = [31, 13, 17, 28, 27]
+HOST_USAGE_TOP, HOST_USAGE_HEADER, HOST_USAGE_SEP, HOST_USAGE_BOTTOM = _build_chrome(HOST_USAGE_WIDTHS, HOST_USAGE_HEADERS)
+HOST_USAGE_ROW_FMT = _build_row_fmt(HOST_USAGE_WIDTHS)
+HOST_USAGE_TRUNCS = [_make_truncator(w) for w in HOST_USAGE_WIDTHS]
+
+def cluster_dc_names(connection, clusters_service):
+    """
+    {클러스터 id: (클러스터 이름, 데이터 센터 이름)} 딕셔너리를 목록 조회 두 번으로 만들어 반환 (TTL 캐시).
+    """
+    def build():
+        data_centers = {dc.id: dc.name for dc in connection.system_service().data_centers_service().list()}
+        return {
+            cluster.id: (cluster.name or 'N/A',
+                         data_centers.get(cluster.data_center.id, 'N/A') if cluster.data_center else 'N/A')
+            for cluster in clusters_service.list()
+        }
+    return cached("cluster_dc_names", CLUSTER_DC_TTL, build)
+
+def host_usage_from_stats(statistics, cluster_name, data_center_name):
+    """
+    호스트 통계 목록과 클러스터/데이터 센터 이름으로 사용량 정보 딕셔너리를 만듦.
+    """
+    # 통계 이름 → 값 딕셔너리를 한 번만 만들어 이후에는 키로 바로 조회
+    stats_map = {s.name.lower(): s.values[0].datum for s in statistics if s.values}
+    # CPU 사용률: "cpu.utilization" 항목을 우선 사용, 없으면 "cpu.load.avg.*" 항목 사용
+    cpu_usage = stats_map.get('cpu.utilization')
+    if cpu_usage is None:
+        cpu_usage = next((v for name, v in stats_map.items() if name.startswith('cpu.load.avg')), "N/A")
+    memory_used = stats_map.get('memory.used', 0)
+    memory_total = stats_map.get('memory.total', 0)
+    # 메모리 사용률 계산 (퍼센트)
+    memory_usage = (memory_used / memory_total) * 100 if memory_total > 0 else "N/A"
+    return {
+        'cpu': round(cpu_usage, 2) if isinstance(cpu_usage, (float, int)) else "N/A",
+        'memory': round(memory_usage, 2) if isinstance(memory_usage, (float, int)) else "N/A",
+        'data_center': data_center_name if data_center_name else 'N/A',
+        'cluster': cluster_name if cluster_name else 'N/A'
+    }
+
+def host_usage_from_followed(host):
+    """
+    hosts_service.list(follow="statistics,cluster.data_center")로 받은 호스트에서
+    추가 API 호출 없이 사용량 정보를 만듦.
+    """
+    cluster = host.cluster
+    data_center = cluster.data_center if cluster else None
+    return host_usage_from_stats(host.statistics or [],
+                                 cluster.name if cluster else None,
+                                 data_center.name if data_center else None)
+
+def fetch_host_usage(connection, hosts_service, clusters_service, host, cluster_names=None):
+    """
+    호스트 하나의 CPU/메모리 사용률과 소속 클러스터, 데이터 센터 이름을 조회. 실패 시 N/A 값을 반환.
+    cluster_names(cluster_dc_names 결과)에 없는 클러스터만 개별 API로 조회.
+    """
+    try:
+        host_service = hosts_service.host_service(host.id)
+        statistics = host_service.statistics_service().list()
+        cluster_name = 'N/A'
+        data_center_name = 'N/A'
+        entry = cluster_names.get(host.cluster.id) if cluster_names and host.cluster else None
+        if entry:
+            cluster_name, data_center_name = entry
+        else:
+            try:
+                # 해당 호스트의 클러스터 정보를 가져옴.
+                cluster = clusters_service.cluster_service(host.cluster.id).get()
+                cluster_name = cluster.name if cluster and hasattr(cluster, 'name') else 'N/A'
+                data_center_id = cluster.data_center.id if cluster and hasattr(cluster, 'data_center') else None
+                if data_center_id:
+                    data_center = connection.system_service().data_centers_service().data_center_service(data_center_id).get()
+                    data_center_name = data_center.name if data_center and hasattr(data_center, 'name') else 'N/A'
+            except Exception:
+                cluster_name = 'N/A'
+                data_center_name = 'N/A'
+        return host_usage_from_stats(statistics, cluster_name, data_center_name)
+    except Exception:
+        return HOST_USAGE_NA
+
+def collect_host_usage(connection, hosts_service, clusters_service, hosts, executor=None, timeout=3.0):
+    """
+    각 호스트의 사용량을 병렬로 조회하여 {호스트 이름: 사용량 정보} 딕셔너리로 반환.
+    timeout(초) 안에 응답하지 않은 호스트는 N/A로 표시하여 느린 호스트 하나가 전체를 지연시키지 않음.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(hosts)))) as own_executor:
+            return collect_host_usage(connection, hosts_service, clusters_service, hosts, own_executor, timeout)
+    try:
+        cluster_names = cluster_dc_names(connection, clusters_service)
+    except Exception:
+        cluster_names = None
+    futures = {host.name: executor.submit(fetch_host_usage, connection, hosts_service, clusters_service,
+                                          host, cluster_names)
+               for host in hosts}
+    wait(futures.values(), timeout=timeout)
+    return {name: future.result() if future.done() else HOST_USAGE_NA
+            for name, future in futures.items()}
+
+def vm_list_signature(vms):
+    """VM 목록에서 화면에 표시되는 값만 모은 비교용 튜플 (변경 여부 판단용)"""
+    return tuple((vm.id, vm.name, vm.status, vm.host.id if vm.host else None, vm.start_time) for vm in vms)
+
+VM_POLL_MAX_INTERVAL = 10.0  # 사용자 입력이 없을 때 늘어나는 폴링 간격의 상한(초)
+VM_POLL_CALL_TIMEOUT = 10.0  # 폴러의 API 호출 하나를 기다리는 최대 시간(초). 넘기면 이전 스냅샷 유지
+
+def poll_vm_screen(connection, snapshot, stop_event, wake_event, interval=1.0, full_refresh=30.0):
+    """
+    VM 화면용 백그라운드 폴러. VM 목록과 호스트 사용량을 조회하여 snapshot에 기록하고
+    snapshot['version']을 올림. 평상시에는 이벤트(from=<last_id>)에 등장한 VM만 다시 조회하고,
+    full_refresh 초마다 또는 wake_event가 설정되면(작업 직후) 전체 VM 목록을 다시 가져옴.
+    화면 쪽이 snapshot['active_at']을 갱신하지 않는 동안에는 5초마다 폴링 간격을 두 배로 늘림
+    (최대 VM_POLL_MAX_INTERVAL).
+    """
+    system_service = connection.system_service()
+    vms_service = system_service.vms_service()
+    hosts_service = system_service.hosts_service()
+    clusters_service = system_service.clusters_service()
+    watch_state, watch_stop = start_event_watcher(connection)
+    executor = ThreadPoolExecutor(max_workers=16)  # 호스트별 통계 조회용 (폴러 수명 동안 재사용)
+    follow_stats = True  # follow로 통계를 한 번에 받을 수 없는 엔진이면 호스트별 조회로 전환
+    last_full = time.monotonic()
+    # 직전에 게시한 값의 요약. 바뀐 것이 없으면 스냅샷 버전을 올리지 않아 화면이 다시 그리지 않음
+    with snapshot["lock"]:
+        last_vm_sig = vm_list_signature(snapshot["vms"])
+        last_host_sig = tuple((host.id, host.name) for host in snapshot["hosts"])
+
+    def call(fn, *args, **kwargs):
+        """API 호출을 풀에서 실행하고 VM_POLL_CALL_TIMEOUT 안에 끝나지 않으면 FutureTimeoutError 발생"""
+        return executor.submit(fn, *args, **kwargs).result(timeout=VM_POLL_CALL_TIMEOUT)
+
+    try:
+        while not stop_event.is_set():
+            forced = wake_event.is_set()
+            wake_event.clear()
+            now = time.monotonic()
+            changed = drain_event_watcher(watch_state)
+            vms = None
+            try:
+                if forced or now - last_full >= full_refresh:
+                    vms = call(vms_service.list)
+                    last_full = now
+                elif changed and changed[1]:
+                    with snapshot["lock"]:
+                        vms = list(snapshot["vms"])
+                    index = {vm.id: i for i, vm in enumerate(vms)}
+                    for vm_id in changed[1]:
+                        if vm_id not in index:
+                            # 새로 생긴 VM이면 전체 목록을 다시 가져옴
+                            raise KeyError(vm_id)
+                        vms[index[vm_id]] = call(vms_service.vm_service(vm_id).get)
+            except FutureTimeoutError:
+                # 엔진 응답이 늦으면 이번 주기는 이전 VM 목록을 그대로 사용
+                vms = None
+            except Exception:
+                # 삭제/추가된 VM이 있거나 개별 조회에 실패하면 전체 목록으로 대체
+                try:
+                    vms = call(vms_service.list)
+                    last_full = now
+                except Exception:
+                    vms = None
+            hosts = usage = None
+            if follow_stats:
+                try:
+                    # 호스트 목록, 통계, 클러스터/데이터 센터를 한 번의 요청으로 가져옴
+                    hosts = call(hosts_service.list, follow="statistics,cluster.data_center")
+                    usage = {host.name: host_usage_from_followed(host) for host in hosts}
+                except FutureTimeoutError:
+                    pass
+                except Exception:
+                    follow_stats = False
+                    hosts = usage = None
+            if hosts is None and not follow_stats:
+                try:
+                    hosts = call(hosts_service.list)
+                    usage = collect_host_usage(connection, hosts_service, clusters_service, hosts, executor)
+                except Exception:
+                    hosts = usage = None
+            # 작업 직후(forced)에는 진행 중 표시를 정리할 수 있도록 변경이 없어도 버전을 올림
+            updated = forced
+            with snapshot["lock"]:
+                if vms is not None:
+                    vm_sig = vm_list_signature(vms)
+                    if vm_sig != last_vm_sig:
+                        snapshot["vms"] = vms
+                        last_vm_sig = vm_sig
+                        updated = True
+                if hosts is not None:
+                    host_sig = tuple((host.id, host.name) for host in hosts)
+                    if host_sig != last_host_sig:
+                        snapshot["hosts"] = hosts
+                        last_host_sig = host_sig
+                        updated = True
+                    if usage != snapshot["usage"]:
+                        snapshot["usage"] = usage
+                        updated = True
+                if updated:
+                    snapshot["version"] += 1
+            idle = time.monotonic() - snapshot["active_at"]
+            wake_event.wait(min(VM_POLL_MAX_INTERVAL, interval * 2 ** min(4, int(idle // 5))))
+    finally:
+        watch_stop.set()
+        executor.shutdown(wait=False)
+
+# 작업 대기열에 넣은 VM 옆에 표시할 상태 문구
+VM_ACTION_LABELS = {"start": "starting...", "resume": "starting...", "stop": "stopping...",
+                    "force_stop": "stopping...", "restart": "restarting..."}
+# 작업이 끝난 뒤에도 이 상태인 동안은 진행 중 표시를 유지
+VM_TRANSIENT_STATUSES = frozenset(("wait_for_launch", "powering_up", "powering_down", "reboot_in_progress"))
+# Q로 종료할 때 대기열에 남은 작업이 끝나기를 기다리는 최대 시간(초)
+VM_ACTION_EXIT_TIMEOUT = 30
+
+def perform_vm_action(vms_service, vm, action):
+    """
+    VM 하나에 start/resume/stop/force_stop/restart 동작을 수행. 실패 시 예외를 그대로 전달.
+    """
+    vm_service = vms_service.vm_service(vm.id)
+    status = vm.status.value if vm.status else None
+    if action == "start":
+        if status == "down":
+            vm_service.start()
+    elif action == "resume":
+        # 일시 중지(suspended)된 VM은 start로 재개하고, 실패하면 wake_up 시도
+        try:
+            vm_service.start()
+            time.sleep(1)
+        except Exception:
+            try:
+                vm_service.wake_up()
+            except Exception:
+                pass
+    elif action == "stop":
+        if status in ("up", "powering_up"):
+            vm_service.stop()
+    elif action == "force_stop":
+        try:
+            vm_service.shutdown(force=True)
+            time.sleep(1)
+        except Exception:
+            pass
+        vm_service.stop(force=True)
+    elif action == "restart":
+        if status == "up":
+            vm_service.reboot()
+
+def run_vm_actions(vms_service, action_queue, queued_ids, errors, wake_event):
+    """
+    작업 대기열에서 (vm, action)을 꺼내 차례로 수행하는 작업 스레드. None을 받으면 종료.
+    실패 내용은 errors에 (제목, 메시지)로 쌓아 화면 쪽에서 팝업으로 표시하도록 함.
+    """
+    while True:
+        item = action_queue.get()
+        if item is None:
+            break
+        vm, action = item
+        verb = "stop" if action == "force_stop" else "start" if action == "resume" else action
+        try:
+            perform_vm_action(vms_service, vm, action)
+        except Exception as e:
+            errors.append((f"Failed to {verb} VM", f"Failed to {verb} VM '{vm.name}':\n{str(e)}"))
+        finally:
+            queued_ids.discard(vm.id)
+            # 상태 표시가 빨리 갱신되도록 폴러를 즉시 깨움
+            wake_event.set()
+
 def show_virtual_machines(stdscr, connection):
     """
     Virtual Machines 목록을 표시하고, 선택된 VM에 대해 시작/중지/재시작, 마이그레이션 및 상세 정보를 제공.
@@ -345,20 +899,10 @@ def show_virtual_machines(stdscr, connection):
     # 터미널 화면의 현재 크기(행, 열)를 가져옴.
     height, width = stdscr.getmaxyx()
     
-    # VM 목록 테이블의 헤더와 각 열의 너비를 정의.
-    header = ["VM Name", "Status", "Host Name", "Uptime"]
-    column_widths = [31, 31, 37, 18]
-    
-    # 테이블의 상단, 중간, 하단 선 생성 (Unicode box drawing 문자 사용)
-    header_line = "┌" + "┬".join("─" * w for w in column_widths) + "┐"
-    divider_line = "├" + "┼".join("─" * w for w in column_widths) + "┤"
-    footer_line = "└" + "┴".join("─" * w for w in column_widths) + "┘"
-    
     # oVirt API를 통한 VM, 호스트, 클러스터 데이터를 불러옴.
     try:
         vms_service = connection.system_service().vms_service()
         hosts_service = connection.system_service().hosts_service()
-        clusters_service = connection.system_service().clusters_service()
         # 모든 호스트 정보를 리스트로 가져옴.
         hosts = hosts_service.list()
         # 호스트 id를 키로, 호스트 이름을 값으로 하는 딕셔너리 생성
@@ -377,196 +921,236 @@ def show_virtual_machines(stdscr, connection):
     # 전체 VM 개수를 기준으로 총 페이지 수를 계산.
     total_pages = (len(vms) + rows_per_page - 1) // rows_per_page
     current_page = 0  # 현재 표시 중인 페이지 번호
-    selected_vms = set()         # 사용자가 선택한 VM의 인덱스를 저장하는 집합
-    pending_start_vms = set()    # 시작 명령 후 상태가 변경되는 중인 VM 인덱스를 저장하는 집합
+    # 목록이 갱신되면 순서/개수가 바뀔 수 있으므로 인덱스 대신 VM id로 추적
+    selected_vms = set()         # 사용자가 선택한 VM의 id를 저장하는 집합
+    pending_vms = {}             # 작업을 요청한 VM id → 진행 중 표시 문구 (예: "starting...")
     current_row = 0              # 현재 페이지 내에서 선택된(강조된) 행의 인덱스
+    uptime_cache = {}            # VM id → (start_time, 경과 분, 업타임 문자열)
     
-    # VM과 호스트의 상태를 주기적으로 폴링하는 간격(초)
-    vm_poll_interval = 1.0
-    host_poll_interval = 1.0
-    last_vm_poll = time.time()   # 마지막 VM 상태 폴링 시각
-    last_host_poll = 0           # 마지막 호스트 상태 폴링 시각
     cached_hosts = hosts       # 호스트 정보를 캐싱 (업데이트 시 사용)
     cached_usage = {}          # 호스트 리소스 사용량 정보를 캐싱 (CPU, 메모리 등)
+
+    # VM/호스트 상태 조회는 백그라운드 스레드가 담당하고, 화면 루프는 스냅샷만 읽어서 그림
+    snapshot = {"lock": threading.Lock(), "vms": vms, "hosts": hosts, "usage": {}, "version": 0,
+                "active_at": time.monotonic()}
+    seen_version = 0
+    poll_stop = threading.Event()
+    poll_wake = threading.Event()   # 작업 직후 즉시 전체 목록을 다시 조회하도록 폴러를 깨움
+    threading.Thread(target=poll_vm_screen, args=(connection, snapshot, poll_stop, poll_wake),
+                     daemon=True).start()
+
+    # start/stop/restart 요청은 작업 스레드가 처리하여 키 입력 처리가 API 호출을 기다리지 않도록 함
+    action_queue = queue.Queue()
+    queued_ids = set()              # 아직 작업 스레드가 처리하지 않은 VM id
+    action_errors = deque()         # 작업 스레드에서 발생한 오류 (화면 스레드에서 팝업으로 표시)
+    action_worker = threading.Thread(target=run_vm_actions,
+                                     args=(vms_service, action_queue, queued_ids, action_errors, poll_wake),
+                                     daemon=True)
+    action_worker.start()
+    quit_requested = False
+
+    def enqueue_action(vm, action):
+        queued_ids.add(vm.id)
+        pending_vms[vm.id] = VM_ACTION_LABELS[action]
+        action_queue.put((vm, action))
     
-    # 키 입력 대기 시간을 50ms로 설정.
-    stdscr.timeout(50)
+    # 키 입력 대기 시간을 200ms로 설정. (다시 그릴 내용이 없으면 입력 대기 후 새 스냅샷만 확인)
+    stdscr.timeout(200)
+    # 커서 위치를 매번 옮기지 않도록 설정 (커서는 숨겨져 있음)
+    stdscr.leaveok(True)
+    stdscr.idlok(False)
+    vm_win = host_win = None     # VM 목록 / 호스트 사용량 표를 그리는 하위 창 (배치가 바뀔 때 다시 생성)
+    # 표의 줄 수나 화면 크기가 바뀔 때만 화면을 지우고, 그 외에는 같은 자리에 덮어씀
+    prev_layout = None
+    # 새 스냅샷, 키 입력, 업타임(분) 변경이 있을 때만 화면을 다시 그림
+    dirty = True
+    drawn_minute = None
+    page_rows = []               # 마지막으로 그린 VM 행 문자열 (선택 행 이동 시 두 줄만 다시 그리기 위함)
 
     # 메인 이벤트 루프: 사용자의 입력에 따라 화면을 업데이트하고 동작을 수행.
     while True:
-        now = time.time()
-        # 주기적으로 VM 상태를 업데이트.
-        if now - last_vm_poll >= vm_poll_interval:
+        # 폴러가 새 스냅샷을 만들었으면 VM/호스트 정보를 갱신.
+        if snapshot["version"] != seen_version:
+            with snapshot["lock"]:
+                new_vms = snapshot["vms"]
+                cached_hosts = snapshot["hosts"]
+                cached_usage = snapshot["usage"]
+                seen_version = snapshot["version"]
+            dirty = True
+            hosts_map = {host.id: host.name for host in cached_hosts}
             try:
-                new_vms = vms_service.list()  # 최신 VM 목록을 가져옴.
-                # pending_start_vms에 있는 각 VM에 대해 상태를 확인하고, 시작 중이 아니면 pending 상태에서 제거.
-                for vm_index in list(pending_start_vms):
-                    current_status = new_vms[vm_index].status.value if new_vms[vm_index].status else "N/A"
-                    if current_status not in ["wait_for_launch", "powering_up"]:
-                        pending_start_vms.remove(vm_index)
+                # 작업이 끝났고 VM이 전이 상태를 벗어났으면 진행 중 표시를 제거.
+                if pending_vms:
+                    vms_by_id = {vm.id: vm for vm in new_vms}
+                    for vm_id in list(pending_vms):
+                        if vm_id in queued_ids:
+                            continue
+                        new_vm = vms_by_id.get(vm_id)
+                        current_status = new_vm.status.value if new_vm and new_vm.status else "N/A"
+                        if current_status not in VM_TRANSIENT_STATUSES:
+                            del pending_vms[vm_id]
                 vms = new_vms  # 전체 VM 목록을 최신 상태로 업데이트
+                total_pages = (len(vms) + rows_per_page - 1) // rows_per_page
+                # VM이 삭제되어 목록이 줄었으면 현재 페이지/선택 행을 범위 안으로 조정
+                current_page = min(current_page, max(0, total_pages - 1))
+                page_len = min(rows_per_page, len(vms) - current_page * rows_per_page)
+                current_row = min(current_row, max(0, page_len - 1))
             except Exception:
                 # 에러 발생 시 무시하고 넘어감.
                 pass
-            last_vm_poll = now
 
-        # 화면 전체를 지움.
-        stdscr.erase()
-        # 제목을 굵은 글씨로 표시.
-        stdscr.addstr(1, 1, "Virtual Machines", curses.A_BOLD)
-        
+        # 작업 스레드에서 실패한 요청이 있으면 팝업으로 알림
+        while action_errors:
+            title, message = action_errors.popleft()
+            show_error_popup(stdscr, title, message)
+            prev_layout = None
+            dirty = True
+
         # 현재 페이지에 해당하는 VM 목록의 시작과 끝 인덱스 계산
         start_idx = current_page * rows_per_page
         end_idx = min(start_idx + rows_per_page, len(vms))
         displayed_vm_count = end_idx - start_idx
         total_vm_count = len(vms)
+
+        # 업타임은 분 단위로 표시되므로 분이 바뀌면 다시 그림
+        minute = int(time.time() // 60)
+        if minute != drawn_minute:
+            drawn_minute = minute
+            dirty = True
+
+        if dirty:
+            dirty = False
+            page_rows = []
+            # 호스트 리소스 사용 테이블의 페이지 처리 (10행씩)
+            total_host_count = len(cached_hosts)
+            host_rows_per_page = 10
+            total_host_pages = (total_host_count + host_rows_per_page - 1) // host_rows_per_page
+            # 호스트가 하나도 없으면 total_host_pages가 0이므로 0 페이지로 고정
+            host_page = max(0, min(current_row, total_host_pages - 1))
+            start_idx_hosts = host_page * host_rows_per_page
+            end_idx_hosts = min(start_idx_hosts + host_rows_per_page, total_host_count)
+            displayed_host_count = max(0, end_idx_hosts - start_idx_hosts)
+            base_line = 9 + (end_idx - start_idx)
+
+            # 배치가 바뀐 경우에만 화면 전체를 지우고 두 표의 하위 창을 새 위치/크기로 다시 만듦
+            # (나머지는 덮어쓰기 후 바뀐 셀만 전송)
+            layout = (stdscr.getmaxyx(), current_page, total_vm_count, total_host_count, host_page)
+            if layout != prev_layout:
+                stdscr.erase()
+                vm_win = curses.newwin(displayed_vm_count + 4, len(VM_LIST_TOP) + 1, 4, 1)
+                host_win = curses.newwin(displayed_host_count + 4, len(HOST_USAGE_TOP) + 1, base_line + 1, 1)
+                for win in (vm_win, host_win):
+                    win.leaveok(True)
+                vm_win.addstr(0, 0, VM_LIST_TOP)  # 테이블 상단 선
+                # 헤더 행(열 제목들)을 표시.
+                vm_win.addstr(1, 0, VM_LIST_HEADER)
+                vm_win.addstr(2, 0, VM_LIST_SEP)  # 헤더와 데이터 사이의 구분선
+                vm_win.addstr(3 + displayed_vm_count, 0, VM_LIST_BOTTOM)  # 테이블 하단 선
+                host_win.addstr(0, 0, HOST_USAGE_TOP)
+                host_win.addstr(1, 0, HOST_USAGE_HEADER)
+                host_win.addstr(2, 0, HOST_USAGE_SEP)
+                host_win.addstr(3 + displayed_host_count, 0, HOST_USAGE_BOTTOM)
+                prev_layout = layout
+            # 제목을 굵은 글씨로 표시.
+            stdscr.addstr(1, 1, "Virtual Machines", curses.A_BOLD)
         
-        # 페이지 정보와 VM 개수를 표시.
-        stdscr.addstr(3, 1, f"- VM LIST ({displayed_vm_count}/{total_vm_count})")
-        stdscr.addstr(4, 1, header_line)  # 테이블 상단 선
-        # 헤더 행(열 제목들)을 표시.
-        stdscr.addstr(5, 1, "│" + "│".join(f"{header[i]:<{column_widths[i]}}" for i in range(len(header))) + "│")
-        stdscr.addstr(6, 1, divider_line)  # 헤더와 데이터 사이의 구분선
-
-        # 현재 페이지에 해당하는 각 VM에 대해 테이블 행을 출력.
-        for idx, vm in enumerate(vms[start_idx:end_idx]):
-            vm_index = start_idx + idx  # 전체 VM 목록에서의 인덱스
-            # 선택되었는지 여부에 따라 체크박스 표시
-            is_selected = "[x]" if vm_index in selected_vms else "[ ]"
-            name = f"{is_selected} {vm.name}"  # 체크박스와 VM 이름을 결합하여 표시
-            status = vm.status.value if vm.status else "N/A"
-            # 만약 해당 VM이 pending_start_vms 집합에 있다면, 상태 문자열에 추가 설명을 붙임
-            if vm_index in pending_start_vms:
-                status += " (starting...)"
-            # VM의 호스트 이름을 매핑에서 가져옴. (호스트 정보가 없으면 "N/A")
-            host = hosts_map.get(vm.host.id, "N/A") if vm.host else "N/A"
-            uptime = "N/A"
-            # VM이 시작되었으면 현재 시간과 start_time의 차이로 업타임을 계산.
-            if hasattr(vm, 'start_time') and vm.start_time:
-                current_time = datetime.now(timezone.utc)
-                uptime_seconds = (current_time - vm.start_time).total_seconds()
-                days = int(uptime_seconds // 86400)
-                hours = int((uptime_seconds % 86400) // 3600)
-                minutes = int((uptime_seconds % 3600) // 60)
-                uptime = f"{days}d {hours}h {minutes}m"
-            # 한 행에 출력할 데이터 리스트 생성
-            row = [name, status, host, uptime]
-            y = 7 + idx  # 데이터 행의 y좌표 (테이블 시작은 행 7부터)
-            if idx == current_row:
-                # 현재 선택된 행은 강조 색상(curses.color_pair(1))으로 출력
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, 1, "│" + "│".join(f"{str(row[i]):<{column_widths[i]}}" for i in range(len(row))) + "│")
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(y, 1, "│" + "│".join(f"{str(row[i]):<{column_widths[i]}}" for i in range(len(row))) + "│")
-                
-        # 테이블 하단 선을 출력.
-        stdscr.addstr(7 + (end_idx - start_idx), 1, footer_line)
-        stdscr.addstr(7 + (end_idx - start_idx), 1, footer_line)  # (중복 출력된 것처럼 보이나, 기존 코드 그대로 유지)
-
-        # ---------------------------
-        # Hosts Resource Usage 섹션
-        # ---------------------------
-        # 호스트 자원 사용 정보를 표시하는 테이블의 헤더, 열 너비 및 선을 정의.
-        host_header = ["Host Name", "CPU Usage", "Memory Usage", "Data Center", "Cluster"]
-        host_column_widths = [31, 13, 17, 28, 27]
-        host_header_line = "┌" + "┬".join("─" * w for w in host_column_widths) + "┐"
-        host_divider_line = "├" + "┼".join("─" * w for w in host_column_widths) + "┤"
-        host_footer_line = "└" + "┴".join("─" * w for w in host_column_widths) + "┘"
-        
-        # 주기적으로 호스트 리소스 사용량을 업데이트.
-        if now - last_host_poll >= host_poll_interval:
-            try:
-                cached_hosts = hosts_service.list()
-                usage = {}
-                # 각 호스트에 대해 통계를 조회하여 CPU, 메모리 사용률, 클러스터 및 데이터 센터 정보를 가져옴.
-                for host in cached_hosts:
-                    try:
-                        host_service = hosts_service.host_service(host.id)
-                        statistics = host_service.statistics_service().list()
-                        # CPU 사용률: "cpu.utilization" 항목을 우선 사용, 없으면 "cpu.load.avg" 항목 사용
-                        cpu_usage = next((s.values[0].datum for s in statistics if 'cpu.utilization' in s.name.lower()), "N/A")
-                        if cpu_usage == "N/A":
-                            cpu_usage = next((s.values[0].datum for s in statistics if 'cpu.load.avg' in s.name.lower()), "N/A")
-                        memory_used = next((s.values[0].datum for s in statistics if 'memory.used' in s.name.lower()), 0)
-                        memory_total = next((s.values[0].datum for s in statistics if 'memory.total' in s.name.lower()), 0)
-                        # 메모리 사용률 계산 (퍼센트)
-                        memory_usage = (memory_used / memory_total) * 100 if memory_total > 0 else "N/A"
-                        cluster_name = 'N/A'
-                        data_center_name = 'N/A'
-                        try:
-                            # 해당 호스트의 클러스터 정보를 가져옴.
-                            cluster = clusters_service.cluster_service(host.cluster.id).get()
-                            cluster_name = cluster.name if cluster and hasattr(cluster, 'name') else 'N/A'
-                            data_center_id = cluster.data_center.id if cluster and hasattr(cluster, 'data_center') else None
-                            if data_center_id:
-                                data_center = connection.system_service().data_centers_service().data_center_service(data_center_id).get()
-                                data_center_name = data_center.name if data_center and hasattr(data_center, 'name') else 'N/A'
-                        except Exception:
-                            cluster_name = 'N/A'
-                            data_center_name = 'N/A'
-                        usage[host.name] = {
-                            'cpu': round(cpu_usage, 2) if isinstance(cpu_usage, (float, int)) else "N/A",
-                            'memory': round(memory_usage, 2) if isinstance(memory_usage, (float, int)) else "N/A",
-                            'data_center': data_center_name if data_center_name else 'N/A',
-                            'cluster': cluster_name if cluster_name else 'N/A'
-                        }
-                    except Exception:
-                        usage[host.name] = {'cpu': "N/A", 'memory': "N/A", 'data_center': "N/A", 'cluster': "N/A"}
-                cached_usage = usage
-            except Exception:
-                pass
-            last_host_poll = now
-
-        # 호스트 리소스 사용 테이블의 페이지 처리 (10행씩)
-        x_margin = 1
-        total_host_count = len(cached_hosts)
-        host_rows_per_page = 10
-        total_host_pages = (total_host_count + host_rows_per_page - 1) // host_rows_per_page
-        host_page = min(current_row, total_host_pages - 1)
-        start_idx_hosts = host_page * host_rows_per_page
-        end_idx_hosts = min(start_idx_hosts + host_rows_per_page, total_host_count)
-        displayed_host_count = max(0, end_idx_hosts - start_idx_hosts)
-        
-        base_line = 9 + (end_idx - start_idx)
-        stdscr.addstr(base_line, x_margin, f"- HOST RESOURCE USAGE ({displayed_host_count}/{total_host_count})")
-        
-        # 테이블 상단 선 및 헤더 행 출력
-        stdscr.addstr(base_line + 1, x_margin, "┌" + "─" * 31 + "┬" + "─" * 13 + "┬" + "─" * 17 + "┬" + "─" * 28 + "┬" + "─" * 27 + "┐")
-        stdscr.addstr(base_line + 2, x_margin, f"│{'Host Name':<31}│{'CPU Usage':<13}│{'Memory Usage':<17}│{'Data Center':<28}│{'Cluster':<27}│")
-        stdscr.addstr(base_line + 3, x_margin, "├" + "─" * 31 + "┼" + "─" * 13 + "┼" + "─" * 17 + "┼" + "─" * 28 + "┼" + "─" * 27 + "┤")
-        # 각 호스트의 리소스 사용 정보를 출력.
-        for idx, host in enumerate(cached_hosts[start_idx_hosts:end_idx_hosts]):
-            host_name = host.name
-            cpu = cached_usage.get(host_name, {}).get('cpu', "N/A")
-            memory = cached_usage.get(host_name, {}).get('memory', "N/A")
-            data_center = cached_usage.get(host_name, {}).get('data_center', "N/A")
-            cluster = cached_usage.get(host_name, {}).get('cluster', "N/A")
-            row_str = f"│{host_name:<31}│{str(cpu) + '%':<13}│{str(memory) + '%':<17}│{data_center:<28}│{cluster:<27}│"
-            stdscr.addstr(base_line + 4 + idx, x_margin, row_str)
-        # 테이블 하단 선 출력
-        stdscr.addstr(base_line + 4 + (end_idx_hosts - start_idx_hosts), x_margin, "└" + "─" * 31 + "┴" + "─" * 13 + "┴" + "─" * 17 + "┴" + "─" * 28 + "┴" + "─" * 27 + "┘")
+            # 페이지 정보와 VM 개수를 표시.
+            stdscr.addstr(3, 1, f"- VM LIST ({displayed_vm_count}/{total_vm_count})")
+
+            # 업타임 계산 기준 시각은 프레임마다 한 번만 구함
+            now_utc = datetime.now(timezone.utc)
+            # 현재 페이지에 해당하는 각 VM에 대해 테이블 행을 출력.
+            for idx, vm in enumerate(islice(vms, start_idx, end_idx)):
+                # 선택되었는지 여부에 따라 체크박스 표시
+                is_selected = "[x]" if vm.id in selected_vms else "[ ]"
+                name = f"{is_selected} {vm.name}"  # 체크박스와 VM 이름을 결합하여 표시
+                status = vm.status.value if vm.status else "N/A"
+                # 작업을 요청한 VM이면 상태 문자열에 진행 중 표시를 붙임
+                if vm.id in pending_vms:
+                    status += f" ({pending_vms[vm.id]})"
+                # VM의 호스트 이름을 매핑에서 가져옴. (호스트 정보가 없으면 "N/A")
+                host = hosts_map.get(vm.host.id, "N/A") if vm.host else "N/A"
+                uptime = "N/A"
+                # VM이 시작되었으면 현재 시간과 start_time의 차이로 업타임을 계산.
+                # 분 단위 값이 바뀌지 않았으면 이전에 만든 문자열을 재사용.
+                if hasattr(vm, 'start_time') and vm.start_time:
+                    total_minutes = max(0, int((now_utc - vm.start_time).total_seconds())) // 60
+                    cached_uptime = uptime_cache.get(vm.id)
+                    if cached_uptime and cached_uptime[0] == vm.start_time and cached_uptime[1] == total_minutes:
+                        uptime = cached_uptime[2]
+                    else:
+                        days, rem = divmod(total_minutes, 1440)
+                        hours, minutes = divmod(rem, 60)
+                        uptime = f"{days}d {hours}h {minutes}m"
+                        uptime_cache[vm.id] = (vm.start_time, total_minutes, uptime)
+                # 열 폭에 맞게 잘라서 행 템플릿 하나로 포맷
+                row = (name, status, host, uptime)
+                row_text = VM_LIST_ROW_FMT.format(*[t(v) for t, v in zip(VM_LIST_TRUNCS, row)])
+                page_rows.append(row_text)
+                # 데이터 행은 하위 창의 3번째 줄부터 (화면 기준 7행)
+                if idx == current_row:
+                    # 현재 선택된 행은 강조 색상(curses.color_pair(1))으로 출력
+                    vm_win.addstr(3 + idx, 0, row_text, curses.color_pair(1))
+                else:
+                    vm_win.addstr(3 + idx, 0, row_text)
+
+            # ---------------------------
+            # Hosts Resource Usage 섹션
+            # ---------------------------
+            stdscr.addstr(base_line, 1, f"- HOST RESOURCE USAGE ({displayed_host_count}/{total_host_count})")
+            # 각 호스트의 리소스 사용 정보를 출력.
+            for idx, host in enumerate(islice(cached_hosts, start_idx_hosts, end_idx_hosts)):
+                host_name = host.name
+                cpu = cached_usage.get(host_name, {}).get('cpu', "N/A")
+                memory = cached_usage.get(host_name, {}).get('memory', "N/A")
+                data_center = cached_usage.get(host_name, {}).get('data_center', "N/A")
+                cluster = cached_usage.get(host_name, {}).get('cluster', "N/A")
+                row = (host_name, f"{cpu}%", f"{memory}%", data_center, cluster)
+                row_str = HOST_USAGE_ROW_FMT.format(*[t(v) for t, v in zip(HOST_USAGE_TRUNCS, row)])
+                host_win.addstr(3 + idx, 0, row_str)
         
-        # 하단 내비게이션 메시지 출력 (현재 페이지, 명령어 안내)
-        stdscr.addstr(height - 2, 1,
-                      f"Page {current_page + 1}/{total_pages} | N=Next page | P=Previous page | SPACE=Select | S=Start | D=Stop | R=Restart | M=Migrate | ESC=Go back | Q=Quit",
-                      curses.color_pair(2))
-        stdscr.refresh()
+            # 하단 내비게이션 메시지 출력 (현재 페이지, 명령어 안내)
+            stdscr.addstr(height - 2, 1,
+                          f"Page {current_page + 1}/{total_pages} | N=Next page | P=Previous page | SPACE=Select | S=Start | D=Stop | R=Restart | M=Migrate | ESC=Go back | Q=Quit",
+                          curses.color_pair(2))
+            # 화면 → 하위 창 순서로 가상 화면에 반영한 뒤 한 번에 출력
+            stdscr.noutrefresh()
+            vm_win.noutrefresh()
+            host_win.noutrefresh()
+            curses.doupdate()
         
         # 사용자 키 입력 처리
         key = stdscr.getch()
+        if key != -1 or pending_vms:
+            # 사용 중이거나 시작 중인 VM이 있으면 폴러가 기본 간격(1초)으로 돌아가도록 표시
+            snapshot["active_at"] = time.monotonic()
+        if key not in (-1, curses.KEY_UP, curses.KEY_DOWN, ord(' ')):
+            # 팝업/상세 화면이 남긴 흔적을 지우도록 다음 그리기에서 화면 전체를 지움
+            prev_layout = None
+        if key not in (-1, curses.KEY_UP, curses.KEY_DOWN):
+            dirty = True
         if key == ord('q'):
-            exit(0)
+            # 대기열에 남은 작업을 버리지 않도록 루프를 빠져나가 작업 스레드를 기다린 뒤 종료
+            quit_requested = True
+            break
         elif key == 27:
             break 
-        elif key == curses.KEY_UP:
-            # 위 방향키: 현재 페이지 내의 선택 행을 위로 이동
-            if (end_idx - start_idx) > 0:
-                current_row = (current_row - 1) % (end_idx - start_idx)
-        elif key == curses.KEY_DOWN:
-            # 아래 방향키: 현재 페이지 내의 선택 행을 아래로 이동
+        elif key in (curses.KEY_UP, curses.KEY_DOWN):
+            # 위/아래 방향키: 현재 페이지 내의 선택 행을 이동
             if (end_idx - start_idx) > 0:
-                current_row = (current_row + 1) % (end_idx - start_idx)
+                old_row = current_row
+                step = -1 if key == curses.KEY_UP else 1
+                current_row = (current_row + step) % (end_idx - start_idx)
+                # 호스트 표 페이지가 그대로면 이전/새 선택 행 두 줄만 다시 그림
+                if (len(page_rows) == end_idx - start_idx
+                        and old_row < len(page_rows)
+                        and max(0, min(current_row, total_host_pages - 1)) == host_page):
+                    vm_win.addstr(3 + old_row, 0, page_rows[old_row])
+                    vm_win.addstr(3 + current_row, 0, page_rows[current_row], curses.color_pair(1))
+                    vm_win.noutrefresh()
+                    curses.doupdate()
+                else:
+                    dirty = True
         elif key == ord('n') and current_page < total_pages - 1:
             # 'n' 키: 다음 페이지로 이동
             current_page += 1
@@ -577,79 +1161,42 @@ def show_virtual_machines(stdscr, connection):
             current_row = 0
         elif key == ord(' '):
             # SPACE 키: 현재 선택된 행의 VM을 선택/해제
-            vm_index = start_idx + current_row
-            if vm_index in selected_vms:
-                selected_vms.remove(vm_index)
-            else:
-                selected_vms.add(vm_index)
+            if start_idx + current_row < end_idx:
+                selected_vms ^= {vms[start_idx + current_row].id}
         elif key == ord('s'):
-            # 's' 키: 선택한 VM에 대해 start 명령 실행
-            for vm_index in selected_vms:
-                if start_idx <= vm_index < end_idx:
-                    vm_status = vms[vm_index].status.value.lower()
+            # 's' 키: 선택한 VM에 대해 start 명령을 작업 대기열에 추가 (이미 대기 중인 VM은 제외)
+            for vm in vms[start_idx:end_idx]:
+                if vm.id in selected_vms and vm.id not in queued_ids:
+                    vm_status = vm.status.value.lower()
                     if vm_status == "up":
                         continue
-                    elif vm_status == "suspended":
-                        try:
-                            vm_service = vms_service.vm_service(vms[vm_index].id)
-                            vm_service.start()
-                            time.sleep(1)
-                        except Exception:
-                            try:
-                                vm_service.wake_up()
-                            except Exception:
-                                pass
-                    else:
-                        manage_vms([vms[vm_index]], "start", vms_service, stdscr)
-                    pending_start_vms.add(vm_index)
+                    enqueue_action(vm, "resume" if vm_status == "suspended" else "start")
             selected_vms.clear()
         elif key == ord('d'):
             # 'd' 키: 선택한 VM에 대해 종료(Stop/Shutdown) 명령 실행
-            for vm_index in selected_vms:
-                if start_idx <= vm_index < end_idx:
-                    vm_status = vms[vm_index].status.value.lower()
+            for vm in vms[start_idx:end_idx]:
+                if vm.id in selected_vms and vm.id not in queued_ids:
+                    vm_status = vm.status.value.lower()
                     if vm_status not in ["up", "powering_up", "suspended"]:
                         continue
-                    confirm = confirm_shutdown_popup(stdscr, vms[vm_index].name)
+                    # 확인 팝업은 화면 스레드에서 띄우고, 실제 종료 요청만 대기열로 넘김
+                    confirm = confirm_shutdown_popup(stdscr, vm.name)
                     if confirm:
-                        vm_service = vms_service.vm_service(vms[vm_index].id)
-                        if vm_status == "suspended":
-                            try:
-                                vm_service.shutdown(force=True)
-                                time.sleep(1)
-                            except Exception:
-                                pass
-                            try:
-                                vm_service.stop(force=True)
-                            except Exception as e:
-                                show_error_popup(stdscr, "Stop Failed", f"Failed to stop VM '{vms[vm_index].name}': {str(e)}")
-                        else:
-                            manage_vms([vms[vm_index]], "stop", vms_service, stdscr)
-                        try:
-                            vms = vms_service.list()
-                        except Exception:
-                            pass
+                        enqueue_action(vm, "force_stop" if vm_status == "suspended" else "stop")
             selected_vms.clear()
         elif key == ord('r'):
             # 'r' 키: 선택한 VM에 대해 재시작 명령 실행
-            for vm_index in selected_vms:
-                if start_idx <= vm_index < end_idx:
-                    manage_vms([vms[vm_index]], "restart", vms_service, stdscr)
-            try:
-                vms = vms_service.list()
-            except Exception:
-                pass
+            for vm in vms[start_idx:end_idx]:
+                if vm.id in selected_vms and vm.id not in queued_ids:
+                    enqueue_action(vm, "restart")
             selected_vms.clear()
         elif key == ord('m'):
             # 'm' 키: 선택한 VM에 대해 마이그레이션을 위한 대상 호스트 선택 팝업 표시
-            for vm_index in selected_vms:
-                if start_idx <= vm_index < end_idx:
-                    migrate_vm_popup(vms[vm_index], cached_hosts,
+            for vm in vms[start_idx:end_idx]:
+                if vm.id in selected_vms:
+                    migrate_vm_popup(vm, cached_hosts,
                                      connection.system_service().clusters_service(), stdscr, vms_service)
-            try:
-                vms = vms_service.list()
-            except Exception:
-                pass
+            poll_wake.set()
             selected_vms.clear()
         elif key == 10:
             # ENTER 키: 현재 선택한 VM의 상세 정보 화면을 호출
@@ -657,29 +1204,21 @@ def show_virtual_machines(stdscr, connection):
                 vm = vms[start_idx + current_row]
                 show_vm_details(stdscr, connection, vm)
                 selected_vms.clear()
+    # 백그라운드 폴러와 작업 스레드 종료 (대기 중인 작업은 모두 처리한 뒤 종료됨)
+    poll_stop.set()
+    poll_wake.set()
+    action_queue.put(None)
+    stdscr.leaveok(False)
+    if quit_requested:
+        # 프로그램이 종료되면 데몬 스레드인 작업 스레드도 사라지므로, 남은 작업을 제한 시간 동안 기다림
+        if queued_ids:
+            stdscr.move(height - 2, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(height - 2, 1, f"Finishing {len(queued_ids)} pending action(s)...", curses.color_pair(2))
+            stdscr.refresh()
+        action_worker.join(VM_ACTION_EXIT_TIMEOUT)
+        exit(0)
         
-def manage_vms(selected_vms, action, vms_service, stdscr):
-    """선택된 VM들에 대해 start, stop, restart 동작을 수행"""
-    for vm in selected_vms:
-        vm_service = vms_service.vm_service(vm.id)
-        try:
-            if action == "start":
-                if vm.status.value != "down":
-                    continue
-                vm_service.start()
-            elif action == "stop":
-                if vm.status.value not in ["up", "powering_up"]:
-                    continue
-                vm_service.stop()
-            elif action == "restart":
-                if vm.status.value != "up":
-                    continue
-                vm_service.reboot()
-        except Exception as e:
-            error_message = f"Failed to {action} VM '{vm.name}':\n{str(e)}"
-            show_error_popup(stdscr, f"Failed to {action} VM", error_message)
-        stdscr.refresh()
-
 def migrate_vm_popup(vm, hosts, clusters_service, stdscr, vms_service):
     """VM 마이그레이션을 위한 대상 호스트 선택 팝업"""
     height, width = stdscr.getmaxyx()
@@ -829,13 +1368,11 @@ def show_vm_details(stdscr, connection, vm):
     stdscr.addstr(1, 1, f"- VM Details for {vm.name}")
     vm_details_header = ["Status", "Uptime", "Operating System", "Chipset/F/W Type",
                            "Defined Memory", "Memory Guaranteed", "Guest CPU Count", "HA"]
-    vm_details_widths = [7, 14, 20, 18, 14, 17, 15, 9]
-    header_line = "┌" + "┬".join("─" * w for w in vm_details_widths) + "┐"
-    divider_line = "├" + "┼".join("─" * w for w in vm_details_widths) + "┤"
-    footer_line = "└" + "┴".join("─" * w for w in vm_details_widths) + "┘"
+    vm_details_widths = (7, 14, 20, 18, 14, 17, 15, 9)
+    header_line, divider_line, footer_line = _borders(vm_details_widths)
     stdscr.addstr(2, 1, header_line)
-    stdscr.addstr(3, 1, "│" + "│".join(f"{truncate_with_ellipsis(h, w):<{w}}" 
-                                      for h, w in zip(vm_details_header, vm_details_widths)) + "│")
+    stdscr.addstr(3, 1, "│" + "│".join([truncate_with_ellipsis(h, w).ljust(w) 
+                                      for h, w in zip(vm_details_header, vm_details_widths)]) + "│")
     stdscr.addstr(4, 1, divider_line)
     vm_status = vm.status if vm.status else "N/A"
     if vm.start_time and vm.status == VmStatus.UP:
@@ -856,8 +1393,8 @@ def show_vm_details(stdscr, connection, vm):
         guest_cpu_count = "N/A"
     ha_status = "Yes" if vm.high_availability and vm.high_availability.enabled else "No"
     vm_details_row = [str(vm_status), uptime_str, os_type, chipset, defined_memory, memory_guaranteed, str(guest_cpu_count), ha_status]
-    row_str = "│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" 
-                              for val, w in zip(vm_details_row, vm_details_widths)) + "│"
+    row_str = "│" + "│".join([truncate_with_ellipsis(val, w).ljust(w) 
+                              for val, w in zip(vm_details_row, vm_details_widths)]) + "│"
     stdscr.addstr(5, 1, row_str)
     stdscr.addstr(6, 1, footer_line)
     
@@ -867,17 +1404,21 @@ def show_vm_details(stdscr, connection, vm):
     row += 1
     nic_header = ["NIC Name", "Network Name", "IPv4", "MAC",
                   "Link State", "Interface", "Speed (Mbps)", "Port Mirroring"]
-    nic_column_widths = [15, 15, 16, 18, 11, 10, 13, 16]
-    nic_header_line = "┌" + "┬".join("─" * w for w in nic_column_widths) + "┐"
-    nic_divider_line = "├" + "┼".join("─" * w for w in nic_column_widths) + "┤"
-    nic_footer_line = "└" + "┴".join("─" * w for w in nic_column_widths) + "┘"
+    nic_column_widths = (15, 15, 16, 18, 11, 10, 13, 16)
+    nic_header_line, nic_divider_line, nic_footer_line = _borders(nic_column_widths)
     stdscr.addstr(row, 1, nic_header_line)
     row += 1
-    stdscr.addstr(row, 1, "│" + "│".join(f"{col:<{w}}" for col, w in zip(nic_header, nic_column_widths)) + "│")
+    stdscr.addstr(row, 1, "│" + "│".join([col.ljust(w) for col, w in zip(nic_header, nic_column_widths)]) + "│")
     row += 1
     stdscr.addstr(row, 1, nic_divider_line)
     row += 1
     try:
+        # vNIC 프로파일과 네트워크 이름을 목록 조회 두 번으로 미리 받아 NIC마다 개별 조회하지 않음 (TTL 캐시)
+        system_service = connection.system_service()
+        vnic_profiles_map = {profile.id: profile
+                             for profile in cached("vnic_profiles", 60, system_service.vnic_profiles_service().list)}
+        network_names = cached("network_names", 60,
+                               lambda: {net.id: net.name for net in system_service.networks_service().list()})
         vm_service = connection.system_service().vms_service().vm_service(vm.id)
         vm_data = vm_service.get()  # 최신 VM 상태
         nics_service = vm_service.nics_service()
@@ -896,21 +1437,14 @@ def show_vm_details(stdscr, connection, vm):
                 pass
         if not nics:
             placeholder = ["-"] * len(nic_header)
-            stdscr.addstr(row, 1, "│" + "│".join(f"{str(col):<{w}}" for col, w in zip(placeholder, nic_column_widths)) + "│")
+            stdscr.addstr(row, 1, "│" + "│".join([str(col).ljust(w) for col, w in zip(placeholder, nic_column_widths)]) + "│")
             row += 1
         else:
             for nic in nics:
                 network_name = "-"
-                try:
-                    if nic.vnic_profile and nic.vnic_profile.id:
-                        vnic_profile_service = connection.system_service().vnic_profiles_service()
-                        vnic_profile = vnic_profile_service.profile_service(nic.vnic_profile.id).get()
-                        if vnic_profile.network:
-                            networks_service = connection.system_service().networks_service()
-                            network = networks_service.network_service(vnic_profile.network.id).get()
-                            network_name = network.name if network.name else "-"
-                except Exception:
-                    pass
+                vnic_profile = vnic_profiles_map.get(nic.vnic_profile.id) if nic.vnic_profile else None
+                if vnic_profile and vnic_profile.network:
+                    network_name = network_names.get(vnic_profile.network.id) or "-"
                 ipv4 = mac_ip_mapping.get(nic.mac.address, "-")
                 nic_row = [
                     nic.name or '-',
@@ -922,7 +1456,7 @@ def show_vm_details(stdscr, connection, vm):
                     '-',
                     'Disabled'
                 ]
-                stdscr.addstr(row, 1, "│" + "│".join(f"{str(col):<{w}}" for col, w in zip(nic_row, nic_column_widths)) + "│")
+                stdscr.addstr(row, 1, "│" + "│".join([str(col).ljust(w) for col, w in zip(nic_row, nic_column_widths)]) + "│")
                 row += 1
     except Exception as e:
         stdscr.addstr(row, 1, f"│ Error: {truncate_with_ellipsis(str(e), 50)} │")
@@ -934,13 +1468,11 @@ def show_vm_details(stdscr, connection, vm):
     row += 1
     disk_header = ["Alias", "OS", "Size (GB)", "Attached To", "Interface",
                    "Logical Name", "Status", "Type", "Policy", "Storage Domain"]
-    disk_column_widths = [19, 5, 11, 14, 12, 12, 6, 7, 9, 17]
-    disk_header_line = "┌" + "┬".join("─" * w for w in disk_column_widths) + "┐"
-    disk_divider_line = "├" + "┼".join("─" * w for w in disk_column_widths) + "┤"
-    disk_footer_line = "└" + "┴".join("─" * w for w in disk_column_widths) + "┘"
+    disk_column_widths = (19, 5, 11, 14, 12, 12, 6, 7, 9, 17)
+    disk_header_line, disk_divider_line, disk_footer_line = _borders(disk_column_widths)
     stdscr.addstr(row, 1, disk_header_line)
     row += 1
-    stdscr.addstr(row, 1, "│" + "│".join(f"{col:<{w}}" for col, w in zip(disk_header, disk_column_widths)) + "│")
+    stdscr.addstr(row, 1, "│" + "│".join([col.ljust(w) for col, w in zip(disk_header, disk_column_widths)]) + "│")
     row += 1
     stdscr.addstr(row, 1, disk_divider_line)
     row += 1
@@ -948,24 +1480,27 @@ def show_vm_details(stdscr, connection, vm):
         vm_service = connection.system_service().vms_service().vm_service(vm.id)
         disk_attachments_service = vm_service.disk_attachments_service()
         disk_attachments = disk_attachments_service.list()
-        boot_disk_id = None
-        for attachment in disk_attachments:
-            if attachment.bootable:
-                boot_disk_id = attachment.disk.id
-                break
+        boot_disk_id = next((attachment.disk.id for attachment in disk_attachments if attachment.bootable), None)
         if not disk_attachments:
             disk_row = ['-'] * len(disk_header)
-            stdscr.addstr(row, 1, "│" + "│".join(f"{str(col):<{w}}" for col, w in zip(disk_row, disk_column_widths)) + "│")
+            stdscr.addstr(row, 1, "│" + "│".join([str(col).ljust(w) for col, w in zip(disk_row, disk_column_widths)]) + "│")
             row += 1
         else:
             for attachment in disk_attachments:
                 try:
                     logical_name = attachment.logical_name if attachment.logical_name else "(None)"
-                    disk = connection.follow_link(attachment.disk)
+                    disk = follow_link_cached(connection, attachment.disk)
                     os_field = "Yes" if disk.id == boot_disk_id else "No"
                     storage_domain = "-"
                     if disk.storage_domains:
-                        storage_domains = [connection.follow_link(sd).name for sd in disk.storage_domains]
+                        # 스토리지 도메인 이름은 거의 바뀌지 않으므로 더 오래 캐시
+                        sd_name = lambda sd: follow_link_cached(connection, sd, ttl=300).name
+                        if len(disk.storage_domains) > 1:
+                            # 여러 도메인에 걸친 디스크는 조회를 병렬로 수행 (왕복 시간 합 → 최댓값)
+                            with ThreadPoolExecutor(max_workers=min(8, len(disk.storage_domains))) as executor:
+                                storage_domains = list(executor.map(sd_name, disk.storage_domains))
+                        else:
+                            storage_domains = [sd_name(disk.storage_domains[0])]
                         storage_domain = ", ".join(storage_domains)
                     disk_row = [
                         truncate_with_ellipsis(disk.alias or '-', disk_column_widths[0]),
@@ -979,7 +1514,7 @@ def show_vm_details(stdscr, connection, vm):
                         truncate_with_ellipsis("Thin" if disk.sparse else "Preallocated", disk_column_widths[8]),
                         truncate_with_ellipsis(storage_domain, disk_column_widths[9]),
                     ]
-                    stdscr.addstr(row, 1, "│" + "│".join(f"{str(col):<{disk_column_widths[i]}}" for i, col in enumerate(disk_row)) + "│")
+                    stdscr.addstr(row, 1, "│" + "│".join([col.ljust(w) for col, w in zip(disk_row, disk_column_widths)]) + "│")
                     row += 1
                 except Exception:
                     continue
@@ -1004,18 +1539,32 @@ def show_vm_events(stdscr, connection, vm, row):
         stdscr.getch()
         return row
     event_headers = ["Time", "Severity", "Description"]
-    event_widths = [19, 9, 91]
-    header_line = "┌" + "┬".join("─" * w for w in event_widths) + "┐"
-    divider_line = "├" + "┼".join("─" * w for w in event_widths) + "┤"
-    footer_line = "└" + "┴".join("─" * w for w in event_widths) + "┘"
+    event_widths = (19, 9, 91)
+    header_line, divider_line, footer_line = _borders(event_widths)
+    header_row = "│" + "│".join([truncate_with_ellipsis(h, w).ljust(w) for h, w in zip(event_headers, event_widths)]) + "│"
     try:
         events_service = connection.system_service().events_service()
         events = events_service.list(search=f"vm.name={vm.name}", max=50)
+        # 이벤트는 바뀌지 않으므로 시간/심각도/설명 문자열을 조회 직후 열 폭에 맞게 한 번만 잘라 둠
+        events_view = [(
+            truncate_with_ellipsis(event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-", event_widths[0]),
+            truncate_with_ellipsis(SEVERITY_LOWER.get(event.severity, "-"), event_widths[1]),
+            truncate_with_ellipsis(event.description, event_widths[2]) if event.description else "-",
+        ) for event in events]
         total_events = len(events)
         page_size = 8
         total_pages = max(1, (total_events + page_size - 1) // page_size)
         current_page = 0
         base_row = row
+        # 이벤트 목록은 화면에 있는 동안 바뀌지 않으므로 페이지별로 완성된 행 문자열을 캐시
+        page_cache = {}
+        def format_page(page):
+            rows = []
+            for event_row in events_view[page * page_size:(page + 1) * page_size]:
+                rows.append("│" + "│".join(
+                    [val.ljust(w) for val, w in zip(event_row, event_widths)]
+                ) + "│")
+            return rows
         while True:
             header_text = f"- Events for {vm.name} (Page {current_page + 1}/{total_pages})"
             stdscr.addstr(base_row, 1, header_text)
@@ -1023,28 +1572,18 @@ def show_vm_events(stdscr, connection, vm, row):
             for i in range(table_start_row, height - 3):
                 stdscr.move(i, 1)
                 stdscr.clrtoeol()
-            stdscr.addstr(table_start_row, 1, header_line)
-            stdscr.addstr(table_start_row + 1, 1, "│" + "│".join(
-                f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(event_headers, event_widths)
-            ) + "│")
-            stdscr.addstr(table_start_row + 2, 1, divider_line)
-            start_idx = current_page * page_size
-            end_idx = min(start_idx + page_size, total_events)
-            data_row = table_start_row + 3
-            for event in events[start_idx:end_idx]:
-                time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
-                severity = event.severity.name.lower() if hasattr(event.severity, 'name') else "-"
-                description = truncate_with_ellipsis(event.description, event_widths[2]) if event.description else "-"
-                row_str = "│" + "│".join(
-                    f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip([time_str, severity, description], event_widths)
-                ) + "│"
-                stdscr.addstr(data_row, 1, row_str)
-                data_row += 1
-            stdscr.addstr(data_row, 1, footer_line)
-            data_row += 2
+            if current_page not in page_cache:
+                page_cache[current_page] = format_page(current_page)
+            # 표 전체(테두리, 헤더, 행)를 줄 목록 하나로 모아 한 번에 출력
+            block = [header_line, header_row, divider_line] + page_cache[current_page] + [footer_line]
+            data_row = draw_lines(stdscr, table_start_row, 1, block) + 1
             stdscr.addstr(data_row, 1, "N=Next | P=Prev", curses.A_DIM)
             stdscr.addstr(height - 2, 1, "Page {}/{} | ESC=Go back | Q=Quit".format(current_page+1, total_pages), curses.A_DIM)
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
+            # 화면 출력 후 다음 페이지를 미리 만들어 두어 N 키 응답을 빠르게 함
+            if current_page + 1 < total_pages and current_page + 1 not in page_cache:
+                page_cache[current_page + 1] = format_page(current_page + 1)
             key = stdscr.getch()
             if key == ord('n') and current_page < total_pages - 1:
                 current_page += 1
@@ -1064,6 +1603,15 @@ def show_vm_events(stdscr, connection, vm, row):
         stdscr.getch()
     return base_row
 
+@lru_cache(maxsize=32)
+def wrap_text(text, width):
+    """
+    textwrap.wrap 결과를 튜플로 반환 (같은 메시지/폭은 캐시 재사용).
+    textwrap은 팝업을 띄울 때만 필요하므로 처음 호출될 때 가져옴.
+    """
+    import textwrap
+    return tuple(textwrap.wrap(text, width))
+
 def show_error_popup(stdscr, title, message):
     """
     에러 메시지를 팝업 창에 표시하는 함수.
@@ -1094,7 +1642,7 @@ def show_error_popup(stdscr, title, message):
     safe_addstr(popup, 1, (popup_width - len(title_text)) // 2, title_text, curses.A_BOLD)
     wrapped_lines = []
     for line in message.split('\n'):
-        wrapped_lines.extend(textwrap.wrap(line, popup_width - 4))
+        wrapped_lines.extend(wrap_text(line, popup_width - 4))
     for i, line in enumerate(wrapped_lines[:popup_height - 4]):
         safe_addstr(popup, 3 + i, 2, line)
     footer_text = "Press any key to close."
@@ -1113,42 +1661,65 @@ def get_data_center_info(connection, data_center):
     clusters_service = connection.system_service().clusters_service()
     hosts_service = connection.system_service().hosts_service()
     clusters = [c for c in clusters_service.list() if c.data_center and c.data_center.id == data_center.id]
-    hosts = [h for h in hosts_service.list() if h.cluster and h.cluster.id in [c.id for c in clusters]]
+    cluster_ids = {c.id for c in clusters}
+    host_count = sum(1 for h in hosts_service.list() if h.cluster and h.cluster.id in cluster_ids)
     return {
         "name": ensure_non_empty(data_center.name),
         "comment": adjust_column_width(ensure_non_empty(data_center.comment), 21),
         "status": ensure_non_empty(data_center.status.name if data_center.status else "-"),
-        "hosts": ensure_non_empty(str(len(hosts))),
+        "hosts": ensure_non_empty(str(host_count)),
         "clusters": ensure_non_empty(str(len(clusters))),
         "description": adjust_column_width(ensure_non_empty(data_center.description), 23)
     }
 
+DC_RELATED_TTL = 10  # 데이터 센터 관련 목록(스토리지/네트워크/클러스터) 캐시 시간(초)
+
+def fetch_dc_related(connection, data_center):
+    """
+    선택한 데이터 센터의 (Storage Domains, Logical Networks, Clusters) 목록을 반환.
+    DC_RELATED_TTL 동안은 데이터 센터별로 캐시된 결과를 재사용.
+    """
+    def load():
+        system_service = connection.system_service()
+        data_center_service = system_service.data_centers_service().data_center_service(data_center.id)
+        storage_domains = data_center_service.storage_domains_service().list()
+        networks = system_service.networks_service().list(search=f"datacenter={data_center.name}")
+        clusters = system_service.clusters_service().list(search=f"datacenter={data_center.name}")
+        return storage_domains, networks, clusters
+    return cached(("dc_related", data_center.id), DC_RELATED_TTL, load)
+
+_INV_GB = 1.0 / (1024 ** 3)  # 바이트 → GB 변환 계수 (나눗셈 대신 곱셈)
+
+def storage_domain_row(sd):
+    """Storage Domains 표의 한 행(이름, 상태, 여유/사용/전체 용량(GB), 설명)을 반환"""
+    available = getattr(sd, 'available', None)
+    used = getattr(sd, 'used', None)
+    total = getattr(sd, 'total', None)
+    if total is None:
+        total = (available or 0) + (used or 0)
+    return [
+        sd.name or "N/A",
+        str(sd.status) if sd.status else "N/A",
+        f"{available * _INV_GB:.1f}" if available is not None else "0.0",
+        f"{used * _INV_GB:.1f}" if used is not None else "0.0",
+        f"{total * _INV_GB:.1f}",
+        sd.comment or "N/A"
+    ]
+
 def show_related_data(stdscr, connection, data_center, start_y):
     """
     선택한 데이터 센터와 관련된 Storage Domains, Logical Networks, Clusters 정보를 표시.
     """
-    data_center_service = connection.system_service().data_centers_service().data_center_service(data_center.id)
-    storage_domains_service = data_center_service.storage_domains_service()
-    clusters_service = connection.system_service().clusters_service()
-    networks_service = connection.system_service().networks_service()
+    storage_domains, networks, clusters = fetch_dc_related(connection, data_center)
 
     stdscr.addstr(start_y, 1, f"- Storage Domains For {data_center.name}")
     storage_header = ["Name", "Status", "Free Space (GB)", "Used Space (GB)", "Total Space (GB)", "Description"]
     storage_col_widths = [28, 13, 17, 17, 17, 22]
-    storage_domains = storage_domains_service.list()
-    draw_table(stdscr, start_y + 1, storage_header, storage_col_widths, storage_domains, lambda sd: [
-        sd.name or "N/A",
-        str(sd.status) if sd.status else "N/A",
-        f"{(sd.available / (1024**3)):.1f}" if hasattr(sd, 'available') and sd.available is not None else "0.0",
-        f"{(sd.used / (1024**3)):.1f}" if hasattr(sd, 'used') and sd.used is not None else "0.0",
-        f"{(sd.total / (1024**3)):.1f}" if hasattr(sd, 'total') and sd.total is not None else f"{((sd.available or 0) + (sd.used or 0)) / (1024**3):.1f}",
-        sd.comment or "N/A"
-    ])
+    draw_table(stdscr, start_y + 1, storage_header, storage_col_widths, storage_domains, storage_domain_row)
 
     stdscr.addstr(start_y + 6 + max(len(storage_domains), 1), 1, f"- Logical Networks For {data_center.name}")
     network_header = ["Name", "Description"]
     network_col_widths = [28, 90]
-    networks = networks_service.list(search=f"datacenter={data_center.name}")
     draw_table(stdscr, start_y + 7 + max(len(storage_domains), 1), network_header, network_col_widths, networks, lambda net: [
         net.name or "N/A",
         net.comment or "N/A"
@@ -1157,7 +1728,6 @@ def show_related_data(stdscr, connection, data_center, start_y):
     stdscr.addstr(start_y + 12 + max(len(storage_domains), 1) + max(len(networks), 1), 1, f"- Cluster For {data_center.name}")
     cluster_header = ["Name", "Compat Version", "Description"]
     cluster_col_widths = [28, 32, 57]
-    clusters = clusters_service.list(search=f"datacenter={data_center.name}")
     draw_table(stdscr, start_y + 13 + max(len(storage_domains), 1) + max(len(networks), 1), cluster_header, cluster_col_widths, clusters, lambda cl: [
         cl.name or "N/A",
         f"{cl.version.major}.{cl.version.minor}" if cl.version and hasattr(cl.version, 'major') and hasattr(cl.version, 'minor') else "N/A",
@@ -1168,10 +1738,20 @@ def show_events_data_center(stdscr, connection, data_center):
     """
     선택한 데이터 센터와 관련된 이벤트를 페이지 단위로 표시.
     """
+    col_widths = (19, 9, 91)
     try:
         events_service = connection.system_service().events_service()
-        all_events = events_service.list()
-        events = [event for event in all_events if event.data_center and event.data_center.id == data_center.id]
+        # 전체 이벤트를 받아 거르지 않고 서버에서 데이터 센터 조건(event_datacenter)으로 검색
+        # (이름에 공백/검색 구문 문자가 있어도 되도록 따옴표로 감싸고 내부 따옴표는 이스케이프)
+        # 오래된 데이터 센터는 이벤트 이력이 매우 많을 수 있으므로 최신 500개(40행 × 12페이지 남짓)까지만 받음
+        dc_name = (data_center.name or "").replace('\\', '\\\\').replace('"', '\\"')
+        events = events_service.list(search=f'event_datacenter="{dc_name}"', max=500)
+        # 페이지를 넘길 때마다 strftime/자르기를 반복하지 않도록 조회 직후 열 폭에 맞춘 셀 문자열로 변환
+        events_view = [(
+            get_display_width(event.time.strftime('%Y-%m-%d %H:%M:%S') if event.time else "-", col_widths[0]),
+            get_display_width(SEVERITY_NAME.get(event.severity, "-"), col_widths[1]),
+            get_display_width(event.description if event.description else "-", col_widths[2]),
+        ) for event in events]
     except Exception as e:
         stdscr.addstr(2, 1, f"Failed to fetch Events: {e}")
         stdscr.refresh()
@@ -1180,33 +1760,39 @@ def show_events_data_center(stdscr, connection, data_center):
     current_page = 0
     rows_per_page = 40
     total_pages = (len(events) + rows_per_page - 1) // rows_per_page
+    header = ["Time", "Severity", "Description"]
+    header_line, divider_line, footer_line = _borders(col_widths)
+    header_row = "│" + "│".join([get_display_width(h, w) for h, w in zip(header, col_widths)]) + "│"
+    # 화면 밖 pad에 한 페이지를 모두 그린 뒤 한 번에 내보내 깜빡임을 없앰 (stdscr는 건드리지 않음)
+    height, width = stdscr.getmaxyx()
+    pad = curses.newpad(height, width)
+    redraw = True
     while True:
-        stdscr.erase()
-        height, width = stdscr.getmaxyx()
-        stdscr.addstr(1, 1, f"- Events for {data_center.name} (Page {current_page + 1}/{max(total_pages, 1)})")
-        header = ["Time", "Severity", "Description"]
-        col_widths = [19, 9, 91]
-        header_line = "┌" + "┬".join("─" * w for w in col_widths) + "┐"
-        divider_line = "├" + "┼".join("─" * w for w in col_widths) + "┤"
-        footer_line = "└" + "┴".join("─" * w for w in col_widths) + "┘"
-        stdscr.addstr(2, 1, header_line)
-        stdscr.addstr(3, 1, "│" + "│".join(get_display_width(h, w) for h, w in zip(header, col_widths)) + "│")
-        stdscr.addstr(4, 1, divider_line)
-        start_idx = current_page * rows_per_page
-        end_idx = min(start_idx + rows_per_page, len(events))
-        for idx, event in enumerate(events[start_idx:end_idx]):
-            row_y = 5 + idx
-            event_time = event.time.strftime('%Y-%m-%d %H:%M:%S') if event.time else "-"
-            severity = getattr(event.severity, 'name', "-")
-            description = event.description if event.description else "-"
-            row_data = [event_time, severity, description]
-            row_text = "│" + "│".join(get_display_width(d, w) for d, w in zip(row_data, col_widths)) + "│"
-            stdscr.addstr(row_y, 1, row_text)
-        stdscr.addstr(5 + len(events[start_idx:end_idx]), 1, footer_line)
-        stdscr.addstr(height - 2, 1, "N=Next | P=Prev | ESC=Go Back | Q=Quit", curses.color_pair(2))
-        stdscr.refresh()
+        if redraw:
+            pad.erase()
+            pad.addstr(1, 1, f"- Events for {data_center.name} (Page {current_page + 1}/{max(total_pages, 1)})")
+            start_idx = current_page * rows_per_page
+            end_idx = min(start_idx + rows_per_page, len(events))
+            # 표 전체를 줄 목록으로 모아 draw_lines 한 번으로 출력
+            block = [header_line, header_row, divider_line]
+            block.extend(["│" + "│".join(row_data) + "│" for row_data in events_view[start_idx:end_idx]])
+            block.append(footer_line)
+            draw_lines(pad, 2, 1, block)
+            pad.addstr(height - 2, 1, "N=Next | P=Prev | ESC=Go Back | Q=Quit", curses.color_pair(2))
+            pad.noutrefresh(0, 0, 0, 0, height - 1, width - 1)
+            curses.doupdate()
+            redraw = False
         key = stdscr.getch()
-        if key == ord('n') and current_page < total_pages - 1:
+        if key == -1:
+            continue
+        redraw = True
+        if key == curses.KEY_RESIZE:
+            # 크기 변경으로 stdscr가 touch 상태가 되면 getch가 stdscr를 다시 출력하므로 비워서 반영해 둠
+            stdscr.erase()
+            stdscr.noutrefresh()
+            height, width = stdscr.getmaxyx()
+            pad = curses.newpad(height, width)
+        elif key == ord('n') and current_page < total_pages - 1:
             current_page += 1
         elif key == ord('p') and current_page > 0:
             current_page -= 1
@@ -1232,51 +1818,111 @@ def show_data_centers(stdscr, connection):
         stdscr.getch()
         return
 
+    # 데이터 센터별 클러스터 목록과 클러스터별 호스트 수를 한 번씩만 순회해 색인
+    clusters_by_dc = defaultdict(list)
+    for c in clusters:
+        if c.data_center:
+            clusters_by_dc[c.data_center.id].append(c)
+    hosts_per_cluster = Counter(h.cluster.id for h in hosts if h.cluster)
     dc_info_cache = {}
     for dc in dcs:
-        dc_clusters = [c for c in clusters if c.data_center and c.data_center.id == dc.id]
-        dc_hosts = [h for h in hosts if h.cluster and h.cluster.id in [c.id for c in dc_clusters]]
+        dc_clusters = clusters_by_dc.get(dc.id, [])
+        dc_host_count = sum(hosts_per_cluster[c.id] for c in dc_clusters)
         dc_info_cache[dc.id] = {
             "name": ensure_non_empty(dc.name),
             "comment": adjust_column_width(ensure_non_empty(dc.comment), 21),
             "status": ensure_non_empty(dc.status.name if dc.status else "-"),
-            "hosts": ensure_non_empty(str(len(dc_hosts))),
+            "hosts": ensure_non_empty(str(dc_host_count)),
             "clusters": ensure_non_empty(str(len(dc_clusters))),
             "description": adjust_column_width(ensure_non_empty(dc.description), 23)
         }
 
+    header = ["Data Center Name", "Comment", "Status", "Hosts", "Clusters", "Description"]
+    col_widths = [28, 21, 16, 13, 13, 23]
+    # 커서 이동 시 글자는 다시 쓰지 않고 두 행의 속성만 바꾸므로 행의 출력 폭만 기억
+    row_len = sum(col_widths) + len(col_widths) + 1
+    table_y = 4 + 3
+    related_y = 9 + len(dcs)
+
     current_row = 0
     curses.start_color()
     curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_CYAN)
-    stdscr.timeout(1)
+    stdscr.timeout(100)
+    need_full = True
+    too_small = False
+    dirty = True  # 화면에 반영할 변경이 있을 때만 doupdate
+    related_row = None
+    related_at = 0.0
+    key = -1
     while True:
-        stdscr.erase()
-        height, width = stdscr.getmaxyx()
-        if height < 40 or width < 120:
-            stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.")
-            stdscr.refresh()
-            continue
-        stdscr.addstr(1, 1, "Data Centers", curses.A_BOLD)
-        stdscr.addstr(3, 1, "- Data Center List")
-        header = ["Data Center Name", "Comment", "Status", "Hosts", "Clusters", "Description"]
-        col_widths = [28, 21, 16, 13, 13, 23]
-        draw_table(stdscr, 4, header, col_widths, dcs,
-                   lambda dc: list(dc_info_cache[dc.id].values()),
-                   current_row)
-        if dcs:
-            selected_dc = dcs[current_row]
-            show_related_data(stdscr, connection, selected_dc, 9 + len(dcs))
-        stdscr.addstr(height - 2, 1,
-                      "▲/▼=Navigate | Enter=View Events | ESC=Go back | Q=Quit",
-                      curses.color_pair(2))
-        stdscr.refresh()
+        if need_full:
+            stdscr.erase()
+            height, width = stdscr.getmaxyx()
+            too_small = height < 40 or width < 120
+            if too_small:
+                stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.")
+            else:
+                stdscr.addstr(1, 1, "Data Centers", curses.A_BOLD)
+                stdscr.addstr(3, 1, "- Data Center List")
+                draw_table(stdscr, 4, header, col_widths, dcs,
+                           lambda dc: list(dc_info_cache[dc.id].values()),
+                           current_row)
+                stdscr.addstr(height - 2, 1,
+                              "▲/▼=Navigate | Enter=View Events | ESC=Go back | Q=Quit",
+                              curses.color_pair(2))
+                related_row = None
+            need_full = False
+            dirty = True
+        # 관련 테이블은 API 호출이 필요하므로, 키 입력이 멈췄을 때(getch 타임아웃) 선택이 바뀌었거나
+        # 캐시 주기(DC_RELATED_TTL)가 지난 경우에만 다시 그림
+        if not too_small and dcs and (related_row is None or (key == -1 and (
+                related_row != current_row or time.monotonic() - related_at >= DC_RELATED_TTL))):
+            for y in range(related_y, height - 2):
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+            show_related_data(stdscr, connection, dcs[current_row], related_y)
+            related_row = current_row
+            related_at = time.monotonic()
+            dirty = True
+        if dirty:
+            stdscr.noutrefresh()
+            curses.doupdate()
+            dirty = False
         key = stdscr.getch()
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(dcs)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(dcs)
-        elif key == 10:
+        # KEY_RESIZE가 전달되지 않는 터미널을 위해 입력이 없을 때 크기 변화를 직접 확인
+        if key == -1 and stdscr.getmaxyx() != (height, width):
+            need_full = True
+            continue
+        if key in (curses.KEY_UP, curses.KEY_DOWN) and dcs and not too_small:
+            prev_row = current_row
+            step = -1 if key == curses.KEY_UP else 1
+            # 키 자동 반복으로 이미 쌓인 화살표 입력을 모두 읽어 최종 이동량 하나로 합침
+            stdscr.nodelay(True)
+            try:
+                while True:
+                    next_key = stdscr.getch()
+                    if next_key == curses.KEY_UP:
+                        step -= 1
+                    elif next_key == curses.KEY_DOWN:
+                        step += 1
+                    else:
+                        if next_key != -1:
+                            curses.ungetch(next_key)
+                        break
+            finally:
+                stdscr.nodelay(False)
+                stdscr.timeout(100)
+            current_row = (current_row + step) % len(dcs)
+            # 이전/새 선택 행의 강조 속성만 바꿈 (chgat)
+            span = min(row_len, max(1, width - 2))
+            stdscr.chgat(table_y + prev_row, 1, span, curses.A_NORMAL)
+            stdscr.chgat(table_y + current_row, 1, span, curses.color_pair(1))
+            dirty = True
+        elif key == curses.KEY_RESIZE:
+            need_full = True
+        elif key == 10 and dcs:
             show_events_data_center(stdscr, connection, dcs[current_row])
+            need_full = True
         elif key == 27:
             break
         elif key == ord('q'):
@@ -1286,6 +1932,90 @@ def show_data_centers(stdscr, connection):
 # Section 6: Clusters Section
 # =============================================================================
 
+def fetch_cluster_vm_nics(vms_service, vm):
+    """
+    Clusters 화면의 VM 표에 쓸 (NIC 이름 목록, IPv4 주소 목록) 문자열을 반환.
+    실행 중인 VM만 보고된 장치(reported devices)에서 IP를 조회하며, 실패하면 "-"를 반환.
+    """
+    try:
+        vm_service = vms_service.vm_service(vm.id)
+        nics = vm_service.nics_service().list()
+        network_names = ", ".join(nic.name for nic in nics if nic.name) if nics else "-"
+        if vm.status != VmStatus.UP:
+            return network_names, "-"
+        mac_ip_mapping = {}
+        try:
+            for device in vm_service.reported_devices_service().list() or []:
+                if device.ips:
+                    for ip in device.ips:
+                        if ip.version == IpVersion.V4:
+                            mac_ip_mapping[device.mac.address] = ip.address
+        except Exception:
+            pass
+        ips = [mac_ip_mapping[nic.mac.address] for nic in nics
+               if nic.mac and nic.mac.address in mac_ip_mapping]
+        return network_names, ", ".join(ips) if ips else "-"
+    except Exception:
+        return "-", "-"
+
+CLUSTER_VM_NICS_TTL = 15        # 실행 중인 VM의 NIC/IP 캐시 시간(초)
+CLUSTER_VM_NICS_IDLE_TTL = 60   # 실행 중이 아닌 VM은 IP 조회가 없으므로 더 오래 캐시
+
+def cached_cluster_vm_nics(vms_service, vm):
+    """
+    fetch_cluster_vm_nics 결과를 VM id와 상태별로 캐시하여 반환.
+    상태가 바뀌면 키가 달라지므로 바로 다시 조회됨.
+    """
+    ttl = CLUSTER_VM_NICS_TTL if vm.status == VmStatus.UP else CLUSTER_VM_NICS_IDLE_TTL
+    return cached(("cluster_vm_nics", vm.id, vm.status), ttl,
+                  lambda: fetch_cluster_vm_nics(vms_service, vm))
+
+CLUSTER_NETWORKS_TTL = 30  # 클러스터별 Logical Networks 조회 결과 캐시 시간(초)
+
+def get_networks_by_cluster(clusters_service, cluster_id):
+    """
+    특정 클러스터에 연결된 네트워크 정보를 SDK로 조회하여 [{name, status, description}, ...]로 반환.
+    이미 인증된 SDK 연결(연결 풀)을 그대로 사용하므로 별도의 REST 요청/인증이 필요 없음.
+    """
+    try:
+        networks = clusters_service.cluster_service(cluster_id).networks_service().list()
+    except Exception:
+        return []
+    return [{
+        'name': network.name or "-",
+        'status': getattr(network.status, 'value', None) or "-",
+        'description': network.description or "-"
+    } for network in networks]
+
+CLUSTER_LOADING = "Loading..."  # 백그라운드 조회가 끝나기 전 표시 문구
+
+def poll_cluster_screen(clusters_service, vms_service, snapshot, stop_event, wake_event, interval=0.5):
+    """
+    Clusters 화면용 백그라운드 갱신 스레드. 화면이 snapshot['request']에 기록한
+    (클러스터 id, 현재 페이지 VM 목록)에 대해 Logical Networks와 VM별 NIC/IP를 조회하여
+    snapshot에 반영하고, 값이 바뀌었으면 snapshot['version']을 올림.
+    조회는 TTL 캐시를 거치므로 interval마다 실제 API를 호출하지는 않음.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while not stop_event.is_set():
+            wake_event.clear()
+            with snapshot["lock"]:
+                request = snapshot["request"]
+            if request is not None:
+                cluster_id, page_vms = request
+                networks = cached(("cluster_networks", cluster_id), CLUSTER_NETWORKS_TTL,
+                                  lambda: get_networks_by_cluster(clusters_service, cluster_id))
+                results = executor.map(lambda vm: cached_cluster_vm_nics(vms_service, vm), page_vms)
+                nics = {vm.id: result for vm, result in zip(page_vms, results)}
+                with snapshot["lock"]:
+                    updated = snapshot["networks"].get(cluster_id) != networks
+                    updated = updated or any(snapshot["nics"].get(vm_id) != value for vm_id, value in nics.items())
+                    snapshot["networks"][cluster_id] = networks
+                    snapshot["nics"].update(nics)
+                    if updated:
+                        snapshot["version"] += 1
+            wake_event.wait(interval)
+
 def show_clusters(stdscr, connection):
     """
     Clusters 목록과 함께, 선택한 클러스터에 속한 Logical Networks, Hosts, Virtual Machines 목록을 표시.
@@ -1306,6 +2036,17 @@ def show_clusters(stdscr, connection):
         stdscr.getch()
         return
         
+    # 호스트 주소의 DNS 조회를 미리 병렬로 수행해 첫 화면부터 캐시를 사용
+    host_addresses = {h.address for h in hosts if getattr(h, "address", None)}
+    if host_addresses:
+        with ThreadPoolExecutor(max_workers=min(16, len(host_addresses))) as executor:
+            list(executor.map(resolve_host_ip, host_addresses))
+
+    # 클러스터별 호스트/VM 수와 호스트별 VM 수를 한 번씩만 순회해 집계
+    hosts_by_cluster = Counter(h.cluster.id for h in hosts if h.cluster)
+    vms_by_cluster = Counter(vm.cluster.id for vm in all_vms if vm.cluster)
+    vms_by_host = Counter(vm.host.id for vm in all_vms if vm.host)
+
     # Build clusters_info (Cluster List)
     clusters_info = []
     for cluster in clusters:
@@ -1330,192 +2071,156 @@ def show_clusters(stdscr, connection):
         except Exception:
             cpu_type = "N/A"
 
-        hosts_count = sum(1 for h in hosts if h.cluster and h.cluster.id == cluster.id)
-        vm_count = sum(1 for vm in all_vms if vm.cluster and vm.cluster.id == cluster.id)
+        hosts_count = hosts_by_cluster[cluster.id]
+        vm_count = vms_by_cluster[cluster.id]
         clusters_info.append((cluster, [cluster_name, data_center, cpu_type, str(hosts_count), str(vm_count)]))
     
+    # 네트워크/NIC 조회는 백그라운드 스레드가 담당하고, 화면 루프는 스냅샷만 읽어서 그림
+    snapshot = {"lock": threading.Lock(), "request": None, "networks": {}, "nics": {}, "version": 0}
+    poll_stop = threading.Event()
+    poll_wake = threading.Event()   # 선택 클러스터/페이지가 바뀌면 즉시 조회하도록 깨움
+    threading.Thread(target=poll_cluster_screen,
+                     args=(clusters_service, vms_service, snapshot, poll_stop, poll_wake),
+                     daemon=True).start()
+
     current_cluster_index = 0
     vm_page = 0
     rows_per_vm_page = 7
-    
+    prev_state = None
+    selected_cluster = None
+    total_vm_pages = 1
+
     while True:
-        stdscr.erase()
         height, width = stdscr.getmaxyx()
-        if height < 40 or width < 120:
-            stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.", curses.A_BOLD)
-            stdscr.refresh()
-            continue
+        # 선택한 클러스터/페이지/화면 크기가 그대로면 다시 그리지 않고 입력만 기다림 (REST/DNS 조회도 생략)
+        with snapshot["lock"]:
+            version = snapshot["version"]
+        # VM 표의 Uptime은 분 단위이므로 분이 바뀌면 다시 그림
+        minute = int(time.time() // 60)
+        state = (current_cluster_index, vm_page, height, width, version, minute)
+        if state != prev_state:
+            prev_state = state
+            stdscr.erase()
+            if height < 40 or width < 120:
+                stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.", curses.A_BOLD)
+                stdscr.refresh()
+                continue
               
-        stdscr.addstr(1, 1, "Cluster", curses.A_BOLD)
-        stdscr.addstr(3, 1, "- Cluster List")
-        cluster_headers = ["Cluster Name", "Data Center", "CPU Type", "Hosts Count", "VM Count"]
-        cluster_col_widths = [28, 26, 39, 11, 11]
-        def cluster_row_func(item):
-            return item[1]
-        draw_table(stdscr, 4, cluster_headers, cluster_col_widths, clusters_info, cluster_row_func, current_cluster_index)
-        cluster_table_bottom = 4 + 3 + max(len(clusters_info), 1)
-        stdscr.addstr(cluster_table_bottom + 1, 1, "")  # 공백 한 줄
-
-        if clusters_info:
-            selected_cluster = clusters_info[current_cluster_index][0]
-        else:
-            selected_cluster = None 
+            stdscr.addstr(1, 1, "Cluster", curses.A_BOLD)
+            stdscr.addstr(3, 1, "- Cluster List")
+            cluster_headers = ["Cluster Name", "Data Center", "CPU Type", "Hosts Count", "VM Count"]
+            cluster_col_widths = [28, 26, 39, 11, 11]
+            def cluster_row_func(item):
+                return item[1]
+            draw_table(stdscr, 4, cluster_headers, cluster_col_widths, clusters_info, cluster_row_func, current_cluster_index)
+            cluster_table_bottom = 4 + 3 + max(len(clusters_info), 1)
+            stdscr.addstr(cluster_table_bottom + 1, 1, "")  # 공백 한 줄
+
+            if clusters_info:
+                selected_cluster = clusters_info[current_cluster_index][0]
+            else:
+                selected_cluster = None 
 
-        # Logical Networks 테이블
-        detail_start_y = cluster_table_bottom + 2
-        stdscr.addstr(detail_start_y, 1, "- Logical Networks")
-        ln_headers = ["Name", "Status", "Description"]
-        ln_col_widths = [28, 26, 63]
+            # Logical Networks 테이블
+            detail_start_y = cluster_table_bottom + 2
+            stdscr.addstr(detail_start_y, 1, "- Logical Networks")
+            ln_headers = ["Name", "Status", "Description"]
+            ln_col_widths = [28, 26, 63]
         
-        def get_networks_by_cluster(cluster_id, url, username, password):
-            """
-            특정 클러스터의 네트워크 정보를 가져오는 함수 (REST API 요청)
-            """
-            full_url = f"{url}/clusters/{cluster_id}/networks"
-            auth = HTTPBasicAuth(username, password)
-            headers = {"Accept": "application/xml"}
+            def ln_row_func(net):
+                name = net["name"] if "name" in net and net["name"] else "-"
+                status = net["status"] if "status" in net and net["status"] else "-"
+                description = net["description"] if "description" in net and net["description"] else "-"
+                return [name, status, description]
         
-            try:
-                response = requests.get(full_url, auth=auth, headers=headers, verify=False)
-                if response.status_code == 200:
-                    root = ET.fromstring(response.text)
-                    networks = []
-                    for network in root.findall('network'):
-                        networks.append({
-                            'name': network.find('name').text if network.find('name') is not None else "-",
-                            'status': network.find('status').text if network.find('status') is not None else "-",
-                            'description': network.find('description').text if network.find('description') is not None else "-"
-                        })
-                    return networks
+            logical_networks = []
+            if selected_cluster:
+                with snapshot["lock"]:
+                    logical_networks = snapshot["networks"].get(selected_cluster.id)
+                if logical_networks is None:
+                    logical_networks = [{"name": CLUSTER_LOADING}]
+            draw_table(stdscr, detail_start_y + 1, ln_headers, ln_col_widths, logical_networks, ln_row_func, -1)
+            ln_table_height = 3 + max(len(logical_networks), 1)
+            stdscr.addstr(detail_start_y + 1 + ln_table_height + 1, 1, "")
+            # Hosts 테이블
+            hosts_start_y = detail_start_y + 1 + ln_table_height + 2
+            stdscr.addstr(hosts_start_y, 1, "- Hosts")
+            cluster_hosts = []
+            if selected_cluster:
+                cluster_hosts = [host for host in hosts if host.cluster and host.cluster.id == selected_cluster.id]
+            hosts_headers = ["Name", "IP Addresses", "Status", "Load"]
+            hosts_col_widths = [28, 26, 39, 23]
+            def host_row_func(host):
+                name = host.name if host.name else "N/A"
+                # host.address가 있으면 DNS 조회를 통해 IP 주소로 변환 시도 (실패하면 원래 값을 사용)
+                if hasattr(host, "address") and host.address:
+                    ip_addr = resolve_host_ip(host.address)
                 else:
-                    print(f"Failed to fetch networks for cluster {cluster_id}: {response.status_code}")
-                    return []
-            except Exception as e:
-                print(f"Error fetching network data: {str(e)}")
-                return []
-        
-        def ln_row_func(net):
-            name = net["name"] if "name" in net and net["name"] else "-"
-            status = net["status"] if "status" in net and net["status"] else "-"
-            description = net["description"] if "description" in net and net["description"] else "-"
-            return [name, status, description]
-        
-        # 여기서 connection.url와 세션 정보를 이용하여 REST API 호출
-        logical_networks = []
-        if selected_cluster:
-            username_from_session = session_data["username"] if session_data and "username" in session_data else ""
-            password_from_session = session_data["password"] if session_data and "password" in session_data else ""
-            logical_networks = get_networks_by_cluster(selected_cluster.id, connection.url, username_from_session, password_from_session)
-        draw_table(stdscr, detail_start_y + 1, ln_headers, ln_col_widths, logical_networks, ln_row_func, -1)
-        ln_table_height = 3 + max(len(logical_networks), 1)
-        stdscr.addstr(detail_start_y + 1 + ln_table_height + 1, 1, "")
-        # Hosts 테이블
-        hosts_start_y = detail_start_y + 1 + ln_table_height + 2
-        stdscr.addstr(hosts_start_y, 1, "- Hosts")
-        cluster_hosts = []
-        if selected_cluster:
-            cluster_hosts = [host for host in hosts if host.cluster and host.cluster.id == selected_cluster.id]
-        hosts_headers = ["Name", "IP Addresses", "Status", "Load"]
-        hosts_col_widths = [28, 26, 39, 23]
-        def host_row_func(host):
-            name = host.name if host.name else "N/A"
-            # host.address가 있으면 DNS 조회를 통해 IP 주소로 변환 시도 (실패하면 원래 값을 사용)
-            if hasattr(host, "address") and host.address:
-                try:
-                    ip_addr = socket.gethostbyname(host.address)
-                except Exception:
-                    ip_addr = host.address
-            else:
-                ip_addr = "-"
-            status = host.status.value if hasattr(host.status, "value") and host.status else "-"
-            load_count = sum(1 for vm in all_vms if vm.host and vm.host.id == host.id)
-            load = f"{load_count} VMs" if load_count is not None else "-"
-            return [name, ip_addr, status, load]
-        draw_table(stdscr, hosts_start_y + 1, hosts_headers, hosts_col_widths, cluster_hosts, host_row_func, -1)
-        hosts_table_height = 3 + max(len(cluster_hosts), 1)
-        stdscr.addstr(hosts_start_y + 1 + hosts_table_height + 1, 1, "")
-        # Virtual Machines 테이블
-        vm_start_y = hosts_start_y + 1 + hosts_table_height + 2
-        if selected_cluster:
-            cluster_vms = [vm for vm in all_vms if vm.cluster and vm.cluster.id == selected_cluster.id]
-        else:
-            cluster_vms = []
-        total_vm_pages = max(1, (len(cluster_vms) + rows_per_vm_page - 1) // rows_per_vm_page)
-        if vm_page >= total_vm_pages:
-            vm_page = total_vm_pages - 1
-        stdscr.addstr(vm_start_y, 1, f"- Virtual Machines ({vm_page+1}/{total_vm_pages})")
-        vm_table_y = vm_start_y + 1
-        vm_headers = ["Name", "Status", "Uptime", "CPU", "Memory", "Network", "IP Addresses"]
-        vm_col_widths = [28, 13, 12, 10, 10, 24, 16]
-        start_idx = vm_page * rows_per_vm_page
-        end_idx = min(start_idx + rows_per_vm_page, len(cluster_vms))
-        vm_rows = []
-        for vm in cluster_vms[start_idx:end_idx]:
-            vm_name = vm.name if vm.name else "N/A"
-            vm_status = vm.status.value.lower() if vm.status and hasattr(vm.status, 'value') else "N/A"
-            if vm.start_time and vm_status == "up":
-                uptime_seconds = int(time.time() - vm.start_time.timestamp())
-                days = uptime_seconds // 86400
-                hours = (uptime_seconds % 86400) // 3600
-                minutes = (uptime_seconds % 3600) // 60
-                uptime = f"{days}d {hours}h {minutes}m"
-            else:
-                uptime = "-"
-            if vm.cpu and vm.cpu.topology:
-                cpu_count = vm.cpu.topology.sockets * vm.cpu.topology.cores
-                cpu_str = str(cpu_count)
-            else:
-                cpu_str = "-"
-            if vm.memory:
-                memory_mb = int(vm.memory / (1024**2))
-                memory_str = f"{memory_mb} MB"
+                    ip_addr = "-"
+                status = host.status.value if hasattr(host.status, "value") and host.status else "-"
+                load_count = vms_by_host[host.id]
+                load = f"{load_count} VMs" if load_count is not None else "-"
+                return [name, ip_addr, status, load]
+            draw_table(stdscr, hosts_start_y + 1, hosts_headers, hosts_col_widths, cluster_hosts, host_row_func, -1)
+            hosts_table_height = 3 + max(len(cluster_hosts), 1)
+            stdscr.addstr(hosts_start_y + 1 + hosts_table_height + 1, 1, "")
+            # Virtual Machines 테이블
+            vm_start_y = hosts_start_y + 1 + hosts_table_height + 2
+            if selected_cluster:
+                cluster_vms = [vm for vm in all_vms if vm.cluster and vm.cluster.id == selected_cluster.id]
             else:
-                memory_str = "-"
-            network_names = "-"
-            ip_addresses = "-"
-            try:
-                vm_service = vms_service.vm_service(vm.id)
-                nics = vm_service.nics_service().list()
-                if nics:
-                    network_names = ", ".join(nic.name for nic in nics if nic.name)
+                cluster_vms = []
+            total_vm_pages = max(1, (len(cluster_vms) + rows_per_vm_page - 1) // rows_per_vm_page)
+            if vm_page >= total_vm_pages:
+                vm_page = total_vm_pages - 1
+            stdscr.addstr(vm_start_y, 1, f"- Virtual Machines ({vm_page+1}/{total_vm_pages})")
+            vm_table_y = vm_start_y + 1
+            vm_headers = ["Name", "Status", "Uptime", "CPU", "Memory", "Network", "IP Addresses"]
+            vm_col_widths = [28, 13, 12, 10, 10, 24, 16]
+            start_idx = vm_page * rows_per_vm_page
+            end_idx = min(start_idx + rows_per_vm_page, len(cluster_vms))
+            vm_rows = []
+            page_vms = cluster_vms[start_idx:end_idx]
+            # 현재 클러스터/페이지를 백그라운드 스레드에 요청하고, 지금까지 받은 NIC/IP만 사용
+            with snapshot["lock"]:
+                request = (selected_cluster.id, tuple(page_vms)) if selected_cluster else None
+                if request != snapshot["request"]:
+                    snapshot["request"] = request
+                    poll_wake.set()
+                nic_details = {vm.id: snapshot["nics"][vm.id] for vm in page_vms if vm.id in snapshot["nics"]}
+            for vm in page_vms:
+                vm_name = vm.name if vm.name else "N/A"
+                vm_status = vm.status.value.lower() if vm.status and hasattr(vm.status, 'value') else "N/A"
+                if vm.start_time and vm_status == "up":
+                    uptime_seconds = int(time.time() - vm.start_time.timestamp())
+                    days = uptime_seconds // 86400
+                    hours = (uptime_seconds % 86400) // 3600
+                    minutes = (uptime_seconds % 3600) // 60
+                    uptime = f"{days}d {hours}h {minutes}m"
                 else:
-                    network_names = "-"
-                mac_ip_mapping = {}
-                if vm_status == "up":
-                    try:
-                        reported_devices = vm_service.reported_devices_service().list()
-                        if reported_devices:
-                            for device in reported_devices:
-                                if device.ips:
-                                    for ip in device.ips:
-                                        if ip.version == IpVersion.V4:
-                                            mac_ip_mapping[device.mac.address] = ip.address
-                    except Exception:
-                        pass
-                    ips = []
-                    for nic in nics:
-                        if nic.mac and nic.mac.address in mac_ip_mapping:
-                            ips.append(mac_ip_mapping[nic.mac.address])
-                    if ips:
-                        ip_addresses = ", ".join(ips)
-                    else:
-                        ip_addresses = "-"
+                    uptime = "-"
+                if vm.cpu and vm.cpu.topology:
+                    cpu_count = vm.cpu.topology.sockets * vm.cpu.topology.cores
+                    cpu_str = str(cpu_count)
                 else:
-                    ip_addresses = "-"
-            except Exception:
-                network_names = "-"
-                ip_addresses = "-"
-            vm_rows.append([vm_name, vm_status, uptime, cpu_str, memory_str, network_names, ip_addresses])
-        def vm_row_func(row):
-            return row
-        draw_table(stdscr, vm_table_y, vm_headers, vm_col_widths, vm_rows, vm_row_func, -1)
-        vm_table_bottom = vm_table_y + 3 + max(len(vm_rows), 1)
-        stdscr.addstr(vm_table_bottom, 1, "")
-        stdscr.addstr(vm_table_bottom + 1, 1, "N=Next page | P=Prev page", curses.A_DIM)
-        stdscr.addstr(height - 2, 1,
-                      "▲/▼=Navigate | Enter=View Events | ESC=Go back | Q=Quit",
-                      curses.color_pair(2))
-        stdscr.refresh()
+                    cpu_str = "-"
+                if vm.memory:
+                    memory_mb = int(vm.memory / (1024**2))
+                    memory_str = f"{memory_mb} MB"
+                else:
+                    memory_str = "-"
+                network_names, ip_addresses = nic_details.get(vm.id, (CLUSTER_LOADING, "-"))
+                vm_rows.append([vm_name, vm_status, uptime, cpu_str, memory_str, network_names, ip_addresses])
+            def vm_row_func(row):
+                return row
+            draw_table(stdscr, vm_table_y, vm_headers, vm_col_widths, vm_rows, vm_row_func, -1)
+            vm_table_bottom = vm_table_y + 3 + max(len(vm_rows), 1)
+            stdscr.addstr(vm_table_bottom, 1, "")
+            stdscr.addstr(vm_table_bottom + 1, 1, "N=Next page | P=Prev page", curses.A_DIM)
+            stdscr.addstr(height - 2, 1,
+                          "▲/▼=Navigate | Enter=View Events | ESC=Go back | Q=Quit",
+                          curses.color_pair(2))
+            stdscr.refresh()
         key = stdscr.getch()
         if key == -1:
             continue
@@ -1540,6 +2245,10 @@ def show_clusters(stdscr, connection):
         elif key == 10:  # 엔터 키
             if selected_cluster:
                 show_cluster_events(stdscr, connection, selected_cluster)
+                prev_state = None  # 이벤트 화면에서 돌아오면 전체를 다시 그림
+    # 백그라운드 갱신 스레드 종료
+    poll_stop.set()
+    poll_wake.set()
 # End of show_clusters
 
 def show_cluster_events(stdscr, connection, cluster):
@@ -1557,10 +2266,12 @@ def show_cluster_events(stdscr, connection, cluster):
         return
 
     event_headers = ["Time", "Severity", "Description"]
-    event_widths = [19, 9, 91]
-    header_line = "┌" + "┬".join("─" * w for w in event_widths) + "┐"
-    divider_line = "├" + "┼".join("─" * w for w in event_widths) + "┤"
-    footer_line = "└" + "┴".join("─" * w for w in event_widths) + "┘"
+    event_widths = (19, 9, 91)
+    header_line, divider_line, footer_line = _borders(event_widths)
+    # 헤더 행은 페이지와 무관하므로 루프 밖에서 한 번만 만듦
+    header_row = "│" + "│".join([truncate_with_ellipsis(h, w).ljust(w) for h, w in zip(event_headers, event_widths)]) + "│"
+    time_fmt = "%Y-%m-%d %H:%M:%S"
+    trunc = truncate_with_ellipsis  # 행 루프 안에서 전역 조회를 피하기 위한 지역 별칭
     
     try:
         events_service = connection.system_service().events_service()
@@ -1589,9 +2300,7 @@ def show_cluster_events(stdscr, connection, cluster):
             stdscr.clrtoeol()
 
         stdscr.addstr(table_start_row, 1, header_line)
-        stdscr.addstr(table_start_row + 1, 1, "│" + "│".join(
-            f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(event_headers, event_widths)
-        ) + "│")
+        stdscr.addstr(table_start_row + 1, 1, header_row)
         stdscr.addstr(table_start_row + 2, 1, divider_line)
 
         start_idx = current_page * page_size
@@ -1599,11 +2308,11 @@ def show_cluster_events(stdscr, connection, cluster):
         data_row = table_start_row + 3
 
         for event in events[start_idx:end_idx]:
-            time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
-            severity = event.severity.name.lower() if hasattr(event.severity, 'name') else "-"
+            time_str = event.time.strftime(time_fmt) if event.time else "-"
+            severity = SEVERITY_LOWER.get(event.severity, "-")
             description = event.description if event.description else "-"
             row_str = "│" + "│".join(
-                f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip([time_str, severity, description], event_widths)
+                [trunc(val, w).ljust(w) for val, w in zip((time_str, severity, description), event_widths)]
             ) + "│"
             stdscr.addstr(data_row, 1, row_str)
             data_row += 1
@@ -1647,19 +2356,46 @@ def show_hosts(stdscr, connection):
     해당 호스트에 속한 Virtual Machines 목록을 표시.
     """
     curses.curs_set(0)
-    stdscr.timeout(20)
+    stdscr.timeout(200)
     height, width = stdscr.getmaxyx()
     try:
         hosts_service = connection.system_service().hosts_service()
         vms_service = connection.system_service().vms_service()
-        all_hosts = hosts_service.list()
-        # VM 목록은 nics.reporteddevices 포함하여 한 번 가져옴.
-        all_vms = vms_service.list(follow="nics.reporteddevices")
+        # NIC 정보를 함께 가져와 IP 확인 시 호스트별 추가 요청을 피함
+        all_hosts = hosts_service.list(follow="nics")
+        # 전체 VM 목록은 개수 집계용으로 가볍게 가져옴. (nics.reporteddevices 제외)
+        all_vms = vms_service.list()
     except Exception as e:
         stdscr.addstr(2, 1, f"Failed to fetch host data: {e}")
         stdscr.refresh()
         stdscr.getch()
         return
+
+    # 선택된 호스트의 VM 상세(NIC/IP 포함)는 필요할 때만 서버 측 검색으로 가져와 TTL 동안 캐싱
+    # 이벤트 감시 스레드가 변경을 알려주므로 TTL은 안전장치 용도로만 길게 둠
+    # 호스트별 VM 인덱스 (한 번만 구성하여 개수 집계 및 조회 실패 시 대체용으로 사용)
+    vms_by_host = {}
+    for vm in all_vms:
+        if vm.host:
+            vms_by_host.setdefault(vm.host.id, []).append(vm)
+    host_vms_cache = {}        # host.id -> (조회 시각, VM 리스트)
+    host_vms_ttl = 60.0
+    event_state, event_watcher_stop = start_event_watcher(connection)
+
+    def get_host_vms(host):
+        """선택된 호스트에 속한 VM 목록을 nics.reporteddevices 포함하여 조회 (캐시 사용)"""
+        now = time.time()
+        entry = host_vms_cache.get(host.id)
+        if entry and now - entry[0] < host_vms_ttl:
+            return entry[1]
+        try:
+            # 호스트 이름에 공백/검색 구문 문자가 있어도 되도록 따옴표로 감싸고 내부 따옴표는 이스케이프
+            host_name = (host.name or "").replace('\\', '\\\\').replace('"', '\\"')
+            vms = vms_service.list(search=f'host="{host_name}"', follow="nics.reporteddevices,cluster")
+        except Exception:
+            vms = entry[1] if entry else vms_by_host.get(host.id, [])
+        host_vms_cache[host.id] = (now, vms)
+        return vms
     # HostedEngine 관련 정보 계산
     hosted_engine_vm = next((vm for vm in all_vms if vm.name == "HostedEngine"), None)
     if hosted_engine_vm:
@@ -1686,7 +2422,7 @@ def show_hosts(stdscr, connection):
         engine = get_engine_status_symbol(host, hosted_engine_host_id, hosted_engine_cluster_id)
         name = host.name if host.name else "-"
         status = host.status.value if hasattr(host, "status") and host.status else "-"
-        vm_count = sum(1 for vm in all_vms if vm.host and vm.host.id == host.id)
+        vm_count = len(vms_by_host.get(host.id, ()))
         try:
             host_service = hosts_service.host_service(host.id)
             statistics = host_service.statistics_service().list()
@@ -1738,9 +2474,9 @@ def show_hosts(stdscr, connection):
         ip = "-"
         if hasattr(host, "address") and host.address:
             ip = host.address
-        if not ip or not ip.replace(".", "").isdigit():
+        if not ip or not _IPV4_RE.match(ip):
             try:
-                nics = hosts_service.host_service(host.id).nics_service().list()
+                nics = host.nics or hosts_service.host_service(host.id).nics_service().list()
                 for nic in nics:
                     if hasattr(nic, "ip") and nic.ip and hasattr(nic.ip, "address"):
                         ip = nic.ip.address
@@ -1753,35 +2489,43 @@ def show_hosts(stdscr, connection):
     vm_page = 0
     rows_per_vm_page = 5
 
-    while True:
-        stdscr.erase()
-        height, width = stdscr.getmaxyx()
-        if height < 40 or width < 120:
-            stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.", curses.A_BOLD)
-            stdscr.refresh()
-            continue
-        stdscr.addstr(1, 1, "Hosts", curses.A_BOLD)
-        stdscr.addstr(3, 1, "- Hosts List")
-        table_y = 4
-        header_line = "┌" + "┬".join("─" * w for w in col_widths) + "┐"
-        divider_line = "├" + "┼".join("─" * w for w in col_widths) + "┤"
-        footer_line = "└" + "┴".join("─" * w for w in col_widths) + "┘"
-        stdscr.addstr(table_y, 1, header_line)
-        header_text = "│" + "│".join(f"{h:<{w}}" for h, w in zip(col_headers, col_widths)) + "│"
-        stdscr.addstr(table_y+1, 1, header_text)
-        stdscr.addstr(table_y+2, 1, divider_line)
-        for idx, row in enumerate(hosts_rows):
-            y = table_y + 3 + idx
-            row_text = "│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(row, col_widths)) + "│"
-            if idx == current_host_index:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, 1, row_text)
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(y, 1, row_text)
-        stdscr.addstr(table_y + 3 + len(hosts_rows), 1, footer_line)
+    # 표의 테두리/헤더 줄은 열 폭이 고정이므로 루프 밖에서 한 번만 조립
+    header_line, divider_line, footer_line = _borders(tuple(col_widths))
+    header_text = "│" + "│".join(f"{h:<{w}}" for h, w in zip(col_headers, col_widths)) + "│"
+    host_table_head = [header_line, header_text, divider_line]
+    # 호스트 행은 조회 시점에 완성된 문자열로 만들어 두고, 키 입력 시에는 강조 속성만 바꿈
+    hosts_prerendered = [
+        "│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(row, col_widths)) + "│"
+        for row in hosts_rows
+    ]
+    net_headers = ["Devices", "Network Name", "IP", "Mac Address", "Speed", "VLAN"]
+    net_col_widths = [20, 20, 16, 26, 18, 14]
+    net_header_line, net_divider_line, net_footer_line = _borders(tuple(net_col_widths))
+    net_table_head = [
+        net_header_line,
+        "│" + "│".join(f"{h:<{w}}" for h, w in zip(net_headers, net_col_widths)) + "│",
+        net_divider_line,
+    ]
+    net_empty_row = "│" + "│".join(f"{'-':<{w}}" for w in net_col_widths) + "│"
+    vm_headers = ["Name", "Cluster", "IP", "Hostname", "Memory", "CPU", "Status", "Uptime"]
+    vm_col_widths = [20, 20, 16, 18, 8, 8, 10, 12]
+    vm_header_line, vm_divider_line, vm_footer_line = _borders(tuple(vm_col_widths))
+    vm_table_head = [
+        vm_header_line,
+        "│" + "│".join(f"{h:<{w}}" for h, w in zip(vm_headers, vm_col_widths)) + "│",
+        vm_divider_line,
+    ]
+    vm_empty_row = "│" + "│".join(f"{'-':<{w}}" for w in vm_col_widths) + "│"
+
+    table_y = 4
+    details_y = table_y + 4 + len(hosts_rows)
+    total_vm_pages = 1
+    def draw_host_details():
+        """선택된 호스트의 상세 정보, NIC 표, VM 표를 호스트 표 아래 영역에 다시 그림"""
+        nonlocal vm_page, total_vm_pages
+        stdscr.move(details_y, 0)
+        stdscr.clrtobot()
         selected_host = all_hosts[current_host_index]
-        details_y = table_y + 4 + len(hosts_rows)
         uptime = "-"
         mem_detail = "-"
         try:
@@ -1808,7 +2552,8 @@ def show_hosts(stdscr, connection):
                 mem_detail = f"{memory_used/(1024**3):.2f}GB / {memory_total/(1024**3):.2f}GB"
         except Exception:
             pass
-        host_vms = [vm for vm in all_vms if vm.host and vm.host.id == selected_host.id]
+        # 선택된 호스트의 VM 목록은 반복마다 한 번만 구해 CPU 할당 계산과 VM 테이블에 함께 사용
+        host_vms = get_host_vms(selected_host)
         assigned_vm_cpu = 0
         for vm in host_vms:
             if hasattr(vm, "cpu") and vm.cpu and hasattr(vm.cpu, "topology") and vm.cpu.topology:
@@ -1837,8 +2582,6 @@ def show_hosts(stdscr, connection):
         stdscr.addstr(details_y+3, 1, f"WWNN: {wwnn}")
         net_y = details_y + 5
         stdscr.addstr(net_y, 1, f"- Network Interfaces for {selected_host.name}")
-        net_headers = ["Devices", "Network Name", "IP", "Mac Address", "Speed", "VLAN"]
-        net_col_widths = [20, 20, 16, 26, 18, 14]
         try:
             nics = hosts_service.host_service(selected_host.id).nics_service().list()
         except Exception:
@@ -1878,50 +2621,34 @@ def show_hosts(stdscr, connection):
                 "vlan": vlan
             })
         nics = nic_list if nic_list else []
-        net_header_line = "┌" + "┬".join("─" * w for w in net_col_widths) + "┐"
-        net_divider_line = "├" + "┼".join("─" * w for w in net_col_widths) + "┤"
-        net_footer_line = "└" + "┴".join("─" * w for w in net_col_widths) + "┘"
-        stdscr.addstr(net_y+1, 1, net_header_line)
-        stdscr.addstr(net_y+2, 1, "│" + "│".join(f"{h:<{w}}" for h, w in zip(net_headers, net_col_widths)) + "│")
-        stdscr.addstr(net_y+3, 1, net_divider_line)
-        row_y = net_y + 4
+        # NIC 표 전체를 줄 목록으로 먼저 조립한 뒤 한 번에 출력
+        net_lines = list(net_table_head)
         if not nics:
-            placeholder = ["-"] * len(net_headers)
-            stdscr.addstr(row_y, 1, "│" + "│".join(f"{p:<{w}}" for p, w in zip(placeholder, net_col_widths)) + "│")
-            row_y += 1
+            net_lines.append(net_empty_row)
         else:
             for nic in nics:
                 nic_row = [nic["devices"], nic["network_name"], nic["ip"], nic["mac_address"], nic["speed"], nic["vlan"]]
-                stdscr.addstr(row_y, 1, "│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(nic_row, net_col_widths)) + "│")
-                row_y += 1
-        stdscr.addstr(row_y, 1, net_footer_line)
+                net_lines.append("│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(nic_row, net_col_widths)) + "│")
+        net_lines.append(net_footer_line)
+        row_y = draw_lines(stdscr, net_y + 1, 1, net_lines) - 1
         vm_y = row_y + 2
-        host_vms = [vm for vm in all_vms if vm.host and vm.host.id == selected_host.id]
         total_vm_pages = max(1, (len(host_vms) + rows_per_vm_page - 1) // rows_per_vm_page)
         if vm_page >= total_vm_pages:
             vm_page = total_vm_pages - 1
         stdscr.addstr(vm_y, 1, f"- Virtual Machines for {selected_host.name} ({vm_page+1}/{total_vm_pages})")
         vm_table_y = vm_y + 1
-        vm_headers = ["Name", "Cluster", "IP", "Hostname", "Memory", "CPU", "Status", "Uptime"]
-        vm_col_widths = [20, 20, 16, 18, 8, 8, 10, 12]
-        vm_header_line = "┌" + "┬".join("─" * w for w in vm_col_widths) + "┐"
-        vm_divider_line = "├" + "┼".join("─" * w for w in vm_col_widths) + "┤"
-        vm_footer_line = "└" + "┴".join("─" * w for w in vm_col_widths) + "┘"
-        stdscr.addstr(vm_table_y, 1, vm_header_line)
-        stdscr.addstr(vm_table_y+1, 1, "│" + "│".join(f"{h:<{w}}" for h, w in zip(vm_headers, vm_col_widths)) + "│")
-        stdscr.addstr(vm_table_y+2, 1, vm_divider_line)
-        data_row = vm_table_y + 3
+        # VM 표도 줄 목록으로 조립한 뒤 한 번에 출력
+        vm_lines = list(vm_table_head)
         if not host_vms:
-            empty_row = ["-"] * len(vm_headers)
-            stdscr.addstr(data_row, 1, "│" + "│".join(f"{p:<{w}}" for p, w in zip(empty_row, vm_col_widths)) + "│")
-            data_row += 1
+            vm_lines.append(vm_empty_row)
         else:
             for vm in host_vms[vm_page * rows_per_vm_page : (vm_page+1)*rows_per_vm_page]:
                 vm_name = vm.name if vm.name else "-"
                 vm_cluster = "-"
                 if hasattr(vm, "cluster") and vm.cluster:
                     try:
-                        cluster_obj = connection.follow_link(vm.cluster)
+                        # follow=cluster로 이미 확장된 경우 추가 요청 없이 이름 사용
+                        cluster_obj = vm.cluster if vm.cluster.name else connection.follow_link(vm.cluster)
                         vm_cluster = cluster_obj.name if hasattr(cluster_obj, "name") and cluster_obj.name else "-"
                     except Exception:
                         vm_cluster = "-"
@@ -1951,14 +2678,59 @@ def show_hosts(stdscr, connection):
                     minutes = (uptime_seconds % 3600) // 60
                     uptime = f"{days}d {hours}h {minutes}m"
                 vm_row = [vm_name, vm_cluster, vm_ip, hostname, memory_str, cpu_str, vm_status, uptime]
-                stdscr.addstr(data_row, 1, "│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(vm_row, vm_col_widths)) + "│")
-                data_row += 1
-        stdscr.addstr(data_row, 1, vm_footer_line)
+                vm_lines.append("│" + "│".join(f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip(vm_row, vm_col_widths)) + "│")
+        vm_lines.append(vm_footer_line)
+        data_row = draw_lines(stdscr, vm_table_y, 1, vm_lines) - 1
         stdscr.addstr(data_row + 1, 1, "N=Next page | P=Prev page", curses.A_DIM)
         stdscr.addstr(height - 2, 1,
                       "▲/▼=Navigate Hosts List | ENTER=View Host Events | N/P=VM Page | ESC=Go back | Q=Quit",
                       curses.color_pair(2))
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+    # 화면 크기 변경/상세 화면 복귀 시에만 전체를 다시 그리고,
+    # 선택 이동·데이터 변경·분 단위 업타임 변경 시에는 호스트 표 아래 상세 영역만 다시 그림
+    redraw_all = True
+    redraw_details = True
+    drawn_minute = None
+    while True:
+        # 새 이벤트가 들어온 호스트/VM에 대해서만 캐시를 무효화
+        changed = drain_event_watcher(event_state)
+        if changed:
+            changed_hosts, changed_vms = changed
+            if changed_vms:
+                host_vms_cache.clear()
+            else:
+                for host_id in changed_hosts:
+                    host_vms_cache.pop(host_id, None)
+            redraw_details = True
+        minute = int(time.time() // 60)
+        if minute != drawn_minute:
+            drawn_minute = minute
+            redraw_details = True
+        if stdscr.getmaxyx() != (height, width):
+            height, width = stdscr.getmaxyx()
+            redraw_all = True
+        if redraw_all:
+            stdscr.erase()
+            if height < 40 or width < 120:
+                stdscr.addstr(0, 0, "Resize the terminal to at least 120x40.", curses.A_BOLD)
+                stdscr.refresh()
+                if stdscr.getch() == 27:
+                    break
+                continue
+            stdscr.addstr(1, 1, "Hosts", curses.A_BOLD)
+            stdscr.addstr(3, 1, "- Hosts List")
+            draw_lines(stdscr, table_y, 1, host_table_head)
+            for idx, row_text in enumerate(hosts_prerendered):
+                attr = curses.color_pair(1) if idx == current_host_index else curses.A_NORMAL
+                stdscr.addstr(table_y + 3 + idx, 1, row_text, attr)
+            stdscr.addstr(table_y + 3 + len(hosts_rows), 1, footer_line)
+            redraw_all = False
+            redraw_details = True
+        if redraw_details:
+            redraw_details = False
+            draw_host_details()
         key = stdscr.getch()
         if key == -1:
             continue
@@ -1966,21 +2738,28 @@ def show_hosts(stdscr, connection):
             exit(0)
         elif key == 27:
             break
-        elif key == curses.KEY_UP:
-            current_host_index = (current_host_index - 1) % len(hosts_rows)
-            vm_page = 0
-        elif key == curses.KEY_DOWN:
-            current_host_index = (current_host_index + 1) % len(hosts_rows)
+        elif key in (curses.KEY_UP, curses.KEY_DOWN):
+            # 호스트 표는 이전/새 선택 행 두 줄만 다시 그리고, 상세 영역은 새 호스트로 다시 그림
+            old_index = current_host_index
+            step = -1 if key == curses.KEY_UP else 1
+            current_host_index = (current_host_index + step) % len(hosts_rows)
             vm_page = 0
+            stdscr.addstr(table_y + 3 + old_index, 1, hosts_prerendered[old_index])
+            stdscr.addstr(table_y + 3 + current_host_index, 1, hosts_prerendered[current_host_index], curses.color_pair(1))
+            redraw_details = True
         elif key == ord('n'):
             if vm_page < total_vm_pages - 1:
                 vm_page += 1
+                redraw_details = True
         elif key == ord('p'):
             if vm_page > 0:
                 vm_page -= 1
+                redraw_details = True
         elif key == 10:
-            show_host_events(stdscr, connection, selected_host)
+            show_host_events(stdscr, connection, all_hosts[current_host_index])
+            redraw_all = True
     # end while
+    event_watcher_stop.set()
 def show_host_events(stdscr, connection, host):
     """
     선택한 호스트의 이벤트를 페이지 단위로 표시.
@@ -2040,7 +2819,7 @@ def show_host_events(stdscr, connection, host):
         # 이벤트 데이터를 페이지 단위로 출력
         for event in events[start_idx:end_idx]:
             time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
-            severity = event.severity.name.lower() if hasattr(event.severity, 'name') else "-"
+            severity = SEVERITY_LOWER.get(event.severity, "-")
             description = event.description if event.description else "-"
             row_str = "│" + "│".join(
                 f"{truncate_with_ellipsis(val, w):<{w}}" for val, w in zip([time_str, severity, description], event_widths)
@@ -2068,12 +2847,71 @@ def show_host_events(stdscr, connection, host):
 # Section 8: Networks Section
 # =============================================================================
 
+# Networks 화면 표의 고정 부분은 열 폭이 바뀌지 않으므로 모듈 로드 시 한 번만 생성
+NET_HEADERS = ["Network Name", "Data Center", "Description", "Role", "VLAN Tag", "MTU", "Port Isolation"]
+NET_WIDTHS = [22, 23, 27, 6, 8, 13, 14]
+NET_TOP, NET_HEADER, NET_SEP, NET_BOTTOM = _build_chrome(NET_WIDTHS, NET_HEADERS, " ")
+NET_ROW_FMT = _build_row_fmt(NET_WIDTHS, " ")
+NET_TRUNCS = [_make_truncator(w) for w in NET_WIDTHS]
+
+VNIC_HEADERS = ["Name", "Netowrk", "Data Center", "Network Filter", "Port Mirroring", "Passthrough", "Failover vNIC Profile"]
+VNIC_WIDTHS = [14, 13, 19, 21, 14, 11, 21]
+VNIC_TOP, VNIC_HEADER, VNIC_SEP, VNIC_BOTTOM = _build_chrome(VNIC_WIDTHS, VNIC_HEADERS, " ")
+VNIC_ROW_FMT = _build_row_fmt(VNIC_WIDTHS, " ")
+VNIC_TRUNCS = [_make_truncator(w) for w in VNIC_WIDTHS]
+
+VM_HEADERS = ["Virtual Machine Name", "Cluster", "IP Addresses", "Host Name", "vNIC Status", "vNIC"]
+VM_WIDTHS = [22, 23, 16, 21, 12, 20]
+VM_TOP, VM_HEADER, VM_SEP, VM_BOTTOM = _build_chrome(VM_WIDTHS, VM_HEADERS, " ")
+VM_ROW_FMT = _build_row_fmt(VM_WIDTHS, " ")
+VM_TRUNCS = [_make_truncator(w) for w in VM_WIDTHS]
+VM_KEYS = ["vm_name", "cluster", "ip", "host_name", "vnic_status", "vnic"]
+
+EVENT_HEADERS = ["Time", "Severity", "Description"]
+EVENT_WIDTHS = [19, 9, 91]
+EVENT_TOP, EVENT_HEADER, EVENT_SEP, EVENT_BOTTOM = _build_chrome(EVENT_WIDTHS, EVENT_HEADERS, " ")
+EVENT_ROW_FMT = _build_row_fmt(EVENT_WIDTHS, " ")
+# 이벤트 심각도 enum → 표시 문자열 (행마다 str()/split() 하지 않도록 미리 생성)
+SEVERITY_NAME = {sev: sev.name for sev in types.LogSeverity}
+SEVERITY_LOWER = {sev: sev.name.lower() for sev in types.LogSeverity}
+# 이벤트가 없을 때는 Severity/Description 열을 합쳐 한 칸으로 표시
+EVENT_EMPTY_SEP = " ├" + "─" * EVENT_WIDTHS[0] + "┴" + "─" * (EVENT_WIDTHS[1] + EVENT_WIDTHS[2] + 1) + "┤"
+EVENT_EMPTY_BOTTOM = " └" + "─" * (sum(EVENT_WIDTHS) + 2) + "┘"
+
+@lru_cache(maxsize=64)
+def network_event_pattern(network_name, network_id, network_data_center):
+    """
+    네트워크 이벤트 필터용 정규식을 컴파일하여 캐싱.
+    'network'(대소문자 무시) + 네트워크 이름 또는 ID + Data Center 이름이 모두 포함된 설명과 일치.
+    """
+    return re.compile(
+        r"(?=.*(?i:network))(?=.*(?:%s|%s))(?=.*%s)" % (
+            re.escape(network_name), re.escape(network_id), re.escape(network_data_center)),
+        re.S)
+
+def _matches_network(network_name, network_id, network_data_center):
+    """
+    이벤트 설명이 선택된 네트워크(이름 또는 ID)와 Data Center에 관한 것인지 판별하는 함수를 반환.
+    정규식 조회는 반환 시 한 번만 하므로 이벤트마다 캐시를 조회하지 않음.
+    """
+    match = network_event_pattern(network_name, network_id, network_data_center).match
+    def matches(ev):
+        description = ev.description
+        return bool(description) and match(description) is not None
+    return matches
+
 def parse_passthrough(val):
     """
     passthrough 값을 처리하여 "True" 또는 "False" 문자열을 반환.
     문자열로 변환 후 소문자로 변환 시 "true"라는 단어가 포함되어 있으면 "True"로 처리.
     """
-    return "True" if "true" in str(val).strip().lower() else "False"
+    # 대부분의 값은 bool/None이므로 문자열 변환 없이 먼저 처리
+    if val is True:
+        return "True"
+    if val is False or val is None:
+        return "False"
+    text = val if isinstance(val, str) else str(val)
+    return "True" if "true" in text.lower() else "False"
 
 def show_event_page(stdscr, connection, network):
     """
@@ -2091,33 +2929,45 @@ def show_event_page(stdscr, connection, network):
     network_id = network.get("id", "-")
     network_data_center = network.get("data_center", "-")
 
-    # 기존 이벤트를 저장할 리스트 (최대 200개까지만 유지)
-    network_events = []
+    # 기존 이벤트를 저장할 큐 (최신순, 최대 200개까지만 유지)
     MAX_EVENTS = 200  # 최대 200개의 이벤트만 유지
+    network_events = deque(maxlen=MAX_EVENTS)
+    network_event_ids = set()  # 중복 확인용 event.id 집합
+    is_network_event = _matches_network(network_name, network_id, network_data_center)
+    # 엔진 측 검색어: 따옴표와 와일드카드(*)는 이름의 일부로 검색되도록 이스케이프
+    search_name = re.sub(r'([\\"*])', r'\\\1', network_name)
+    search_error = None  # 엔진 측 검색이 실패한 이유 (실패 후에는 검색 없이 최신 이벤트만 조회)
 
     def fetch_events():
         """ 새로운 이벤트를 가져와 기존 이벤트 리스트에 추가하되, 가장 오래된 이벤트를 삭제함 """
+        nonlocal search_error
         events_service = connection.system_service().events_service()
-        new_events = events_service.list(max=100)  # 최신 100개 이벤트 가져오기
+        new_events = None
+        # 가능하면 엔진 측 검색으로 네트워크 이름이 포함된 이벤트만 받아옴
+        if search_error is None:
+            try:
+                new_events = events_service.list(search=f'message="*{search_name}*"', max=200)
+            except Exception as e:
+                search_error = str(e) or type(e).__name__
+        if new_events is None:
+            new_events = events_service.list(max=100)  # 검색 미지원 시 최신 100개 이벤트 가져오기
 
         # 필터링: 선택된 네트워크와 관련된 이벤트만 저장
-        filtered_events = [
-            ev for ev in new_events
-            if ev.description and ("network" in ev.description.lower())
-            and (network_name in ev.description or network_id in ev.description)
-            and (network_data_center in ev.description)
-        ]
+        filtered_events = [ev for ev in new_events if is_network_event(ev)]
 
-        # 기존 이벤트와 합치면서 중복 제거 (event.id 기준)
-        existing_event_ids = {ev.id for ev in network_events}
-        for event in filtered_events:
-            if event.id not in existing_event_ids:
-                network_events.append(event)
-
-        # 가장 최근 생성된 200개만 유지 (정렬 후 오래된 것 삭제)
-        network_events.sort(key=lambda x: x.time, reverse=True)  # 시간 기준 내림차순 정렬
-        if len(network_events) > MAX_EVENTS:
-            network_events[:] = network_events[:MAX_EVENTS]  # 최신 200개 유지
+        # 기존에 없던 이벤트만 골라 시간 내림차순으로 정렬 (새로 들어온 소량만 정렬)
+        new_items = [ev for ev in filtered_events if ev.id not in network_event_ids]
+        if not new_items:
+            return False
+        new_items.sort(key=lambda x: x.time, reverse=True)
+
+        # 이미 정렬된 기존 이벤트와 병합하여 최신 200개만 유지 (전체 재정렬 없음)
+        merged = list(islice(heapq.merge(new_items, network_events, key=lambda x: x.time, reverse=True), MAX_EVENTS))
+        network_events.clear()
+        network_events.extend(merged)
+        network_event_ids.clear()
+        network_event_ids.update(ev.id for ev in merged)
+        return True
 
     # 페이지네이션 설정
     MAX_ROWS = 40  # 한 페이지에 표시할 최대 이벤트 개수
@@ -2125,140 +2975,19 @@ def show_event_page(stdscr, connection, network):
 
     indent = " "  # 앞 공백 한 칸 유지
 
-    def draw_event_page():
-        """ 이벤트 페이지를 다시 그리는 함수 """
-        event_win.erase()
-        total_events = len(network_events)
-        max_page = max(1, (total_events + MAX_ROWS - 1) // MAX_ROWS)
-
-        title = indent + f"- Event Page for {network_name} (Data Center: {network_data_center}) ({current_page}/{max_page})"
-        event_win.addstr(1, 0, title)
-
-        # 테이블 헤더
-        event_headers = ["Time", "Severity", "Description"]
-        event_widths = [19, 9, 91]
-
-        if total_events == 0:
-            header_line = indent + "┌" + "─" * event_widths[0] + "┬" + "─" * event_widths[1] + "┬" + "─" * event_widths[2] + "┐"
-            event_win.addstr(3, 0, header_line)
-            
-            event_win.addstr(4, 0, indent + "│" + f"{event_headers[0]:<{event_widths[0]}}" + "│" + 
-                             f"{event_headers[1]:<{event_widths[1]}}" + "│" + 
-                             f"{event_headers[2]:<{event_widths[2]}}" + "│")
-        
-            divider_line = indent + "├" + "─" * event_widths[0] + "┴" + "─" * (event_widths[1] + event_widths[2] + 1) + "┤"
-            event_win.addstr(5, 0, divider_line)
-        
-            event_win.addstr(6, 0, indent + "│" + " No events found for this network.".ljust(sum(event_widths) + 2) + "│")
-        
-            # Footer 부분: divider_line과 정확히 정렬되도록 수정
-            footer_line = indent + "└" + "─" * event_widths[0] + "┴" + "─" * (event_widths[1] + event_widths[2] + 1) + "┘"
-            event_win.addstr(7, 0, footer_line)
-
-        else:
-            header_line = indent + "┌" + "┬".join("─" * w for w in event_widths) + "┐"
-            event_win.addstr(3, 0, header_line)
-            header_row = indent + "│" + "│".join(f"{h:<{w}}" for h, w in zip(event_headers, event_widths)) + "│"
-            event_win.addstr(4, 0, header_row)
-            divider_line = indent + "├" + "┼".join("─" * w for w in event_widths) + "┤"
-            event_win.addstr(5, 0, divider_line)
-
-            start_idx = (current_page - 1) * MAX_ROWS
-            end_idx = min(start_idx + MAX_ROWS, total_events)
-
-            for i, event in enumerate(network_events[start_idx:end_idx]):
-                time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
-                severity = str(event.severity).split(".")[-1]  # ENUM 값에서 문자열 추출
-                message = event.description if event.description else "-"
-
-                row = [
-                    time_str[:event_widths[0]],
-                    severity[:event_widths[1]],
-                    message[:event_widths[2]]
-                ]
-
-                row_str = indent + "│" + "│".join(f"{col:<{w}}" for col, w in zip(row, event_widths)) + "│"
-                event_win.addstr(6 + i, 0, row_str)
-
-            bottom_line = indent + "└" + "┴".join("─" * w for w in event_widths) + "┘"
-            event_win.addstr(6 + (end_idx - start_idx), 0, bottom_line)
-
-        # 'N=Next | P=Prev' 문구 위치
-        event_win.addstr(8 if total_events == 0 else 7 + (end_idx - start_idx), 0, indent + "N=Next | P=Prev")  
-        # 하단 안내 문구
-        event_win.addstr(height - 2, 0, indent + "ESC=Go back | Q=Quit")
-
-        event_win.refresh()
-
-    fetch_events()  # 처음 실행 시 이벤트 가져오기
-    draw_event_page()  # 이벤트 출력
-
-    while True:
-        key = event_win.getch()
-        if key == 27:  # ESC 키 (뒤로가기)
-            break
-        elif key in (ord('q'), ord('Q')):  # 프로그램 종료
-            exit(0)
-        elif key in (ord('n'), ord('N')) and current_page < (len(network_events) + MAX_ROWS - 1) // MAX_ROWS:
-            current_page += 1
-            draw_event_page()
-        elif key in (ord('p'), ord('P')) and current_page > 1:
-            current_page -= 1
-            draw_event_page()
-        else:
-            fetch_events()  # 새로운 이벤트 가져오기
-            draw_event_page()  # 화면 업데이트
-            time.sleep(5)  # 5초마다 업데이트
-
-def show_event_page(stdscr, connection, network):
-    """
-    선택된 네트워크의 이벤트 페이지를 표시하며,
-    해당 네트워크 + Data Center 정보를 기반으로 필터링한 이벤트를 출력.
-    """
-    import time
-
-    height, width = stdscr.getmaxyx()
-    event_win = curses.newwin(height, width, 0, 0)
-    event_win.clear()
-
-    # 선택된 네트워크의 정보
-    network_name = network.get("name", "-")
-    network_id = network.get("id", "-")
-    network_data_center = network.get("data_center", "-")
-
-    # 기존 이벤트를 저장할 리스트 (최대 200개까지만 유지)
-    network_events = []
-    MAX_EVENTS = 200  # 최대 200개의 이벤트만 유지
-
-    def fetch_events():
-        """ 새로운 이벤트를 가져와 기존 이벤트 리스트에 추가하되, 가장 오래된 이벤트를 삭제함 """
-        events_service = connection.system_service().events_service()
-        new_events = events_service.list(max=100)  # 최신 100개 이벤트 가져오기
-
-        # 필터링: 선택된 네트워크와 관련된 이벤트만 저장
-        filtered_events = [
-            ev for ev in new_events
-            if ev.description and ("network" in ev.description.lower())
-            and (network_name in ev.description or network_id in ev.description)
-            and (network_data_center in ev.description)
-        ]
-
-        # 기존 이벤트와 합치면서 중복 제거 (event.id 기준)
-        existing_event_ids = {ev.id for ev in network_events}
-        for event in filtered_events:
-            if event.id not in existing_event_ids:
-                network_events.append(event)
-
-        # 가장 최근 생성된 200개만 유지 (정렬 후 오래된 것 삭제)
-        network_events.sort(key=lambda x: x.time, reverse=True)  # 시간 기준 내림차순 정렬
-        if len(network_events) > MAX_EVENTS:
-            network_events[:] = network_events[:MAX_EVENTS]  # 최신 200개 유지
-
-    # 페이지네이션 설정
-    MAX_ROWS = 40  # 한 페이지에 표시할 최대 이벤트 개수
-    current_page = 1
+    # 이벤트 행 전체를 오프스크린 pad에 한 번 그려두고, 페이지 이동 시에는 보이는 영역만 바꿈
+    pad_width = len(EVENT_TOP) + 1
+    event_pad = curses.newpad(MAX_EVENTS + 1, pad_width)
 
-    indent = " "  # 앞 공백 한 칸 유지
+    def render_event_pad():
+        """ 이벤트 데이터가 바뀌었을 때만 pad 내용을 다시 그리는 함수 """
+        event_pad.erase()
+        for i, event in enumerate(network_events):
+            time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
+            severity = SEVERITY_NAME.get(event.severity, "-")
+            message = event.description if event.description else "-"
+            event_pad.addstr(i, 0, EVENT_ROW_FMT.format(
+                time_str[:EVENT_WIDTHS[0]], severity[:EVENT_WIDTHS[1]], message[:EVENT_WIDTHS[2]]))
 
     def draw_event_page():
         """ 이벤트 페이지를 다시 그리는 함수 """
@@ -2269,58 +2998,43 @@ def show_event_page(stdscr, connection, network):
         title = indent + f"- Event Page for {network_name} (Data Center: {network_data_center}) ({current_page}/{max_page})"
         event_win.addstr(1, 0, title)
 
-        # 테이블 헤더
-        event_headers = ["Time", "Severity", "Description"]
-        event_widths = [19, 9, 91]
+        # 테이블 헤더 (미리 만들어 둔 EVENT_* 문자열 사용)
+        event_win.addstr(3, 0, EVENT_TOP)
+        event_win.addstr(4, 0, EVENT_HEADER)
 
         if total_events == 0:
-            header_line = indent + "┌" + "─" * event_widths[0] + "┬" + "─" * event_widths[1] + "┬" + "─" * event_widths[2] + "┐"
-            event_win.addstr(3, 0, header_line)
-            
-            event_win.addstr(4, 0, indent + "│" + f"{event_headers[0]:<{event_widths[0]}}" + "│" + 
-                             f"{event_headers[1]:<{event_widths[1]}}" + "│" + 
-                             f"{event_headers[2]:<{event_widths[2]}}" + "│")
-        
-            divider_line = indent + "├" + "─" * event_widths[0] + "┴" + "─" * (event_widths[1] + event_widths[2] + 1) + "┤"
-            event_win.addstr(5, 0, divider_line)
-        
-            event_win.addstr(6, 0, indent + "│" + " No events found for this network.".ljust(sum(event_widths) + 2) + "│")
-        
-            # Footer 부분: divider_line과 정확히 정렬되도록 수정
-            footer_line = indent + "└" + "─" * event_widths[0] + "─" + "─" * (event_widths[1] + event_widths[2] + 1) + "┘"
-            event_win.addstr(7, 0, footer_line)
+            event_win.addstr(5, 0, EVENT_EMPTY_SEP)
+            event_win.addstr(6, 0, indent + "│" + " No events found for this network.".ljust(sum(EVENT_WIDTHS) + 2) + "│")
+            event_win.addstr(7, 0, EVENT_EMPTY_BOTTOM)
         else:
-            header_line = indent + "┌" + "┬".join("─" * w for w in event_widths) + "┐"
-            event_win.addstr(3, 0, header_line)
-            event_win.addstr(4, 0, indent + "│" + "│".join(f"{h:<{w}}" for h, w in zip(event_headers, event_widths)) + "│")
-            event_win.addstr(5, 0, indent + "├" + "┼".join("─" * w for w in event_widths) + "┤")
+            event_win.addstr(5, 0, EVENT_SEP)
 
             start_idx = (current_page - 1) * MAX_ROWS
             end_idx = min(start_idx + MAX_ROWS, total_events)
 
-            for i, event in enumerate(network_events[start_idx:end_idx]):
-                time_str = event.time.strftime("%Y-%m-%d %H:%M:%S") if event.time else "-"
-                severity = str(event.severity).split(".")[-1]
-                message = event.description if event.description else "-"
-
-                row = [
-                    time_str[:event_widths[0]],
-                    severity[:event_widths[1]],
-                    message[:event_widths[2]]
-                ]
-
-                event_win.addstr(6 + i, 0, indent + "│" + "│".join(f"{col:<{w}}" for col, w in zip(row, event_widths)) + "│")
-
-            event_win.addstr(6 + (end_idx - start_idx), 0, indent + "└" + "┴".join("─" * w for w in event_widths) + "┘")
+            event_win.addstr(6 + (end_idx - start_idx), 0, EVENT_BOTTOM)
 
         event_win.addstr(8 if total_events == 0 else 7 + (end_idx - start_idx), 0, indent + "N=Next | P=Prev")  
+        if search_error is not None:
+            # 엔진 측 검색 대신 최신 이벤트만 걸러서 보여주고 있음을 알림
+            event_win.addnstr(height - 3, 0, indent + f"Event search failed, showing matches among the latest 100 events ({search_error})",
+                              width - 1, curses.color_pair(4))
         event_win.addstr(height - 2, 0, indent + "ESC=Go back | Q=Quit")
 
-        event_win.refresh()
+        event_win.noutrefresh()
+        if total_events:
+            # pad에서 현재 페이지에 해당하는 행만 화면의 표 영역(6행부터)에 표시
+            event_pad.noutrefresh(start_idx, 0, 6, 0, min(5 + end_idx - start_idx, height - 1), min(width, pad_width) - 1)
+        curses.doupdate()
 
+    REFRESH_INTERVAL = 5  # 이벤트 재조회 주기(초)
     fetch_events()  # 처음 실행 시 이벤트 가져오기
+    last_fetch = time.monotonic()
+    render_event_pad()
     draw_event_page()  # 이벤트 출력
 
+    # sleep 대신 getch 대기 시간으로 주기를 맞춰 키 입력이 막히지 않도록 함
+    event_win.timeout(REFRESH_INTERVAL * 1000)
     while True:
         key = event_win.getch()
         if key == 27:  # ESC 키 (뒤로가기)
@@ -2333,16 +3047,58 @@ def show_event_page(stdscr, connection, network):
         elif key in (ord('p'), ord('P')) and current_page > 1:
             current_page -= 1
             draw_event_page()
-        else:
-            fetch_events()  # 새로운 이벤트 가져오기
-            draw_event_page()  # 화면 업데이트
-            time.sleep(5)  # 5초마다 업데이트
-
+        elif key == -1 or time.monotonic() - last_fetch > REFRESH_INTERVAL:
+            # 주기가 지난 경우에만 새로운 이벤트 가져오기, 변경이 있을 때만 다시 그림
+            changed = fetch_events()
+            last_fetch = time.monotonic()
+            if changed:
+                render_event_pad()
+                draw_event_page()  # 화면 업데이트
+
+
+NET_TABLE_START = 4  # Networks 화면에서 네트워크 표가 시작되는 줄
+
+def network_row_text(net):
+    """네트워크 표의 한 행 문자열을 생성"""
+    mtu_raw = net.get("mtu", 1500)
+    mtu_value = "Default(1500)" if mtu_raw == 1500 else str(mtu_raw)
+    row = (
+        net.get("name", "-"),
+        net.get("data_center", "-"),
+        net.get("description", "-"),
+        str(net.get("role", "-")).lower(),
+        str(net.get("vlan_tag", "-")),
+        mtu_value,
+        str(net.get("port_isolation", "-")),
+    )
+    return NET_ROW_FMT.format(*[t(v) for t, v in zip(NET_TRUNCS, row)])
+
+def network_rows(network_info, row_cache=None):
+    """
+    네트워크 표의 행 문자열 목록(인덱스별)을 반환.
+    row_cache에 미리 만들어 둔 목록이 있으면 그대로 사용.
+    """
+    if row_cache is not None and "net" in row_cache:
+        return row_cache["net"]
+    rows = [network_row_text(net) for net in network_info]
+    if row_cache is not None:
+        row_cache["net"] = rows
+    return rows
+
+def redraw_selection(stdscr, network_info, old_idx, new_idx, row_cache=None):
+    """선택 이동 시 강조가 바뀌는 두 개의 네트워크 행만 다시 그림"""
+    rows = network_rows(network_info, row_cache)
+    for idx in (old_idx, new_idx):
+        color = curses.color_pair(1) if idx == new_idx else 0
+        try:
+            stdscr.addstr(NET_TABLE_START + 3 + idx, 0, rows[idx], color)
+        except curses.error:
+            pass
 
-def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, vnic_profiles):
+def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, profiles_by_net, row_cache=None):
+    """Networks 화면 전체를 다시 그림 (처음 진입, 화면 크기 변경, 하위 화면 복귀 시)"""
     indent = " "
     stdscr.erase()
-    height, width = stdscr.getmaxyx()
 
     # --- 상단 헤더 ---
     try:
@@ -2354,79 +3110,56 @@ def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS
         pass
 
     # --- 네트워크 테이블 ---
-    net_table_start = 4
-    net_headers = ["Network Name", "Data Center", "Description", "Role", "VLAN Tag", "MTU", "Port Isolation"]
-    net_widths = [22, 23, 27, 6, 8, 13, 14]
+    net_table_start = NET_TABLE_START
     try:
-        stdscr.addstr(net_table_start, 0, indent + "┌" + "┬".join("─" * w for w in net_widths) + "┐")
-        stdscr.addstr(net_table_start + 1, 0, indent + "│" + "│".join(f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(net_headers, net_widths)) + "│")
-        stdscr.addstr(net_table_start + 2, 0, indent + "├" + "┼".join("─" * w for w in net_widths) + "┤")
+        stdscr.addstr(net_table_start, 0, NET_TOP)
+        stdscr.addstr(net_table_start + 1, 0, NET_HEADER)
+        stdscr.addstr(net_table_start + 2, 0, NET_SEP)
     except curses.error:
         pass
-    for idx, net in enumerate(network_info):
-        mtu_raw = net.get("mtu", 1500)
-        mtu_value = "Default(1500)" if mtu_raw == 1500 else truncate_with_ellipsis(str(mtu_raw), net_widths[5])
-        row = [
-            truncate_with_ellipsis(net.get("name", "-"), net_widths[0]),
-            truncate_with_ellipsis(net.get("data_center", "-"), net_widths[1]),
-            truncate_with_ellipsis(net.get("description", "-"), net_widths[2]),
-            truncate_with_ellipsis(str(net.get("role", "-")).lower(), net_widths[3]),
-            truncate_with_ellipsis(str(net.get("vlan_tag", "-")), net_widths[4]),
-            truncate_with_ellipsis(mtu_value, net_widths[5]),
-            truncate_with_ellipsis(str(net.get("port_isolation", "-")), net_widths[6]),
-        ]
+    for idx, row_text in enumerate(network_rows(network_info, row_cache)):
         try:
             color = curses.color_pair(1) if idx == selected_network_idx else 0
-            stdscr.addstr(net_table_start + 3 + idx, 0, indent + "│" + "│".join(f"{col:<{w}}" for col, w in zip(row, net_widths)) + "│", color)
+            stdscr.addstr(net_table_start + 3 + idx, 0, row_text, color)
         except curses.error:
             pass
     try:
-        stdscr.addstr(net_table_start + 3 + len(network_info), 0, indent + "└" + "┴".join("─" * w for w in net_widths) + "┘")
+        stdscr.addstr(net_table_start + 3 + len(network_info), 0, NET_BOTTOM)
     except curses.error:
         pass
 
-    # --- VNIC Profile 테이블 ---
-    vnic_table_start = net_table_start + 3 + len(network_info) + 2
-    selected_network = network_info[selected_network_idx]
-    try:
-        stdscr.addstr(vnic_table_start, 0, indent + f"- VNIC Profile for {selected_network.get('name', '-')}" \
-                                                   f" (Data Center: {selected_network.get('data_center', '-')})")
-    except curses.error:
-        pass
-    vnic_table_start += 1
-    vnic_headers = ["Name", "Netowrk", "Data Center", "Network Filter", "Port Mirroring", "Passthrough", "Failover vNIC Profile"]
-    vnic_widths = [14, 13, 19, 21, 14, 11, 21]
+    draw_network_panels(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, profiles_by_net, row_cache)
+
+# VNIC 프로파일에서 표에 필요한 속성을 한 번에 가져오기 위한 getter
+_PROFILE_FIELDS = ("name", "network_filter", "passthrough", "port_mirroring", "failover_vnic_profile", "data_center")
+_PROFILE_GET = operator.attrgetter(*_PROFILE_FIELDS)
+
+def _profile_fields(profile):
+    """VNIC 프로파일 속성 튜플을 반환 (없는 속성이 있는 SDK 객체는 None으로 채움)"""
     try:
-        stdscr.addstr(vnic_table_start, 0, indent + "┌" + "┬".join("─" * w for w in vnic_widths) + "┐")
-        stdscr.addstr(vnic_table_start + 1, 0, indent + "│" + "│".join(f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(vnic_headers, vnic_widths)) + "│")
-        stdscr.addstr(vnic_table_start + 2, 0, indent + "├" + "┼".join("─" * w for w in vnic_widths) + "┤")
-    except curses.error:
-        pass
+        return _PROFILE_GET(profile)
+    except AttributeError:
+        return tuple(getattr(profile, field, None) for field in _PROFILE_FIELDS)
 
+def build_vnic_rows(selected_network, profiles_by_net):
+    """선택된 네트워크의 VNIC Profile 표 행 문자열 목록을 생성"""
     selected_net_id = selected_network.get("id", None)
-    vnic_profile_list = []
-    if selected_net_id:
-        for profile in vnic_profiles.values():
-            if profile.network is not None and getattr(profile.network, "id", None) == selected_net_id:
-                vnic_profile_list.append(profile)
-    if not vnic_profile_list:
-        vnic_profile_list = [None]
-    vnic_row_start = vnic_table_start + 3
-    for idx, profile in enumerate(vnic_profile_list):
+    vnic_profile_list = profiles_by_net.get(selected_net_id) or [None]
+    rows = []
+    for profile in vnic_profile_list:
         if profile is None:
-            row = ["-"] * len(vnic_headers)
+            row = ["-"] * len(VNIC_HEADERS)
         else:
-            name = getattr(profile, "name", "-") or "-"
+            name, net_filter_obj, pt_value, port_mirroring_value, failover_obj, dc_obj = _profile_fields(profile)
+            name = name or "-"
             # Netowrk 열: 무조건 선택된 네트워크의 name 사용
             network_name = selected_network.get("name", "-")
             # Data Center 열: profile.data_center가 없으면 선택된 네트워크의 data_center 사용
-            if hasattr(profile, "data_center") and getattr(profile, "data_center") is not None:
-                dc_obj = getattr(profile, "data_center")
+            if dc_obj is not None:
                 dc_name = (getattr(dc_obj, "name", None) or selected_network.get("data_center", "-"))
             else:
                 dc_name = selected_network.get("data_center", "-")
             # Network Filter 처리
-            net_filter_obj = getattr(profile, "network_filter", None)
             if net_filter_obj is None:
                 net_filter = "vdsm-no-mac-spoofing"
             elif isinstance(net_filter_obj, str):
@@ -2438,26 +3171,73 @@ def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS
             else:
                 net_filter = str(net_filter_obj)
             # passthrough 처리: parse_passthrough 사용
-            pt_value = getattr(profile, "passthrough", None)
             passthrough = parse_passthrough(pt_value)
-            port_mirroring = "True" if getattr(profile, "port_mirroring", False) else "False"
-            failover_obj = getattr(profile, "failover_vnic_profile", None)
+            port_mirroring = "True" if port_mirroring_value else "False"
             failover = getattr(failover_obj, "name", "-") if failover_obj else "-"
             row = [name, network_name, dc_name, net_filter, port_mirroring, passthrough, failover]
+        rows.append(VNIC_ROW_FMT.format(*[t(col) for t, col in zip(VNIC_TRUNCS, row)]))
+    return rows
+
+def build_vm_rows(vm_list, vm_page, MAX_VM_ROWS):
+    """VM 표에서 해당 페이지에 표시할 행 문자열 목록을 생성"""
+    start_index = (vm_page - 1) * MAX_VM_ROWS
+    vms_to_display = vm_list[start_index:start_index + MAX_VM_ROWS]
+    if not vms_to_display:
+        return [VM_ROW_FMT.format(*["-"] * len(VM_KEYS))]
+    return [VM_ROW_FMT.format(*[t(vm.get(k, "-")) for t, k in zip(VM_TRUNCS, VM_KEYS)]) for vm in vms_to_display]
+
+def draw_network_panels(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, profiles_by_net, row_cache=None):
+    """
+    네트워크 표 아래 영역(VNIC Profile, Virtual Machines, 하단 안내)만 지우고 다시 그림.
+    선택 이동이나 VM 페이지 변경 시에는 이 영역만 갱신.
+    row_cache가 주어지면 선택/페이지별로 만든 행 문자열을 재사용.
+    """
+    indent = " "
+    height, width = stdscr.getmaxyx()
+    if row_cache is None:
+        row_cache = {}
+
+    # --- VNIC Profile 테이블 ---
+    vnic_table_start = NET_TABLE_START + 3 + len(network_info) + 2
+    try:
+        stdscr.move(vnic_table_start - 1, 0)
+        stdscr.clrtobot()
+    except curses.error:
+        pass
+    selected_network = network_info[selected_network_idx]
+    try:
+        stdscr.addstr(vnic_table_start, 0, indent + f"- VNIC Profile for {selected_network.get('name', '-')}" \
+                                                   f" (Data Center: {selected_network.get('data_center', '-')})")
+    except curses.error:
+        pass
+    vnic_table_start += 1
+    try:
+        stdscr.addstr(vnic_table_start, 0, VNIC_TOP)
+        stdscr.addstr(vnic_table_start + 1, 0, VNIC_HEADER)
+        stdscr.addstr(vnic_table_start + 2, 0, VNIC_SEP)
+    except curses.error:
+        pass
+
+    vnic_key = ("vnic", selected_network_idx)
+    vnic_rows = row_cache.get(vnic_key)
+    if vnic_rows is None:
+        vnic_rows = row_cache[vnic_key] = build_vnic_rows(selected_network, profiles_by_net)
+    vnic_row_start = vnic_table_start + 3
+    for idx, row_text in enumerate(vnic_rows):
         try:
-            stdscr.addstr(vnic_row_start + idx, 0, indent + "│" + "│".join(f"{truncate_with_ellipsis(col, w):<{w}}" for col, w in zip(row, vnic_widths)) + "│")
+            stdscr.addstr(vnic_row_start + idx, 0, row_text)
         except curses.error:
             pass
     try:
-        stdscr.addstr(vnic_row_start + len(vnic_profile_list), 0, indent + "└" + "┴".join("─" * w for w in vnic_widths) + "┘")
+        stdscr.addstr(vnic_row_start + len(vnic_rows), 0, VNIC_BOTTOM)
     except curses.error:
         pass
 
     # --- Virtual Machines 테이블 ---
-    vm_table_start = vnic_row_start + len(vnic_profile_list) + 2
+    vm_table_start = vnic_row_start + len(vnic_rows) + 2
     vm_list = selected_network.get("vms", [])
     total_vms = len(vm_list)
-    max_vm_page = max(1, math.ceil(total_vms / MAX_VM_ROWS))
+    max_vm_page = max(1, -(-total_vms // MAX_VM_ROWS))
     try:
         stdscr.addstr(vm_table_start, 0, indent + f"- Virtual Machines for {selected_network.get('name', '-')}" \
                                                    f" (Data Center: {selected_network.get('data_center', '-')})" \
@@ -2466,44 +3246,26 @@ def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS
         pass
 
     vm_table_start += 1
-    vm_headers = ["Virtual Machine Name", "Cluster", "IP Addresses", "Host Name", "vNIC Status", "vNIC"]
-    vm_widths = [22, 23, 16, 21, 12, 20]
     try:
-        stdscr.addstr(vm_table_start, 0, indent + "┌" + "┬".join("─" * w for w in vm_widths) + "┐")
-        stdscr.addstr(vm_table_start + 1, 0, indent + "│" + "│".join(f"{truncate_with_ellipsis(h, w):<{w}}" for h, w in zip(vm_headers, vm_widths)) + "│")
-        stdscr.addstr(vm_table_start + 2, 0, indent + "├" + "┼".join("─" * w for w in vm_widths) + "┤")
+        stdscr.addstr(vm_table_start, 0, VM_TOP)
+        stdscr.addstr(vm_table_start + 1, 0, VM_HEADER)
+        stdscr.addstr(vm_table_start + 2, 0, VM_SEP)
     except curses.error:
         pass
 
-    start_index = (vm_page - 1) * MAX_VM_ROWS
-    end_index = start_index + MAX_VM_ROWS
-    vms_to_display = vm_list[start_index:end_index]
-    if not vms_to_display:
-        vms_to_display = [{
-            "vm_name": "-",
-            "cluster": "-",
-            "ip": "-",
-            "host_name": "-",
-            "vnic_status": "-",
-            "vnic": "-"
-        }]
+    vm_key = ("vm", selected_network_idx, vm_page)
+    vm_rows = row_cache.get(vm_key)
+    if vm_rows is None:
+        vm_rows = row_cache[vm_key] = build_vm_rows(vm_list, vm_page, MAX_VM_ROWS)
     vm_row_start = vm_table_start + 3
-    for idx, vm in enumerate(vms_to_display):
-        row = [
-            truncate_with_ellipsis(vm.get("vm_name", "-"), vm_widths[0]),
-            truncate_with_ellipsis(vm.get("cluster", "-"), vm_widths[1]),
-            truncate_with_ellipsis(vm.get("ip", "-"), vm_widths[2]),
-            truncate_with_ellipsis(vm.get("host_name", "-"), vm_widths[3]),
-            truncate_with_ellipsis(vm.get("vnic_status", "-"), vm_widths[4]),
-            truncate_with_ellipsis(vm.get("vnic", "-"), vm_widths[5])
-        ]
+    for idx, row_text in enumerate(vm_rows):
         try:
-            stdscr.addstr(vm_row_start + idx, 0, indent + "│" + "│".join(f"{col:<{w}}" for col, w in zip(row, vm_widths)) + "│")
+            stdscr.addstr(vm_row_start + idx, 0, row_text)
         except curses.error:
             pass
     try:
-        stdscr.addstr(vm_row_start + len(vms_to_display), 0, indent + "└" + "┴".join("─" * w for w in vm_widths) + "┘")
-        stdscr.addstr(vm_row_start + len(vms_to_display) + 1, 0, indent + "N=Next page | P=Prev page")
+        stdscr.addstr(vm_row_start + len(vm_rows), 0, VM_BOTTOM)
+        stdscr.addstr(vm_row_start + len(vm_rows) + 1, 0, indent + "N=Next page | P=Prev page")
     except curses.error:
         pass
 
@@ -2515,6 +3277,29 @@ def draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS
 
     stdscr.noutrefresh()
 
+def fetch_vm_nics_parallel(vms_service, vms, max_workers=16):
+    """
+    follow를 사용할 수 없을 때 VM별 NIC/보고된 장치 목록을 병렬로 조회.
+    {vm.id: nics}, {vm.id: reported_devices} 두 개의 딕셔너리를 반환하며 실패한 VM은 빈 목록.
+    """
+    def fetch_nics(vm):
+        try:
+            return vms_service.vm_service(vm.id).nics_service().list()
+        except Exception:
+            return []
+
+    def fetch_reported(vm):
+        try:
+            return vms_service.vm_service(vm.id).reported_devices_service().list()
+        except Exception:
+            return []
+
+    vm_ids = [vm.id for vm in vms]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        nics_map = dict(zip(vm_ids, executor.map(fetch_nics, vms)))
+        reported_map = dict(zip(vm_ids, executor.map(fetch_reported, vms)))
+    return nics_map, reported_map
+
 def show_networks(stdscr, connection):
     # 색상 초기화 및 curses 설정
     curses.start_color()
@@ -2531,23 +3316,58 @@ def show_networks(stdscr, connection):
     hosts_service = system_service.hosts_service()
     vnic_profiles_service = system_service.vnic_profiles_service()
 
-    # 미리 조회: 클러스터, 데이터 센터, 호스트, vNIC 프로파일 정보
-    clusters = {cluster.id: cluster.name for cluster in clusters_service.list()}
-    data_centers = {dc.id: dc.name for dc in data_centers_service.list()}
-    hosts = {host.id: host.name for host in hosts_service.list()}
-    vnic_profiles = {profile.id: profile for profile in vnic_profiles_service.list()}
+    # 미리 조회: vNIC 프로파일 정보
+    # (화면을 다시 열 때 불필요한 재조회를 피하도록 TTL 캐시 사용)
+    svc_ttl = 60
+    vnic_profiles = {profile.id: profile for profile in cached("vnic_profiles", svc_ttl, vnic_profiles_service.list)}
+    # 네트워크 ID별 vNIC 프로파일 인덱스 (화면 갱신 시 전체 프로파일을 훑지 않도록)
+    profiles_by_net = {}
+    for profile in vnic_profiles.values():
+        net_id = getattr(profile.network, "id", None) if profile.network is not None else None
+        if net_id:
+            profiles_by_net.setdefault(net_id, []).append(profile)
+
+    # 클러스터/호스트/데이터 센터 이름은 follow로 함께 받아오고,
+    # 이름이 채워지지 않은 경우에만 해당 목록을 한 번 조회하여 찾음
+    name_maps = {}
+    def lookup_name(link, key, list_fn):
+        if link is None:
+            return "-"
+        if getattr(link, "name", None):
+            return link.name
+        if key not in name_maps:
+            try:
+                name_maps[key] = {obj.id: obj.name for obj in cached(key, svc_ttl, list_fn)}
+            except Exception:
+                name_maps[key] = {}
+        return name_maps[key].get(link.id, "-")
 
-    # 네트워크 목록 조회
-    networks = networks_service.list()
+    # 네트워크 목록 조회 (데이터 센터 이름 포함)
+    def list_networks():
+        try:
+            return networks_service.list(follow="data_center")
+        except Exception:
+            return networks_service.list()
+    networks = cached("networks", svc_ttl, list_networks)
 
     # *** 최적화된 VM 정보 조회 (모든 VM을 한 번만 조회) ***
-    all_vms = vms_service.list()
+    # follow로 NIC/보고된 장치/호스트/클러스터를 한 번의 요청에 함께 받아 VM별 추가 요청(N+1)을 없앰
+    try:
+        all_vms = vms_service.list(follow="host,cluster,nics.reporteddevices")
+        followed = True
+    except Exception:
+        all_vms = vms_service.list()
+        followed = False
+        # follow 미지원 시 VM별 조회를 병렬로 수행
+        nics_map, reported_map = fetch_vm_nics_parallel(vms_service, all_vms)
     # 네트워크 ID별로 해당하는 VM 정보를 저장할 딕셔너리 (중복 VM은 vm.id 기준으로 집계)
     vm_mapping = {}  # { network_id: { vm_id: vm_detail_dict, ... }, ... }
+    ipv4 = types.IpVersion.V4
+    ip_col_width = VM_WIDTHS[VM_KEYS.index("ip")]
     for vm in all_vms:
         try:
-            vm_service = vms_service.vm_service(vm.id)
-            nics = vm_service.nics_service().list()
+            nics = (vm.nics or []) if followed else nics_map.get(vm.id, [])
+            ip_address = None  # VM당 한 번만 계산
             for nic in nics:
                 if not nic.vnic_profile:
                     continue
@@ -2560,20 +3380,31 @@ def show_networks(stdscr, connection):
                     continue
                 net_id = vnic_profile.network.id
                 # NIC에 해당하는 VM의 상세정보 구성 (IP 조회 등)
-                try:
-                    reported_devices = vm_service.reported_devices_service().list()
-                    ip_addresses = []
-                    for device in reported_devices:
-                        if device.ips:
-                            for ip in device.ips:
-                                if ip.version == types.IpVersion.V4:
-                                    ip_addresses.append(ip.address)
-                    ip_address = ", ".join(ip_addresses) if ip_addresses else "-"
-                except Exception:
-                    ip_address = "-"
+                if ip_address is None:
+                    try:
+                        if followed:
+                            # nics.reporteddevices로 확장했으므로 보고된 장치는 NIC 아래에 있음
+                            reported_devices = [device for vm_nic in nics
+                                                for device in (vm_nic.reported_devices or [])]
+                        else:
+                            reported_devices = reported_map.get(vm.id, [])
+                        # 이어 붙인 문자열이 IP 열 폭을 넘으면 어차피 잘려 보이므로 그 시점에서 수집 중단
+                        # (total은 마지막 주소 뒤의 ", "까지 센 값이므로 2를 빼서 비교해야 '..' 표시가 유지됨)
+                        ips = (ip.address for device in reported_devices if device.ips
+                               for ip in device.ips if ip.version is ipv4)
+                        ip_addresses = []
+                        total = 0
+                        for address in ips:
+                            ip_addresses.append(address)
+                            total += len(address) + 2
+                            if total - 2 > ip_col_width:
+                                break
+                        ip_address = ", ".join(ip_addresses) or "-"
+                    except Exception:
+                        ip_address = "-"
 
-                cluster_name = clusters.get(vm.cluster.id, "-") if vm.cluster else "-"
-                host_name = hosts.get(vm.host.id, "-") if (vm.status == types.VmStatus.UP and vm.host) else "-"
+                cluster_name = lookup_name(vm.cluster, "clusters", clusters_service.list)
+                host_name = lookup_name(vm.host, "hosts", hosts_service.list) if vm.status == types.VmStatus.UP else "-"
                 vnic_status = "Up" if vm.status == types.VmStatus.UP else "Down"
                 vnic_name = nic.name if nic.name else "-"
 
@@ -2600,7 +3431,7 @@ def show_networks(stdscr, connection):
     # 네트워크별 정보 구성 (각 네트워크에 해당하는 VM 정보는 vm_mapping에서 가져옴)
     network_info = []
     for net in networks:
-        data_center_name = data_centers.get(net.data_center.id, "-") if net.data_center else "-"
+        data_center_name = lookup_name(net.data_center, "data_centers", data_centers_service.list)
         aggregated_vms = list(vm_mapping.get(net.id, {}).values())
         network_info.append({
             "id": net.id,
@@ -2619,14 +3450,30 @@ def show_networks(stdscr, connection):
     vm_page = 1
     MAX_VM_ROWS = 5
 
+    # 변경된 영역만 다시 그리기 위한 상태: "full"=전체, "panels"=하단 표, None=변경 없음
+    dirty = "full"
+    last_selected = selected_network_idx
+    # 선택/페이지별 VNIC·VM 행 문자열 캐시 (network_info가 다시 만들어지지 않는 한 유효)
+    # 네트워크 표의 행은 데이터가 고정이므로 여기서 한 번에 만들어 인덱스로만 접근
+    row_cache = {"net": [network_row_text(net) for net in network_info]}
+
     while True:
         current_vm_list = network_info[selected_network_idx].get("vms", [])
-        max_vm_page = max(1, math.ceil(len(current_vm_list) / MAX_VM_ROWS))
+        max_vm_page = max(1, -(-len(current_vm_list) // MAX_VM_ROWS))
         if vm_page > max_vm_page:
             vm_page = max_vm_page
 
-        draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, vnic_profiles)
-        curses.doupdate()
+        if dirty == "full":
+            draw_screen(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, profiles_by_net, row_cache)
+        elif dirty == "panels":
+            if last_selected != selected_network_idx:
+                redraw_selection(stdscr, network_info, last_selected, selected_network_idx, row_cache)
+            draw_network_panels(stdscr, network_info, selected_network_idx, vm_page, MAX_VM_ROWS, profiles_by_net, row_cache)
+        if dirty:
+            stdscr.noutrefresh()
+            curses.doupdate()
+            last_selected = selected_network_idx
+            dirty = None
         key = stdscr.getch()
         if key == 27:
             break
@@ -2635,17 +3482,24 @@ def show_networks(stdscr, connection):
         elif key == curses.KEY_UP:
             selected_network_idx = (selected_network_idx - 1) % len(network_info)
             vm_page = 1
+            dirty = "panels"
         elif key == curses.KEY_DOWN:
             selected_network_idx = (selected_network_idx + 1) % len(network_info)
             vm_page = 1
+            dirty = "panels"
         elif key in (ord('n'), ord('N')):
             if vm_page < max_vm_page:
                 vm_page += 1
+                dirty = "panels"
         elif key in (ord('p'), ord('P')):
             if vm_page > 1:
                 vm_page -= 1
+                dirty = "panels"
         elif key in (10, 13):  # ENTER 키
             show_event_page(stdscr, connection, network_info[selected_network_idx])
+            dirty = "full"
+        elif key == curses.KEY_RESIZE:
+            dirty = "full"
         else:
             time.sleep(0.05)
 
@@ -3402,16 +4256,8 @@ def show_storage_disks(stdscr, connection):
 # Section 11: Users Section
 # =============================================================================
 # ---------------------------------------------------------------------------
-# 유틸리티 함수
+# 유틸리티 함수 (표 셀 맞춤은 Section 1의 get_display_width 사용)
 # ---------------------------------------------------------------------------
-def get_display_width(text, width):
-    """
-    지정된 폭(width)에 맞춰 문자열을 자르거나 패딩함.
-    """
-    if len(text) > width:
-        return text[:width]
-    return text.ljust(width)
-
 # SSH 연결 재활용(SSH Multiplexing) 옵션
 CONTROL_OPTS = "-o ControlMaster=auto -o ControlPath=/tmp/ssh_mux_%r@%h:%p"
 
@@ -3470,7 +4316,6 @@ def show_custom_popup(stdscr, title, message):
     """
     일반 메시지 팝업을 표시하며, 메시지 텍스트를 중앙 정렬합니다.
     """
-    import textwrap
     popup_height = 12
     popup_width = 60
     scr_height, scr_width = stdscr.getmaxyx()
@@ -3483,7 +4328,7 @@ def show_custom_popup(stdscr, title, message):
     # 제목 중앙 정렬 (굵은 글씨)
     popup.addstr(1, (popup_width - len(title)) // 2, title, curses.A_BOLD)
     # 메시지 라인들을 중앙 정렬하여 표시
-    message_lines = textwrap.wrap(message, width=popup_width - 4)
+    message_lines = wrap_text(message, popup_width - 4)
     start_line = 5
     for i, line in enumerate(message_lines):
         if start_line + i >= popup_height - 2:
@@ -3674,12 +4519,11 @@ def add_user_popup_form(stdscr, connection, refresh_users_callback):
         webadmin_url = f"{OVIRT_URL}/users/{USER_ID}"
         webadmin_data = "<user><webAdmin>true</webAdmin></user>"
         new_user_account = f"{username}@internal"
-        requests.put(
+        HTTP_SESSION.put(
             webadmin_url,
             data=webadmin_data,
             auth=HTTPBasicAuth(new_user_account, new_password),
-            headers={"Content-Type": "application/xml", "Accept": "application/xml"},
-            verify=False
+            headers={"Content-Type": "application/xml", "Accept": "application/xml"}
         )
     except Exception:
         pass
@@ -4002,7 +4846,6 @@ def show_certificates(stdscr, connection):
 # =============================================================================
 
 import curses
-import textwrap
 import time
 import threading
 from datetime import datetime
@@ -4082,7 +4925,7 @@ def show_event_detail(stdscr, event):
     detail_lines.append(f"Severity: {severity}")
     detail_lines.append("Description:")
 
-    wrapped_desc = textwrap.wrap(description, width=width - 4)
+    wrapped_desc = wrap_text(description, width - 4)
     detail_lines.extend(wrapped_desc)
     detail_lines.append("")
     detail_lines.append("Press any key to go back.")
@@ -4522,6 +5365,7 @@ if __name__ == "__main__":
     
     # 기존 세션 정보를 로드 (이미 로그인된 상태인지 확인)
     session_data = load_session()
+    connection = None  # 로그인 확인에 사용한 연결을 UI에서도 그대로 재사용
     
     # 기존 세션이 존재하고, URL이 일치하면 저장된 사용자 정보 사용
     if session_data and session_data["url"] == url:
@@ -4545,15 +5389,22 @@ if __name__ == "__main__":
                     password = getpass.getpass("Enter password: ")
                 
                 # oVirt API에 연결 시도
-                with Connection(
+                connection = Connection(
                     url=url,
                     username=username,
                     password=password,
-                    insecure=True  # SSL 검증 비활성화 (보안 이슈 주의 필요)
-                ) as connection:
-                    connection.system_service().get()  # 연결 확인
+                    insecure=True,  # SSL 검증 비활성화 (보안 이슈 주의 필요)
+                    timeout=API_TIMEOUT
+                )
+                connection.system_service().get()  # 연결 확인
                 break  # 로그인 성공 시 루프 종료
             except Exception:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                    connection = None
                 if attempt == max_attempts - 1:
                     # 로그인 실패 시 오류 메시지 출력 후 프로그램 종료
                     print(
@@ -4566,18 +5417,22 @@ if __name__ == "__main__":
         save_session(username, password, url)
     
     try:
-        # oVirt API에 다시 연결 시도
-        with Connection(
-            url=url,
-            username=username,
-            password=password,
-            insecure=True
-        ) as connection:
+        # 저장된 세션으로 시작한 경우에만 새로 연결 (로그인 직후라면 기존 연결 재사용)
+        if connection is None:
+            connection = Connection(
+                url=url,
+                username=username,
+                password=password,
+                insecure=True,
+                timeout=API_TIMEOUT
+            )
             connection.system_service().get()  # 연결 확인
-            delete_session_on_exit = True  # 종료 시 세션 삭제 여부 설정
-            
+        delete_session_on_exit = True  # 종료 시 세션 삭제 여부 설정
+        try:
             # curses 라이브러리를 사용하여 텍스트 기반 UI 실행
             curses.wrapper(main_menu, connection)
+        finally:
+            connection.close()
     except Exception as e:
         msg = str(e).lower()
         # 네트워크 관련 오류 메시지 처리
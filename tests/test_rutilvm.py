@@ -0,0 +1,87 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ovirtsdk4")
+pytest.importorskip("requests")
+pytest.importorskip("pexpect")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import rutilvm  # noqa: E402
+
+
+class FakeWindow:
+    """curses 창 대신 출력한 문자열만 기록하는 가짜 창"""
+
+    def __init__(self, height=40, width=160, keys=()):
+        self.size = (height, width)
+        self.keys = list(keys)
+        self.lines = {}
+
+    def getmaxyx(self):
+        return self.size
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else 27
+
+    def addstr(self, y, x, text, *args):
+        self.lines[y] = text
+
+    addnstr = addstr
+
+    def __getattr__(self, name):
+        # erase/refresh/noutrefresh/timeout/leaveok 등은 아무 것도 하지 않음
+        return lambda *args, **kwargs: None
+
+
+def fake_connection(vms, hosts):
+    vms_service = SimpleNamespace(list=lambda **kwargs: vms)
+    hosts_service = SimpleNamespace(list=lambda **kwargs: hosts)
+    system_service = SimpleNamespace(vms_service=lambda: vms_service,
+                                     hosts_service=lambda: hosts_service)
+    return SimpleNamespace(system_service=lambda: system_service)
+
+
+def test_vm_screen_renders_without_hosts(monkeypatch):
+    windows = []
+
+    def newwin(*args):
+        windows.append(FakeWindow())
+        return windows[-1]
+
+    monkeypatch.setattr(rutilvm, "poll_vm_screen", lambda *args: None)
+    monkeypatch.setattr(rutilvm.curses, "newwin", newwin)
+    monkeypatch.setattr(rutilvm.curses, "color_pair", lambda n: 0)
+    monkeypatch.setattr(rutilvm.curses, "doupdate", lambda: None)
+    vm = SimpleNamespace(id="vm-1", name="vm-1", status=SimpleNamespace(value="down"),
+                         host=None, start_time=None)
+    stdscr = FakeWindow(keys=[rutilvm.curses.KEY_DOWN])
+
+    rutilvm.show_virtual_machines(stdscr, fake_connection([vm], []))
+
+    assert any("HOST RESOURCE USAGE (0/0)" in text for text in stdscr.lines.values())
+
+
+def test_action_worker_drains_queue_before_sentinel(monkeypatch):
+    done = []
+    monkeypatch.setattr(rutilvm, "perform_vm_action", lambda service, vm, action: done.append((vm.id, action)))
+    action_queue = rutilvm.queue.Queue()
+    vm = SimpleNamespace(id="vm-1", name="vm-1")
+    queued_ids = {vm.id}
+    action_queue.put((vm, "start"))
+    action_queue.put(None)
+
+    rutilvm.run_vm_actions(None, action_queue, queued_ids, [], rutilvm.threading.Event())
+
+    assert done == [("vm-1", "start")]
+    assert not queued_ids
+
+
+@pytest.mark.parametrize("char, wide", [
+    ("가", True), ("\U0001F600", True), ("ꥠ", True), ("︐", True), ("\U00017000", True),
+    ("㉈", False), ("a", False), ("é", False),
+])
+def test_is_wide_follows_east_asian_width(char, wide):
+    assert rutilvm._is_wide(ord(char)) is wide